@@ -0,0 +1,9 @@
+"""
+Companion modules for the Python tutorial (python-cheat-sheet.py).
+
+The tutorial keeps its examples short and readable; the modules in this
+package hold the production-grade versions of those examples (benchmarking,
+fast algorithms, concurrency helpers, file I/O layers, ...). Submodules are
+not imported here so that `import cheatsheet` stays cheap - import the one
+you need, e.g. `from cheatsheet import bench`.
+"""
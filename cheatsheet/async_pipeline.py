@@ -0,0 +1,282 @@
+"""
+A bounded-concurrency asyncio pipeline with backpressure.
+
+The tutorial's `main()` hands every `async_worker` coroutine to
+`asyncio.gather` at once. That is fine for three coroutines; for 100,000 it
+means 100,000 live tasks, all their arguments and results held in memory, and
+no way for a producer to slow down. AsyncPipeline runs a fixed number of
+worker tasks instead:
+
+- at most `concurrency` calls run at the same time
+- items wait in a bounded window: `put()` blocks once `max_pending` items have
+  been admitted but not yet consumed, which pushes back on the producer
+- every call can have a timeout; failures and timeouts become results, they
+  do not tear the pipeline down
+- results come back as they complete, or in submission order (`ordered=True`)
+- `stats` is updated live: throughput, in-flight count, latency percentiles
+
+    async with AsyncPipeline(async_worker, concurrency=100, timeout=2.0) as pipe:
+        async for result in pipe.starmap((f"job-{i}", 0.1) for i in range(100_000)):
+            ...
+
+The event loop only ever sees `concurrency` worker tasks plus one feeder, so
+the per-item cost is a queue hand-off rather than creating a task.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+_CLOSE = object()  # Inbox sentinel: one per worker
+_DONE = object()   # Outbox sentinel: every worker has exited
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one item; exactly one of `value`/`error` is meaningful."""
+    index: int
+    item: Any
+    value: Any = None
+    error: BaseException | None = None
+    latency: float = 0.0  # Seconds spent in the worker call
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """The value, or raise the error the call ended with."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@dataclass
+class PipelineStats:
+    """Live counters; read them at any time while the pipeline runs."""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    running: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    recent_latencies: deque = field(default_factory=lambda: deque(maxlen=1024))
+
+    @property
+    def done(self) -> int:
+        return self.completed + self.failed + self.timed_out
+
+    @property
+    def in_flight(self) -> int:
+        """Admitted but not finished: queued plus running."""
+        return self.submitted - self.done
+
+    @property
+    def throughput(self) -> float:
+        """Finished items per second since the pipeline started."""
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, q: float) -> float:
+        """Latency percentile (0-100) over the most recent calls."""
+        if not self.recent_latencies:
+            return 0.0
+        ordered = sorted(self.recent_latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def format(self) -> str:
+        return (f"{self.done}/{self.submitted} done ({self.failed} failed, {self.timed_out} timed out), "
+                f"{self.running} running, {self.throughput:,.0f}/s, "
+                f"p50 {self.latency_percentile(50) * 1000:.1f} ms, "
+                f"p95 {self.latency_percentile(95) * 1000:.1f} ms")
+
+
+class AsyncPipeline:
+    """Run `worker(item)` over a stream of items with bounded concurrency.
+
+    A pipeline is single-use: enter it with `async with`, feed it with put()
+    plus close() and read results(), or use map()/starmap() which do both.
+    Results must be consumed - unconsumed results count against `max_pending`.
+    """
+
+    def __init__(self, worker: Callable[..., Awaitable[Any]], *, concurrency: int = 64,
+                 max_pending: int | None = None, timeout: float | None = None, ordered: bool = False) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        self.worker = worker
+        self.concurrency = concurrency
+        self.max_pending = max_pending or concurrency * 4
+        if self.max_pending < concurrency:
+            raise ValueError("max_pending must be at least concurrency")
+        self.timeout = timeout
+        self.ordered = ordered
+        self.stats = PipelineStats()
+        self._inbox: asyncio.Queue | None = None
+        self._outbox: asyncio.Queue | None = None
+        self._window: asyncio.Semaphore | None = None
+        self._call: Callable[[Any], Awaitable[Any]] = worker
+        self._workers: list[asyncio.Task] = []
+        self._feeder: asyncio.Task | None = None
+        self._live_workers = 0
+        self._next_index = 0
+        self._next_out = 0
+        self._reorder: dict[int, TaskResult] = {}
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncPipeline":
+        if self._workers:
+            raise RuntimeError("AsyncPipeline is single-use")
+        # Queues are created here so they bind to the running loop
+        self._inbox = asyncio.Queue()
+        self._outbox = asyncio.Queue()
+        self._window = asyncio.Semaphore(self.max_pending)
+        self.stats = PipelineStats()
+        self._live_workers = self.concurrency
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._feeder is not None:
+            self._feeder.cancel()  # The consumer may have stopped early
+        if exc_type is None:
+            await self.close()
+            await asyncio.gather(*self._workers)
+        else:
+            for task in self._workers:
+                task.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        return False
+
+    async def put(self, item: Any) -> None:
+        """Admit one item, waiting while `max_pending` items are outstanding."""
+        if self._closed:
+            raise RuntimeError("put() after close()")
+        await self._window.acquire()
+        if self._closed:  # Closed while we were waiting for room
+            self._window.release()
+            raise RuntimeError("put() after close()")
+        self.stats.submitted += 1
+        self._inbox.put_nowait((self._next_index, item))
+        self._next_index += 1
+
+    async def close(self) -> None:
+        """No more input; workers finish what is queued and then exit."""
+        if not self._closed:
+            self._closed = True
+            for _ in range(self.concurrency):
+                self._inbox.put_nowait(_CLOSE)
+
+    async def _work(self) -> None:
+        inbox, stats = self._inbox, self.stats
+        try:
+            while True:
+                entry = await inbox.get()
+                if entry is _CLOSE:
+                    break
+                index, item = entry
+                result = TaskResult(index, item)
+                stats.running += 1
+                began = time.perf_counter()
+                try:
+                    if self.timeout is None:
+                        result.value = await self._call(item)
+                    else:
+                        async with asyncio.timeout(self.timeout):
+                            result.value = await self._call(item)
+                except TimeoutError as exc:
+                    result.error = exc
+                    stats.timed_out += 1
+                except Exception as exc:
+                    result.error = exc
+                    stats.failed += 1
+                else:
+                    stats.completed += 1
+                finally:
+                    stats.running -= 1
+                result.latency = time.perf_counter() - began
+                stats.recent_latencies.append(result.latency)
+                self._deliver(result)
+        finally:
+            self._live_workers -= 1
+            if self._live_workers == 0:
+                self._outbox.put_nowait(_DONE)
+
+    def _deliver(self, result: TaskResult) -> None:
+        if not self.ordered:
+            self._outbox.put_nowait(result)
+            return
+        # Hold results back until every earlier index has been delivered
+        self._reorder[result.index] = result
+        while self._next_out in self._reorder:
+            self._outbox.put_nowait(self._reorder.pop(self._next_out))
+            self._next_out += 1
+
+    async def results(self) -> AsyncIterator[TaskResult]:
+        """Yield results until the pipeline is closed and drained."""
+        while True:
+            result = await self._outbox.get()
+            if result is _DONE:
+                return
+            self._window.release()
+            yield result
+
+    async def _feed(self, items: Iterable[Any] | AsyncIterable[Any]) -> None:
+        try:
+            if isinstance(items, AsyncIterable):
+                async for item in items:
+                    if self._closed:
+                        break
+                    await self.put(item)
+            else:
+                for item in items:
+                    if self._closed:
+                        break
+                    await self.put(item)
+        finally:
+            await self.close()
+
+    async def map(self, items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[TaskResult]:
+        """Feed `items` from a background task and yield their results."""
+        if self._feeder is not None:
+            raise RuntimeError("AsyncPipeline is single-use")
+        self._feeder = asyncio.create_task(self._feed(items))
+        async for result in self.results():
+            yield result
+        await self._feeder  # Surface errors raised by the input iterable
+
+    def starmap(self, items: Iterable[tuple] | AsyncIterable[tuple]) -> AsyncIterator[TaskResult]:
+        """Like map(), for a worker taking several arguments (`worker(*args)`)."""
+        worker = self.worker
+        self._call = lambda args: worker(*args)
+        return self.map(items)
+
+
+async def run_pipeline(worker: Callable[..., Awaitable[Any]], items: Iterable[Any], **options: Any) -> list[TaskResult]:
+    """Run every item through a fresh pipeline and collect the results."""
+    async with AsyncPipeline(worker, **options) as pipe:
+        return [result async for result in pipe.map(items)]
+
+
+async def _tick(i: int) -> int:
+    await asyncio.sleep(0)
+    return i
+
+
+async def _gather_all(n: int) -> None:
+    await asyncio.gather(*(_tick(i) for i in range(n)))
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """20k trivial I/O tasks: gather-everything versus the pipeline."""
+    n = 20_000
+    suite.add(f"asyncio.gather({n // 1000}k tasks)", lambda: asyncio.run(_gather_all(n)), group="async-pipeline")
+    for ordered in (False, True):
+        mode = "ordered" if ordered else "as completed"
+        suite.add(f"AsyncPipeline({n // 1000}k, 64 workers, {mode})",
+                  lambda ordered=ordered: asyncio.run(run_pipeline(_tick, range(n), concurrency=64, ordered=ordered)),
+                  group="async-pipeline")
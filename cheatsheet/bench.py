@@ -0,0 +1,294 @@
+"""
+Benchmark harness for the tutorial's CPU hot paths.
+
+A single `time.time()` around one call mostly measures noise. Every benchmark
+here is calibrated first (the loop count doubles until one batch runs for at
+least `min_time` seconds), warmed up, and then timed `repeats` times. Results
+report min, median and standard deviation per call, record the interpreter
+build flags (GIL, JIT), can be written as JSON and compared with a stored
+baseline so that a slowdown beyond a threshold fails the run.
+
+    suite = Suite()
+    suite.add("fib(20)", fibonacci_jit_demo, 20, group="fibonacci")
+    data = suite.fixture(lambda: list(range(10**6)))   # Built only if a selected benchmark uses it
+    suite.add("sum(1M)", sum, data, group="sum")
+    results = suite.run(report=print)
+    write_json("bench.json", results)
+    comparisons = compare(results, load_json("baseline.json"), max_regression=10.0)
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import sysconfig
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import Any, Callable
+
+
+def build_info() -> dict[str, Any]:
+    """Describe the running interpreter, including its GIL and JIT state."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+    config_args = sysconfig.get_config_var("CONFIG_ARGS") or ""
+    jit_built = "--enable-experimental-jit" in config_args
+    jit = getattr(sys, "_jit", None)  # Python 3.14+
+    if jit is not None:
+        jit_enabled = jit.is_enabled()
+    else:
+        # 3.13 JIT builds are on by default unless disabled with PYTHON_JIT=0
+        jit_enabled = jit_built and os.environ.get("PYTHON_JIT", "1") != "0"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "free_threaded_build": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "gil_enabled": is_gil_enabled() if is_gil_enabled is not None else True,
+        "jit_built": jit_built,
+        "jit_enabled": jit_enabled,
+    }
+
+
+class Fixture:
+    """Benchmark input that is built on first use.
+
+    Pass it to Suite.add() in place of an argument: setup runs once, the
+    first time a selected benchmark is timed, so registering a benchmark
+    whose group is filtered out costs nothing.
+    """
+
+    def __init__(self, setup: Callable[[], Any], cleanup: Callable[[Any], Any] | None = None) -> None:
+        self._setup = setup
+        self._cleanup = cleanup
+        self._built = False
+        self._value: Any = None
+
+    def get(self) -> Any:
+        if not self._built:
+            self._value = self._setup()
+            self._built = True
+        return self._value
+
+    def close(self) -> None:
+        if self._built:
+            value, self._value, self._built = self._value, None, False
+            if self._cleanup is not None:
+                self._cleanup(value)
+
+
+def _resolve(value: Any) -> Any:
+    return value.get() if isinstance(value, Fixture) else value
+
+
+@dataclass
+class Benchmark:
+    """A callable plus the arguments it is timed with (Fixture arguments are built first)."""
+    name: str
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    group: str = "default"
+    quiet: bool = False  # Swallow anything the function prints while timing
+
+    def time(self, loops: int) -> float:
+        """Return the wall time of `loops` back-to-back calls."""
+        func = self.func
+        args = tuple(map(_resolve, self.args))
+        kwargs = {key: _resolve(value) for key, value in self.kwargs.items()}
+        silence = contextlib.redirect_stdout(io.StringIO()) if self.quiet else contextlib.nullcontext()
+        with silence:
+            start = time.perf_counter()
+            for _ in range(loops):
+                func(*args, **kwargs)
+            return time.perf_counter() - start
+
+
+@dataclass
+class Result:
+    """Per-call timings of one benchmark, one entry per repeat."""
+    name: str
+    group: str
+    loops: int
+    times: list[float]
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "group": self.group,
+            "loops": self.loops,
+            "min": self.min,
+            "median": self.median,
+            "stdev": self.stdev,
+            "times": self.times,
+        }
+
+
+def calibrate(benchmark: Benchmark, min_time: float) -> int:
+    """Find a loop count whose batch runs for at least `min_time` seconds."""
+    loops = 1
+    while True:
+        elapsed = benchmark.time(loops)
+        if elapsed >= min_time or loops >= 1 << 30:
+            return loops
+        # Jump close to the target instead of doubling from 1 every time
+        estimate = int(loops * min_time / elapsed * 1.2) if elapsed > 0 else loops * 10
+        loops = max(loops * 2, estimate)
+
+
+class Suite:
+    """An ordered collection of benchmarks.
+
+    Benchmarks that hold resources (process pools, temporary files) register a
+    cleanup with `add_cleanup`; use the suite as a context manager, or call
+    `close()`, to release them. Expensive inputs belong in a `fixture()`,
+    which is only built when a benchmark using it is selected.
+    """
+
+    def __init__(self) -> None:
+        self.benchmarks: list[Benchmark] = []
+        self._cleanups: list[Callable[[], Any]] = []
+
+    def add_cleanup(self, func: Callable[[], Any]) -> None:
+        self._cleanups.append(func)
+
+    def fixture(self, setup: Callable[[], Any], cleanup: Callable[[Any], Any] | None = None) -> Fixture:
+        """A lazily built input; `cleanup(value)` runs on close() if it was built."""
+        fixture = Fixture(setup, cleanup)
+        self.add_cleanup(fixture.close)
+        return fixture
+
+    def close(self) -> None:
+        while self._cleanups:
+            self._cleanups.pop()()
+
+    def __enter__(self) -> "Suite":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def add(self, name: str, func: Callable[..., Any], *args: Any,
+            group: str = "default", quiet: bool = False, **kwargs: Any) -> Benchmark:
+        """Register `func(*args, **kwargs)` under a unique name."""
+        if any(b.name == name for b in self.benchmarks):
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        benchmark = Benchmark(name, func, args, kwargs, group, quiet)
+        self.benchmarks.append(benchmark)
+        return benchmark
+
+    def select(self, pattern: str | None = None) -> list[Benchmark]:
+        """Benchmarks whose name or group matches the glob `pattern`."""
+        if not pattern:
+            return list(self.benchmarks)
+        return [b for b in self.benchmarks if fnmatch(b.name, pattern) or fnmatch(b.group, pattern)]
+
+    def run(self, pattern: str | None = None, *, repeats: int = 5, warmup: int = 1,
+            min_time: float = 0.05, report: Callable[[str], Any] | None = None) -> list[Result]:
+        """Calibrate, warm up and time every selected benchmark."""
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        results = []
+        if report:
+            report(format_header())
+        for benchmark in self.select(pattern):
+            loops = calibrate(benchmark, min_time)
+            for _ in range(warmup):
+                benchmark.time(loops)
+            times = [benchmark.time(loops) / loops for _ in range(repeats)]
+            result = Result(benchmark.name, benchmark.group, loops, times)
+            results.append(result)
+            if report:
+                report(format_result(result))
+        return results
+
+
+def format_seconds(seconds: float) -> str:
+    """Render a duration with a unit that keeps it readable."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def format_header() -> str:
+    info = build_info()
+    flags = (f"GIL {'on' if info['gil_enabled'] else 'off'}, "
+             f"JIT {'on' if info['jit_enabled'] else 'off'}"
+             f"{', free-threaded build' if info['free_threaded_build'] else ''}")
+    return (f"Python {info['python']} ({flags})\n"
+            f"{'benchmark':<44} {'loops':>8} {'min':>12} {'median':>12} {'stdev':>12}")
+
+
+def format_result(result: Result) -> str:
+    return (f"{result.name:<44} {result.loops:>8} {format_seconds(result.min):>12} "
+            f"{format_seconds(result.median):>12} {format_seconds(result.stdev):>12}")
+
+
+def write_json(path: str | os.PathLike, results: list[Result]) -> None:
+    """Store results together with the build they were measured on."""
+    document = {
+        "build": build_info(),
+        "results": {result.name: result.to_dict() for result in results},
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_json(path: str | os.PathLike) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+@dataclass
+class Comparison:
+    """Median of one benchmark against its baseline."""
+    name: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change in percent; positive means slower."""
+        return (self.current - self.baseline) / self.baseline * 100.0
+
+    def __str__(self) -> str:
+        verdict = "REGRESSION" if self.regressed else "ok"
+        return (f"{self.name:<44} {format_seconds(self.baseline):>12} -> "
+                f"{format_seconds(self.current):>12} {self.change:+8.1f}%  {verdict}")
+
+
+def compare(results: list[Result], baseline: dict[str, Any], max_regression: float) -> list[Comparison]:
+    """Compare medians with a baseline document written by `write_json`.
+
+    A benchmark regresses when its median is more than `max_regression`
+    percent slower than the baseline. Benchmarks missing from the baseline
+    are skipped.
+    """
+    stored = baseline.get("results", {})
+    comparisons = []
+    for result in results:
+        if result.name not in stored:
+            continue
+        before = stored[result.name]["median"]
+        regressed = before > 0 and (result.median - before) / before * 100.0 > max_regression
+        comparisons.append(Comparison(result.name, before, result.median, regressed))
+    return comparisons
@@ -0,0 +1,19 @@
+"""
+Optional third-party packages, loaded on first use.
+
+Modules that can use an optional package call its loader instead of
+importing it at module level, so the package is only imported (and only
+needs to be installed) when a code path actually uses it.
+"""
+
+from functools import cache
+
+
+@cache
+def load_numpy():
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
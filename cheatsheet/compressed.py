@@ -0,0 +1,341 @@
+"""
+Transparent gzip/bz2/xz file access, detected from the file's magic bytes.
+
+The tutorial's file helpers only read plain text. Compressed inputs would
+have to be decompressed to disk first, which writes and reads everything a
+second time. open_file() looks at the first bytes of the file and streams it
+through gzip, bz2 or lzma instead, so callers keep using an ordinary file
+object:
+
+    with open_file("events.log.gz") as file:   # or .bz2, .xz, or plain text
+        for line in file:
+            ...
+
+All three formats allow several compressed members back to back (what
+`pigz`, `pbzip2` and `xz -T` produce). Members decompress independently, so
+parallel_decompress() finds their boundaries and decompresses them on a
+thread pool; zlib, bz2 and lzma release the GIL while they work, so threads
+run truly in parallel. write_members() writes such files, compressing the
+members in parallel as well.
+
+codec_report() measures ratio and compressed/uncompressed throughput of each
+codec on a sample of your data. Files are opened through the current storage
+(see cheatsheet.storage), so compressed files can live in memory too.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable
+
+from cheatsheet.storage import Storage, get_storage
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from cheatsheet.bench import Suite
+
+CODECS = ("gzip", "bz2", "xz")
+
+# Leading bytes of each format; bz2 also carries the block size digit 1-9
+MAGIC = {
+    "gzip": b"\x1f\x8b\x08",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+EXTENSIONS = {".gz": "gzip", ".gzip": "gzip", ".bz2": "bz2", ".xz": "xz", ".lzma": "xz"}
+
+
+class _ClosesSource:
+    """Codec file mixin: closing it also closes the storage file it wraps.
+
+    gzip, bz2 and lzma only close files they opened themselves from a path.
+    """
+    _source: IO[bytes] | None = None
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            if self._source is not None:
+                self._source.close()
+                self._source = None
+
+
+class _GzipFile(_ClosesSource, gzip.GzipFile):
+    pass
+
+
+class _BZ2File(_ClosesSource, bz2.BZ2File):
+    pass
+
+
+class _LZMAFile(_ClosesSource, lzma.LZMAFile):
+    pass
+
+
+_CODEC_FILES: dict[str, Callable[..., Any]] = {
+    "gzip": lambda source, mode, **kwargs: _GzipFile(fileobj=source, mode=mode, **kwargs),
+    "bz2": _BZ2File,
+    "xz": _LZMAFile,
+}
+
+
+def detect_codec(path: str | os.PathLike, *, storage: Storage | None = None) -> str | None:
+    """"gzip", "bz2" or "xz" from the file's magic bytes, or None for plain files."""
+    with (storage or get_storage()).open(path, "rb") as file:
+        return _codec_from_head(file.read(8))
+
+
+def _codec_from_head(head: bytes) -> str | None:
+    for codec, magic in MAGIC.items():
+        if head.startswith(magic) and (codec != "bz2" or head[3:4].isdigit()):
+            return codec
+    return None
+
+
+def codec_for_name(path: str | os.PathLike) -> str | None:
+    """Codec implied by the file extension (used when writing)."""
+    return EXTENSIONS.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def _peek(file: IO[bytes], size: int) -> bytes:
+    """The first `size` bytes, leaving the file positioned at the start."""
+    peek = getattr(file, "peek", None)
+    if peek is not None:
+        return peek(size)[:size]  # Buffered readers: no extra read call
+    head = file.read(size)
+    file.seek(0)
+    return head
+
+
+def open_file(path: str | os.PathLike, mode: str = "r", *, codec: str | None = "auto",
+              encoding: str | None = None, compresslevel: int | None = None,
+              storage: Storage | None = None) -> IO:
+    """open() that reads and writes gzip/bz2/xz transparently.
+
+    `codec="auto"` detects the codec from magic bytes when reading (plain files
+    open normally) and from the extension when writing; pass a codec name to
+    force one, or None for a plain file. Text modes work like open().
+    """
+    storage = storage or get_storage()
+    binary_mode = mode.replace("t", "").replace("b", "") + "b"
+    source = None
+    if codec == "auto":
+        if "r" in mode and "+" not in mode:
+            # One open: peek at the magic bytes, then read through the same handle
+            source = storage.open(path, "rb")
+            try:
+                codec = _codec_from_head(_peek(source, 8))
+            except BaseException:
+                source.close()
+                raise
+            if codec is None and "b" not in mode:
+                text = io.TextIOWrapper(source, encoding)
+                text.mode = mode
+                return text
+            if codec is None:
+                return source
+        else:
+            codec = codec_for_name(path)
+    if codec is None:
+        return storage.open(path, mode, encoding=encoding if "b" not in mode else None)
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r}, expected one of {CODECS}")
+    kwargs: dict[str, Any] = {}
+    if compresslevel is not None and "r" not in mode:
+        kwargs["preset" if codec == "xz" else "compresslevel"] = compresslevel
+    source = source or storage.open(path, binary_mode)
+    try:
+        file = _CODEC_FILES[codec](source, binary_mode, **kwargs)
+    except BaseException:
+        source.close()
+        raise
+    file._source = source
+    if "b" in mode:
+        return file
+    return io.TextIOWrapper(file, encoding)  # The codec files are binary; text like open()
+
+
+def _compress(codec: str, data: bytes, level: int | None) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    if codec == "bz2":
+        return bz2.compress(data, 9 if level is None else level)
+    return lzma.compress(data, preset=level)
+
+
+def _decompressor(codec: str):
+    if codec == "gzip":
+        return zlib.decompressobj(wbits=31)  # 31: expect a gzip header
+    if codec == "bz2":
+        return bz2.BZ2Decompressor()
+    return lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+
+
+def write_members(path: str | os.PathLike, chunks: Iterable[bytes], codec: str | None = None, *,
+                  level: int | None = None, workers: int | None = None) -> int:
+    """Compress each chunk as its own member, in parallel; return members written."""
+    codec = codec or codec_for_name(path)
+    if codec not in CODECS:
+        raise ValueError(f"Cannot tell the codec for {path!r}; pass one of {CODECS}")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cheatsheet.executor import usable_cpu_count
+
+    count = 0
+    with get_storage().open(path, "wb") as file, ThreadPoolExecutor(max_workers=workers or usable_cpu_count()) as pool:
+        # map() yields in submission order, so members stay in chunk order
+        for member in pool.map(lambda chunk: _compress(codec, chunk, level), chunks):
+            file.write(member)
+            count += 1
+    return count
+
+
+def member_candidates(data: bytes, codec: str) -> list[int]:
+    """Offsets where a member may start (magic bytes can also occur by chance)."""
+    magic = MAGIC[codec]
+    offsets = []
+    position = data.find(magic)
+    while position >= 0:
+        if codec != "bz2" or data[position + 3:position + 4].isdigit():
+            offsets.append(position)
+        position = data.find(magic, position + 1)
+    return offsets
+
+
+def _decompress_exact(codec: str, segment: bytes) -> bytes | None:
+    """Decompress `segment` if it is exactly one or more whole members, else None."""
+    output = []
+    while segment:
+        decompressor = _decompressor(codec)
+        try:
+            output.append(decompressor.decompress(segment))
+        except (OSError, EOFError, zlib.error, lzma.LZMAError, ValueError):
+            return None  # Started at a false magic match
+        if not decompressor.eof:
+            return None  # Cut off: the next candidate was a false match
+        segment = decompressor.unused_data
+    return b"".join(output)
+
+
+def parallel_decompress(path: str | os.PathLike, *, codec: str | None = None, workers: int | None = None,
+                        executor: "Executor | None" = None) -> bytes:
+    """Decompress a multi-member file by decompressing its members concurrently.
+
+    Candidate boundaries come from magic bytes. A segment that does not
+    decompress cleanly means a false match, so it is merged with its
+    neighbour and retried; a file with a single member is simply decompressed
+    in one piece. The whole compressed file is read into memory first, and
+    the result is returned as one bytes object; use open_file() to stream.
+    """
+    codec = codec or detect_codec(path)
+    data = get_storage().read_bytes(path)
+    if codec is None:
+        return data
+    starts = member_candidates(data, codec) or [0]
+    bounds = list(zip(starts, starts[1:] + [len(data)]))
+    own_executor = executor is None
+    if own_executor:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from cheatsheet.executor import usable_cpu_count
+
+        # More threads than CPUs only makes the decompressors fight over caches
+        executor = ThreadPoolExecutor(max_workers=workers or usable_cpu_count())
+    try:
+        results = list(executor.map(lambda b: _decompress_exact(codec, data[b[0]:b[1]]), bounds))
+    finally:
+        if own_executor:
+            executor.shutdown()
+    # A failed segment was cut short by a false match: extend it over the
+    # following segments until it decodes
+    pieces: list[bytes] = []
+    i = 0
+    while i < len(bounds):
+        if results[i] is not None:
+            pieces.append(results[i])
+            i += 1
+            continue
+        start, stop = bounds[i]
+        j = i
+        while True:
+            j += 1
+            stop = bounds[j][1] if j < len(bounds) else len(data)
+            merged = _decompress_exact(codec, data[start:stop])
+            if merged is not None or j >= len(bounds):
+                break
+        if merged is None:
+            raise ValueError(f"Corrupt {codec} data at offset {start}")
+        pieces.append(merged)
+        i = j + 1
+    return b"".join(pieces)
+
+
+def codec_report(sample: bytes, *, level: int | None = None) -> str:
+    """Ratio and throughput of every codec on `sample`.
+
+    Compressed MB/s is the rate at which the compressed file is consumed
+    (what the disk or network must deliver); uncompressed MB/s is the rate at
+    which the reader receives data.
+    """
+    lines = [f"{'codec':<6} {'ratio':>7} {'compress':>14} {'decompress':>14} {'compressed in':>15}"]
+    size = len(sample)
+    for codec in CODECS:
+        began = time.perf_counter()
+        packed = _compress(codec, sample, level)
+        pack_time = time.perf_counter() - began
+        began = time.perf_counter()
+        _decompress_exact(codec, packed)
+        unpack_time = time.perf_counter() - began
+        lines.append(f"{codec:<6} {size / len(packed):>6.1f}x {size / pack_time / 1e6:>9.1f} MB/s "
+                     f"{size / unpack_time / 1e6:>9.1f} MB/s {len(packed) / unpack_time / 1e6:>10.1f} MB/s")
+    return "\n".join(lines)
+
+
+def sample_log(size: int) -> bytes:
+    """Repetitive log text, roughly as compressible as real logs."""
+    lines = []
+    total = 0
+    i = 0
+    while total < size:
+        line = f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d} INFO /api/orders/{i * 7919 % 100_000} {i % 250} ms\n"
+        lines.append(line)
+        total += len(line)
+        i += 1
+    return "".join(lines).encode()
+
+
+def _read_all(path: str) -> int:
+    with open_file(path, "rb") as file:
+        return len(file.read())
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Reading 16 MB of log through each codec, and gzip members in parallel."""
+    written = (("gzip", ".gz"), ("bz2", ".bz2"), ("xz", ".xz"))
+
+    def setup() -> str:
+        plain = os.path.join(tempfile.mkdtemp(prefix="cheatsheet-compressed-"), "sample.log")
+        data = sample_log(16 * 1024 * 1024)
+        with open(plain, "wb") as file:
+            file.write(data)
+        chunks = [data[i:i + 1024 * 1024] for i in range(0, len(data), 1024 * 1024)]
+        for codec, extension in written:
+            write_members(plain + extension, chunks, codec, level=1 if codec == "xz" else None)
+        return plain
+
+    plain = suite.fixture(setup, lambda plain: shutil.rmtree(os.path.dirname(plain), ignore_errors=True))
+    suite.add("read plain (16 MB)", _read_all, plain, group="compressed")
+    for codec, extension in written:
+        suite.add(f"read {codec} stream (16 MB)", lambda plain, extension=extension: _read_all(plain + extension),
+                  plain, group="compressed")
+        suite.add(f"parallel_decompress {codec} (16 x 1 MB)",
+                  lambda plain, extension=extension: parallel_decompress(plain + extension), plain, group="compressed")
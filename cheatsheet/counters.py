@@ -0,0 +1,207 @@
+"""
+Thread-safe counters that do not serialize every increment on one lock.
+
+The tutorial's `increment_counter` takes the single `counter_lock` for every
+increment, so all threads queue up behind it no matter how many cores there
+are. Request counters under heavy load need something better:
+
+- LockedCounter:  the tutorial pattern, one lock around every update (baseline)
+- StripedCounter: N independent lock-protected stripes; each thread is given
+                  a stripe round-robin on its first add(), so up to N threads
+                  never share a lock
+- ShardedCounter: every thread accumulates into its own shard without any
+                  lock; a shard is flushed into the shared total every
+                  `flush_every` adds, when its thread exits, or on flush(), and
+                  value() sums the total plus the live shards
+
+All three give an exact value() once the writers are done; while writers are
+running, value() is a consistent snapshot for LockedCounter/StripedCounter and
+a sum of recent per-shard values for ShardedCounter.
+"""
+
+import itertools
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+
+class LockedCounter:
+    """One lock around every update, like the tutorial's counter_lock."""
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def add(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+
+class StripedCounter:
+    """A counter split over `stripes` lock-protected cells."""
+
+    def __init__(self, stripes: int = 16) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be positive")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes
+        self._local = threading.local()
+        self._next = itertools.count()
+        self._assign_lock = threading.Lock()  # next() on a count is not atomic on free-threaded builds
+
+    def _stripe(self) -> int:
+        """The calling thread's stripe, handed out round-robin on first use."""
+        try:
+            return self._local.stripe
+        except AttributeError:
+            with self._assign_lock:
+                stripe = next(self._next) % len(self._locks)
+            self._local.stripe = stripe
+            return stripe
+
+    def add(self, amount: int = 1) -> None:
+        i = self._stripe()
+        with self._locks[i]:
+            self._counts[i] += amount
+
+    def value(self) -> int:
+        """Exact total: hold every stripe lock while summing."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return sum(self._counts)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+
+class _Shard:
+    """A thread's private cell: [count, adds left before the next flush], written only by its owner."""
+
+    __slots__ = ("cell", "__weakref__")
+
+    def __init__(self, flush_every: int) -> None:
+        self.cell = [0, flush_every]
+
+
+class ShardedCounter:
+    """Per-thread shards with no lock on the increment path."""
+
+    def __init__(self, flush_every: int | None = 10_000) -> None:
+        if flush_every is not None and flush_every < 1:
+            raise ValueError("flush_every must be positive (or None to only flush on exit)")
+        self.flush_every = flush_every
+        self._local = threading.local()
+        self._lock = threading.Lock()   # Guards the shard registry and the flushed total
+        self._cells: dict[int, list[int]] = {}
+        self._flushed = 0
+
+    def _new_shard(self) -> _Shard:
+        # A countdown of -1 never reaches zero, so flush_every=None never flushes in add()
+        shard = _Shard(self.flush_every or -1)
+        key = id(shard.cell)
+        with self._lock:
+            self._cells[key] = shard.cell
+        # thread-local data dies with its thread; fold the shard in at that point
+        weakref.finalize(shard, _retire_shard, weakref.ref(self), key)
+        self._local.shard = shard
+        return shard
+
+    def _retire(self, key: int) -> None:
+        with self._lock:
+            cell = self._cells.pop(key, None)
+            if cell is not None:
+                self._flushed += cell[0]
+
+    def add(self, amount: int = 1) -> None:
+        try:
+            cell = self._local.shard.cell
+        except AttributeError:
+            cell = self._new_shard().cell
+        cell[0] += amount  # Single writer per cell, so no lock is needed
+        cell[1] -= 1
+        if not cell[1]:
+            # Periodic flush keeps the shared total recent for long-lived threads
+            self._flush_cell(cell)
+
+    def _flush_cell(self, cell: list[int]) -> None:
+        with self._lock:
+            amount, cell[0] = cell[0], 0
+            self._flushed += amount
+        cell[1] = self.flush_every or -1
+
+    def flush(self) -> None:
+        """Move the calling thread's shard into the shared total."""
+        shard = getattr(self._local, "shard", None)
+        if shard is not None:
+            self._flush_cell(shard.cell)
+
+    def value(self) -> int:
+        with self._lock:
+            return self._flushed + sum(cell[0] for cell in self._cells.values())
+
+
+def _retire_shard(counter_ref: "weakref.ref[ShardedCounter]", key: int) -> None:
+    # Holds the counter weakly so finalizers do not keep it alive
+    counter = counter_ref()
+    if counter is not None:
+        counter._retire(key)
+
+
+COUNTERS: dict[str, Callable[[], object]] = {
+    "locked": LockedCounter,
+    "striped": StripedCounter,
+    "sharded": ShardedCounter,
+}
+
+
+def hammer(counter, threads: int, increments: int) -> float:
+    """Run `threads` threads doing `increments` add(1) calls each; return seconds."""
+    start_barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        add = counter.add
+        start_barrier.wait()
+        for _ in range(increments):
+            add(1)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_barrier.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+    if counter.value() != threads * increments:
+        raise AssertionError(f"{type(counter).__name__} lost updates")
+    return elapsed
+
+
+def scaling_table(thread_counts=(1, 2, 4, 8, 16, 32), increments: int = 20_000) -> str:
+    """Million increments per second for each counter and thread count."""
+    lines = [f"{'threads':>7} " + " ".join(f"{name:>10}" for name in COUNTERS)]
+    for threads in thread_counts:
+        rates = []
+        for factory in COUNTERS.values():
+            seconds = hammer(factory(), threads, increments)
+            rates.append(threads * increments / seconds / 1e6)
+        lines.append(f"{threads:>7} " + " ".join(f"{rate:>8.2f} M" for rate in rates))
+    return "\n".join(lines)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Same per-thread load from 1 to 32 threads (weak scaling)."""
+    for threads in (1, 2, 4, 8, 16, 32):
+        for name, factory in COUNTERS.items():
+            suite.add(f"{name} counter, {threads} threads x 10k",
+                      lambda factory=factory, threads=threads: hammer(factory(), threads, 10_000),
+                      group="counters")
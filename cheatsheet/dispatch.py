@@ -0,0 +1,210 @@
+"""
+Type-keyed dispatch for `match`-style classification of many objects.
+
+The 3.10 section's `describe_shape` runs its `match` cascade top to bottom
+on every call: a Rectangle is first tested against both Point patterns and
+both Circle patterns. TypeDispatcher takes the same cases as an ordered
+list of (class, guard, handler). The first time it sees a concrete type it
+keeps only the cases whose class matches that type (in order, stopping at
+the first case without a guard) and caches them, compiled into a single
+function. Later calls cost one dict lookup plus that type's own guards:
+
+    describe = TypeDispatcher(default=lambda shape: "Unknown shape")
+    describe.register(Point, lambda p: "Point at origin", guard=lambda p: p.x == 0 and p.y == 0)
+    describe.register(Point, lambda p: f"Point at ({p.x}, {p.y})")
+    describe(Point(1, 2))                      # "Point at (1, 2)"
+    describe.describe_many(shapes)             # Grouped by type, results in input order
+
+Classes match like class patterns do, by isinstance(), so subclasses use
+their base class's cases. register() clears the cache. Virtual subclasses
+registered on an ABC after a type was first seen are not picked up;
+call clear() after registering them.
+
+shape_describer() builds the dispatcher equivalent of describe_shape.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+Handler = Callable[[Any], Any]
+Guard = Callable[[Any], bool]
+
+
+class TypeDispatcher:
+    """Ordered (class, guard, handler) cases, looked up per concrete type."""
+
+    def __init__(self, default: Handler | None = None) -> None:
+        self.default = default
+        self._cases: list[tuple[type, Guard | None, Handler]] = []
+        self._table: dict[type, Handler] = {}
+
+    def register(self, cls: type, handler: Handler, guard: Guard | None = None) -> Handler:
+        """Add a case after the existing ones: `handler(obj)` if obj is a `cls` and `guard(obj)` is true."""
+        self._cases.append((cls, guard, handler))
+        self._table.clear()
+        return handler
+
+    def case(self, cls: type, guard: Guard | None = None) -> Callable[[Handler], Handler]:
+        """Decorator form of register()."""
+        return lambda handler: self.register(cls, handler, guard)
+
+    def clear(self) -> None:
+        """Forget the per-type tables (they are rebuilt on next use)."""
+        self._table.clear()
+
+    def _no_match(self, obj: Any) -> Any:
+        if self.default is None:
+            raise TypeError(f"No case matches {type(obj).__name__} object {obj!r}")
+        return self.default(obj)
+
+    def _compile(self, cls: type) -> Handler:
+        bucket: list[tuple[Guard | None, Handler]] = []
+        for case_cls, guard, handler in self._cases:
+            if issubclass(cls, case_cls):
+                bucket.append((guard, handler))
+                if guard is None:
+                    break  # Later cases for this type can never run
+        if bucket and bucket[0][0] is None:
+            return bucket[0][1]  # An unconditional case: the handler itself
+        if not bucket:
+            return self._no_match
+        cases = tuple(bucket)
+        no_match = self._no_match
+
+        def dispatch(obj: Any) -> Any:
+            for guard, handler in cases:
+                if guard is None or guard(obj):
+                    return handler(obj)
+            return no_match(obj)
+
+        return dispatch
+
+    def lookup(self, cls: type) -> Handler:
+        """The compiled function for instances of `cls`, cached."""
+        handler = self._table.get(cls)
+        if handler is None:
+            handler = self._table[cls] = self._compile(cls)
+        return handler
+
+    def __call__(self, obj: Any) -> Any:
+        handler = self._table.get(type(obj))
+        if handler is None:
+            handler = self.lookup(type(obj))
+        return handler(obj)
+
+    def describe_many(self, objects: Iterable[Any]) -> list[Any]:
+        """Results for every object in input order, dispatched one type group at a time."""
+        objects = objects if isinstance(objects, (list, tuple)) else list(objects)
+        groups: dict[type, list[int]] = {}
+        for i, cls in enumerate(map(type, objects)):
+            group = groups.get(cls)
+            if group is None:
+                groups[cls] = [i]
+            else:
+                group.append(i)
+        if len(groups) == 1:
+            return list(map(self.lookup(type(objects[0])), objects))
+        results: list[Any] = [None] * len(objects)
+        for cls, indexes in groups.items():
+            # map() over each group runs the type's handler with no per-item lookup
+            values = map(self.lookup(cls), map(objects.__getitem__, indexes))
+            deque(map(results.__setitem__, indexes, values), maxlen=0)
+        return results
+
+
+def shape_describer(point: type, circle: type, rectangle: type) -> TypeDispatcher:
+    """The dispatcher form of the 3.10 section's describe_shape, for its Point, Circle and Rectangle."""
+    def at_origin(p: Any) -> bool:
+        return isinstance(p, point) and p.x == 0 and p.y == 0
+
+    def corners(r: Any) -> bool:
+        return isinstance(r.top_left, point) and isinstance(r.bottom_right, point)
+
+    describe = TypeDispatcher(default=lambda shape: "Unknown shape")
+    describe.register(point, lambda p: "Point at origin", guard=at_origin)
+    describe.register(point, lambda p: f"Point at ({p.x}, {p.y})")
+    describe.register(circle, lambda c: f"Circle at origin with radius {c.radius}",
+                      guard=lambda c: at_origin(c.center))
+    describe.register(circle, lambda c: f"Circle at ({c.center.x}, {c.center.y}) with radius {c.radius}")
+    describe.register(rectangle, lambda r: f"Rectangle from ({r.top_left.x}, {r.top_left.y}) to "
+                                           f"({r.bottom_right.x}, {r.bottom_right.y})", guard=corners)
+    return describe
+
+
+# The 3.10 section's classes and match statement, for the benchmarks
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class _Circle:
+    def __init__(self, center, radius):
+        self.center = center
+        self.radius = radius
+
+
+class _Rectangle:
+    def __init__(self, top_left, bottom_right):
+        self.top_left = top_left
+        self.bottom_right = bottom_right
+
+
+def _describe_match(shape):
+    match shape:
+        case _Point(x=0, y=0):
+            return "Point at origin"
+        case _Point(x=x, y=y):
+            return f"Point at ({x}, {y})"
+        case _Circle(center=_Point(x=0, y=0), radius=r):
+            return f"Circle at origin with radius {r}"
+        case _Circle():
+            return f"Circle at ({shape.center.x}, {shape.center.y}) with radius {shape.radius}"
+        case _Rectangle(top_left=_Point(x=x1, y=y1), bottom_right=_Point(x=x2, y=y2)):
+            return f"Rectangle from ({x1}, {y1}) to ({x2}, {y2})"
+        case _:
+            return "Unknown shape"
+
+
+def sample_shapes(n: int) -> list:
+    """Points, circles, rectangles and a few unknown objects, mixed."""
+    def make(i: int):
+        kind = i % 7
+        if kind < 2:
+            return _Point(i % 3, i % 5)
+        if kind < 4:
+            return _Circle(_Point(0, 0) if kind == 2 else _Point(i, 1), i % 9)
+        if kind < 6:
+            return _Rectangle(_Point(0, 0), _Point(i % 10, i % 4))
+        return "not a shape"
+    return [make(i) for i in range(n)]
+
+
+def _describe_all(shapes: list) -> list[str]:
+    return list(map(_describe_match, shapes))
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Describing 100k mixed shapes: the match statement versus the dispatcher."""
+    describe = shape_describer(_Point, _Circle, _Rectangle)
+
+    def setup() -> list:
+        shapes = sample_shapes(100_000)
+        assert describe.describe_many(shapes) == list(map(_describe_match, shapes))
+        return shapes
+
+    shapes = suite.fixture(setup)
+    rectangles = suite.fixture(lambda: [shape for shape in shapes.get() if isinstance(shape, _Rectangle)])
+    suite.add("match statement (100k mixed)", _describe_all, shapes, group="dispatch")
+    suite.add("TypeDispatcher per call (100k mixed)", lambda shapes: list(map(describe, shapes)), shapes,
+              group="dispatch")
+    suite.add("TypeDispatcher.describe_many (100k mixed)", describe.describe_many, shapes, group="dispatch")
+    suite.add("match statement (rectangles)", _describe_all, rectangles, group="dispatch")
+    suite.add("TypeDispatcher.describe_many (rectangles)", describe.describe_many, rectangles, group="dispatch")
+    suite.add("first-call compile (3 types)",
+              lambda: [shape_describer(_Point, _Circle, _Rectangle).lookup(cls) for cls in (_Point, _Circle, str)],
+              group="dispatch")
@@ -0,0 +1,281 @@
+"""
+An executor that picks threads or processes based on the running interpreter.
+
+`demonstrate_free_threading` checks `sys._is_gil_enabled()` but then always
+uses threads, so CPU-bound work runs serially on a regular build. This module
+probes the interpreter (GIL state, usable CPUs, cgroup CPU quota) and routes
+work to the backend that can actually run it in parallel:
+
+- CPU-bound callables go to threads on free-threaded builds (no pickling, no
+  process start-up) and to a process pool when the GIL is enabled.
+- I/O-bound callables go to threads; coroutine functions run on asyncio.
+
+The same code therefore gets the best backend on both python3.13 and
+python3.13t. `compare()` times a workload on every backend for a report.
+
+    with AdaptiveExecutor() as executor:
+        results = executor.map(parallel_task, [10**6] * 8, kind="cpu")
+        print(executor.compare(parallel_task, [10**6] * 8).format())
+"""
+
+import asyncio
+import inspect
+import math
+import os
+import sys
+import sysconfig
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+KINDS = ("cpu", "io")
+BACKENDS = ("serial", "thread", "process", "asyncio")
+
+
+def _own_cgroups(proc_cgroup: str | os.PathLike) -> dict[str, str]:
+    """Controller -> cgroup path of this process; "" is the cgroup v2 hierarchy."""
+    paths: dict[str, str] = {}
+    try:
+        lines = Path(proc_cgroup).read_text().splitlines()
+    except OSError:
+        return paths
+    for line in lines:
+        # "0::/user.slice/app.scope" (v2) or "4:cpu,cpuacct:/docker/abc" (v1)
+        fields = line.split(":", 2)
+        if len(fields) != 3:
+            continue
+        _, controllers, path = fields
+        for controller in controllers.split(",") if controllers else [""]:
+            paths[controller] = path
+    return paths
+
+
+def _ancestors(base: Path, path: str) -> list[Path]:
+    """`base`/path and each parent directory up to `base` itself, innermost first."""
+    parts = [part for part in path.split("/") if part]
+    return [base.joinpath(*parts[:i]) for i in range(len(parts), -1, -1)]
+
+
+def cgroup_cpu_quota(root: str | os.PathLike = "/sys/fs/cgroup",
+                     proc_cgroup: str | os.PathLike = "/proc/self/cgroup") -> float | None:
+    """CPUs granted by the cgroup CPU quota, or None when unlimited/unknown.
+
+    The process's own cgroup comes from /proc/self/cgroup. A limit on any
+    ancestor applies too, so the smallest quota on the way up wins.
+    """
+    root = Path(root)
+    cgroups = _own_cgroups(proc_cgroup)
+    quotas: list[float] = []
+    # cgroup v2: cpu.max holds "max 100000" or "<quota> <period>"
+    for directory in _ancestors(root, cgroups.get("", "")):
+        try:
+            quota, period = (directory / "cpu.max").read_text().split()
+        except (OSError, ValueError):
+            continue
+        if quota != "max":
+            quotas.append(int(quota) / int(period))
+    if not quotas:
+        # cgroup v1: the cpu controller is mounted as cpu/ or cpu,cpuacct/; -1 means unlimited
+        for mount in ("cpu", "cpu,cpuacct", "cpuacct,cpu"):
+            for directory in _ancestors(root / mount, cgroups.get("cpu", "")):
+                try:
+                    quota = int((directory / "cpu.cfs_quota_us").read_text())
+                    period = int((directory / "cpu.cfs_period_us").read_text())
+                except (OSError, ValueError):
+                    continue
+                if quota > 0:
+                    quotas.append(quota / period)
+            if quotas:
+                break
+    return min(quotas) if quotas else None
+
+
+def usable_cpu_count() -> int:
+    """CPUs this process may run on (affinity aware)."""
+    process_cpu_count = getattr(os, "process_cpu_count", None)  # Python 3.13+
+    if process_cpu_count is not None:
+        return process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@dataclass(frozen=True)
+class RuntimeProbe:
+    """What the interpreter and the host allow in terms of parallelism."""
+    gil_enabled: bool
+    free_threaded_build: bool
+    cpu_count: int
+    cpu_quota: float | None
+
+    @property
+    def effective_cpus(self) -> int:
+        """CPU count capped by the cgroup quota (rounded up)."""
+        if self.cpu_quota is None:
+            return self.cpu_count
+        return max(1, min(self.cpu_count, math.ceil(self.cpu_quota)))
+
+
+def probe() -> RuntimeProbe:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+    return RuntimeProbe(
+        gil_enabled=is_gil_enabled() if is_gil_enabled is not None else True,
+        free_threaded_build=bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        cpu_count=usable_cpu_count(),
+        cpu_quota=cgroup_cpu_quota(),
+    )
+
+
+@dataclass
+class TimingReport:
+    """Wall time of one workload on each backend."""
+    timings: dict[str, float] = field(default_factory=dict)
+    chosen: str = ""
+
+    @property
+    def best(self) -> str:
+        return min(self.timings, key=self.timings.get)
+
+    def format(self) -> str:
+        fastest = self.timings[self.best]
+        lines = []
+        for backend, seconds in self.timings.items():
+            marks = " (chosen)" if backend == self.chosen else ""
+            lines.append(f"{backend:<8} {seconds * 1000:10.2f} ms  x{seconds / fastest:5.2f}{marks}")
+        return "\n".join(lines)
+
+
+class AdaptiveExecutor:
+    """Route callables to the backend that suits the interpreter and the workload."""
+
+    def __init__(self, max_workers: int | None = None, runtime: RuntimeProbe | None = None) -> None:
+        self.runtime = runtime or probe()
+        self.max_workers = max_workers or self.runtime.effective_cpus
+        self._threads: dict[str, ThreadPoolExecutor] = {}  # By kind of work
+        self._processes: ProcessPoolExecutor | None = None
+
+    def backend_for(self, func: Callable[..., Any], kind: str = "cpu") -> str:
+        """The backend `func` would run on for the given kind of work."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}, expected one of {KINDS}")
+        if inspect.iscoroutinefunction(func):
+            return "asyncio"
+        if kind == "io":
+            return "thread"
+        if not self.runtime.gil_enabled:
+            return "thread"  # Free-threaded: threads run Python code in parallel
+        return "process" if self.max_workers > 1 else "serial"
+
+    def _pool(self, backend: str, kind: str = "io") -> Executor:
+        if backend == "thread":
+            pool = self._threads.get(kind)
+            if pool is None:
+                # I/O-bound work benefits from more threads than CPUs; CPU-bound
+                # work (free-threaded builds) only wants one thread per usable CPU
+                workers = self.max_workers if kind == "cpu" else max(self.max_workers, 4) * 4
+                pool = self._threads[kind] = ThreadPoolExecutor(max_workers=workers)
+            return pool
+        if backend == "process":
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+        raise ValueError(f"No pool for backend {backend!r}")
+
+    def submit(self, func: Callable[..., Any], *args: Any, kind: str = "cpu") -> Future:
+        """Schedule a plain callable; coroutine functions belong in map()/amap()."""
+        backend = self.backend_for(func, kind)
+        if backend == "asyncio":
+            raise TypeError("Use map() or amap() for coroutine functions")
+        if backend == "serial":
+            future: Future = Future()
+            try:
+                future.set_result(func(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+            return future
+        return self._pool(backend, kind).submit(func, *args)
+
+    def map(self, func: Callable[..., Any], items: Iterable[Any], kind: str = "cpu",
+            backend: str | None = None) -> list[Any]:
+        """Apply `func` to every item, in order, on the routed (or given) backend."""
+        backend = backend or self.backend_for(func, kind)
+        items = list(items)
+        if backend == "serial":
+            return [func(item) for item in items]
+        if backend == "asyncio":
+            return asyncio.run(self._gather(func, items))
+        if backend == "process" and len(items) > 1:
+            # Batch items per worker to amortise pickling and IPC
+            chunksize = max(1, len(items) // (self.max_workers * 4))
+            return list(self._pool(backend, kind).map(func, items, chunksize=chunksize))
+        return list(self._pool(backend, kind).map(func, items))
+
+    async def amap(self, func: Callable[..., Any], items: Iterable[Any], kind: str = "io") -> list[Any]:
+        """Like map(), but awaitable from a running event loop."""
+        backend = self.backend_for(func, kind)
+        items = list(items)
+        if backend == "asyncio":
+            return await self._gather(func, items)
+        if backend == "serial":
+            return [func(item) for item in items]
+        loop = asyncio.get_running_loop()
+        pool = self._pool(backend, kind)
+        return list(await asyncio.gather(*(loop.run_in_executor(pool, func, item) for item in items)))
+
+    async def _gather(self, func: Callable[..., Any], items: list[Any]) -> list[Any]:
+        # Bound concurrency so a huge batch does not open everything at once
+        limit = asyncio.Semaphore(max(self.max_workers, 4) * 16)
+
+        async def run(item: Any) -> Any:
+            async with limit:
+                return await func(item)
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    def compare(self, func: Callable[..., Any], items: Iterable[Any], kind: str = "cpu",
+                backends: Iterable[str] = ("serial", "thread", "process")) -> TimingReport:
+        """Time the same workload on several backends."""
+        items = list(items)
+        report = TimingReport(chosen=self.backend_for(func, kind))
+        for backend in backends:
+            if backend == "process":
+                self._pool("process").submit(int).result()  # Start workers outside the timing
+            started = time.perf_counter()
+            self.map(func, items, kind, backend=backend)
+            report.timings[backend] = time.perf_counter() - started
+        return report
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in (*self._threads.values(), self._processes):
+            if pool is not None:
+                pool.shutdown(wait=wait)
+        self._threads = {}
+        self._processes = None
+
+    def __enter__(self) -> "AdaptiveExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.shutdown()
+        return False
+
+
+def _sum_of_squares(n: int) -> int:
+    """Module-level (picklable) CPU-bound workload for the benchmarks."""
+    return sum(i * i for i in range(n))
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Time the same CPU-bound batch on each backend and on the routed one."""
+    executor = AdaptiveExecutor()
+    suite.add_cleanup(executor.shutdown)
+    work = [200_000] * 8
+    for backend in ("serial", "thread", "process"):
+        suite.add(f"AdaptiveExecutor.map(8 x 200k, {backend})", executor.map, _sum_of_squares, work,
+                  backend=backend, group="executor")
+    suite.add("AdaptiveExecutor.map(8 x 200k, routed)", executor.map, _sum_of_squares, work, group="executor")
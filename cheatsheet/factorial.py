@@ -0,0 +1,228 @@
+"""
+Big-integer factorials, binomials and multinomials.
+
+The tutorial's `factorial` and `factorial_tail` recurse once per n, so they
+hit the recursion limit around n=1000, and they multiply left to right: each
+step multiplies a huge partial product by a small number, which is quadratic
+overall. This engine is iterative in n and multiplies balanced halves instead:
+
+- "split": binary-splitting product tree over 1..n, so the expensive big-int
+           multiplications happen between numbers of similar size
+- "swing": Luschny's prime-swing algorithm, n! = (n//2)!^2 * swing(n), where
+           swing(n) is a product of prime powers taken from a sieve
+
+FactorialEngine keeps a bounded LRU cache of computed values. A request for n
+starts from the closest cached m <= n and only multiplies in (m, n], so calls
+with nearby n reuse each other's work. binomial() and multinomial() are
+built on top of it; large binomials multiply prime powers directly instead of
+dividing huge factorials.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+# Below this many factors a plain loop beats splitting the range further
+LEAF_SIZE = 32
+
+# A cached m! is reused for n! when n - m is at most this fraction of n
+REUSE_FRACTION = 0.5
+
+METHODS = ("split", "swing")
+
+
+def product_range(lo: int, hi: int) -> int:
+    """Product of the integers in [lo, hi) using a balanced product tree."""
+    if hi - lo <= LEAF_SIZE:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return product_range(lo, mid) * product_range(mid, hi)  # Depth is only log2(hi - lo)
+
+
+def product(values: list[int]) -> int:
+    """Product of arbitrary integers, multiplying neighbours pairwise."""
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def primes_up_to(n: int) -> list[int]:
+    """Sieve of Eratosthenes."""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p, is_prime in enumerate(sieve) if is_prime]
+
+
+def _swing(n: int, primes: list[int]) -> int:
+    """n! / ((n//2)!)^2 as a product of prime powers."""
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        # Exponent of p in the swing: number of odd quotients n // p^k
+        q, exponent = n, 0
+        while q:
+            q //= p
+            exponent += q & 1
+        if exponent:
+            factors.append(p ** exponent if exponent > 1 else p)
+    return product(factors)
+
+
+def factorial_swing(n: int) -> int:
+    """n! by the prime-swing recurrence, evaluated bottom-up."""
+    primes = primes_up_to(n)
+    chain = []
+    while n > 1:
+        chain.append(n)
+        n //= 2
+    result = 1
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+def _check(n: int) -> None:
+    if n < 0:
+        raise ValueError(f"Factorial is not defined for negative numbers, got {n}")
+
+
+class FactorialEngine:
+    """Factorials with a bounded cache of previously computed values."""
+
+    def __init__(self, cache_size: int = 32, method: str = "split") -> None:
+        if method not in METHODS:
+            raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+        self.cache_size = cache_size
+        self.method = method
+        self._cache: OrderedDict[int, int] = OrderedDict()
+        self._keys: list[int] = []  # Sorted cache keys for nearest-neighbour lookup
+        self._lock = threading.Lock()
+
+    def _nearest_below(self, n: int) -> tuple[int, int] | None:
+        with self._lock:
+            i = bisect.bisect_right(self._keys, n)
+            if not i:
+                return None
+            m = self._keys[i - 1]
+            self._cache.move_to_end(m)
+            return m, self._cache[m]
+
+    def _store(self, n: int, value: int) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            if n in self._cache:
+                self._cache.move_to_end(n)
+                return
+            self._cache[n] = value
+            bisect.insort(self._keys, n)
+            while len(self._cache) > self.cache_size:
+                evicted, _ = self._cache.popitem(last=False)
+                self._keys.remove(evicted)
+
+    def factorial(self, n: int, *, store: bool = True) -> int:
+        """n!, reusing the closest cached m! with m <= n when it is close enough."""
+        _check(n)
+        cached = self._nearest_below(n)
+        if cached is not None and n - cached[0] <= REUSE_FRACTION * n:
+            m, value = cached
+            result = value * product_range(m + 1, n + 1) if n > m else value
+        elif self.method == "swing":
+            result = factorial_swing(n)
+        else:
+            result = product_range(2, n + 1)
+        if store:
+            self._store(n, result)
+        return result
+
+    def binomial(self, n: int, k: int) -> int:
+        """n choose k."""
+        if k < 0 or k > n:
+            return 0
+        k = min(k, n - k)
+        if k < LEAF_SIZE * 8:
+            # Falling product n * (n-1) * ... * (n-k+1) is far smaller than n!
+            return product_range(n - k + 1, n + 1) // self.factorial(k)
+        # Large k: multiply the prime powers of C(n, k) directly (Legendre's
+        # formula) instead of dividing huge factorials, which is quadratic
+        factors = []
+        for p in primes_up_to(n):
+            exponent, power = 0, p
+            while power <= n:
+                exponent += n // power - k // power - (n - k) // power
+                power *= p
+            if exponent:
+                factors.append(p ** exponent if exponent > 1 else p)
+        return product(factors)
+
+    def multinomial(self, *counts: int) -> int:
+        """(k1 + k2 + ...)! / (k1! * k2! * ...)."""
+        for k in counts:
+            _check(k)
+        return self.factorial(sum(counts)) // product([self.factorial(k) for k in counts])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._keys.clear()
+
+
+# Shared engine behind the module-level helpers
+_default = FactorialEngine()
+
+
+def factorial(n: int) -> int:
+    return _default.factorial(n)
+
+
+def binomial(n: int, k: int) -> int:
+    return _default.binomial(n, k)
+
+
+def multinomial(*counts: int) -> int:
+    return _default.multinomial(*counts)
+
+
+def _left_to_right(n: int) -> int:
+    """The tutorial's multiplication order, without the recursion."""
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Register the engine next to the tutorial's recursive factorial(500)."""
+    import math
+
+    uncached = {method: FactorialEngine(cache_size=0, method=method) for method in METHODS}
+    for n in (500, 10_000, 100_000):
+        if n <= 10_000:
+            suite.add(f"left-to-right loop({n:_})", _left_to_right, n, group="factorial")
+        for method, engine in uncached.items():
+            suite.add(f"FactorialEngine.factorial({n:_}, {method})", engine.factorial, n, group="factorial")
+        suite.add(f"math.factorial({n:_})", math.factorial, n, group="factorial")
+    # With 100_000! cached, a nearby n only multiplies in the difference
+    warm = FactorialEngine()
+    suite.add("FactorialEngine.factorial(100_050, warm)",
+              lambda: warm.factorial(100_000) and warm.factorial(100_050, store=False), group="factorial")
+    suite.add("FactorialEngine.binomial(100_000, 50_000)", uncached["split"].binomial, 100_000, 50_000,
+              group="factorial")
@@ -0,0 +1,112 @@
+"""
+Fibonacci numbers without the exponential recursion.
+
+`fibonacci_jit_demo` in the tutorial makes O(phi^n) calls because it
+recomputes the same subproblems again and again; no JIT can rescue that.
+This module offers three algorithms and a batch API:
+
+- fib_memo(n):      memoized recursion over the halving identities, with a
+                    bounded LRU cache and O(log n) recursion depth
+- fib_iterative(n): n big-integer additions, no recursion at all
+- fib_fast(n):      fast doubling, O(log n) big-integer multiplications;
+                    F(10**6) takes tens of milliseconds
+- fib_many(ns):     many indices in one pass, sharing intermediate results
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+# Entries kept by fib_memo; the halving identities touch only a few values per
+# level, so even huge n needs a handful of entries per call
+MEMO_SIZE = 4096
+
+# Gaps up to this size are bridged by stepping in fib_many; larger gaps jump
+# with fast doubling, which pays a few multiplications instead
+STEP_LIMIT = 128
+
+
+def _check(n: int) -> None:
+    if n < 0:
+        raise ValueError(f"Fibonacci index must be non-negative, got {n}")
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def fib_memo(n: int) -> int:
+    """F(n) by memoized recursion on F(2k) and F(2k+1)."""
+    _check(n)
+    if n < 3:
+        return (0, 1, 1)[n]
+    k = n // 2
+    a, b = fib_memo(k), fib_memo(k + 1)
+    if n % 2 == 0:
+        return a * (2 * b - a)  # F(2k) = F(k) * (2F(k+1) - F(k))
+    return a * a + b * b        # F(2k+1) = F(k)^2 + F(k+1)^2
+
+
+def fib_iterative(n: int) -> int:
+    """F(n) with n additions."""
+    _check(n)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def fib_pair(n: int) -> tuple[int, int]:
+    """Return (F(n), F(n+1)) by fast doubling over the bits of n."""
+    _check(n)
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast(n: int) -> int:
+    """F(n) in O(log n) multiplications."""
+    return fib_pair(n)[0]
+
+
+def fib_many(indices: Iterable[int]) -> list[int]:
+    """F(n) for every n in `indices`, returned in the same order.
+
+    The indices are visited in ascending order while carrying
+    (F(pos), F(pos+1)) forward: small gaps are stepped, large gaps jump with
+    F(m+d) = F(m)F(d+1) + F(m-1)F(d), so no value is computed from scratch.
+    """
+    indices = list(indices)
+    for n in indices:
+        _check(n)
+    values = {}
+    pos, a, b = 0, 0, 1  # a = F(pos), b = F(pos + 1)
+    for n in sorted(set(indices)):
+        gap = n - pos
+        if gap <= STEP_LIMIT:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            fd, fd1 = fib_pair(gap)
+            a, b = a * fd1 + (b - a) * fd, b * fd1 + a * fd
+        pos = n
+        values[n] = a
+    return [values[n] for n in indices]
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Register the engine next to the tutorial's fibonacci_jit_demo(20)."""
+    suite.add("fib_memo(20) [warm cache]", fib_memo, 20, group="fibonacci")
+    suite.add("fib_iterative(20)", fib_iterative, 20, group="fibonacci")
+    suite.add("fib_fast(20)", fib_fast, 20, group="fibonacci")
+    suite.add("fib_iterative(100_000)", fib_iterative, 100_000, group="fibonacci")
+    suite.add("fib_fast(100_000)", fib_fast, 100_000, group="fibonacci")
+    suite.add("fib_fast(1_000_000)", fib_fast, 1_000_000, group="fibonacci")
+    batch = range(0, 200_000, 2_000)
+    suite.add("fib_many(100 indices up to 200k)", fib_many, batch, group="fibonacci")
+    suite.add("fib_fast x 100 (same indices)", lambda: [fib_fast(n) for n in batch], group="fibonacci")
@@ -0,0 +1,256 @@
+"""
+Process one large file in parallel, split into line-aligned byte ranges.
+
+The tutorial's `multiprocessing.Pool` maps over three integers. Files are the
+more common case: count the lines of a 10 GB log, grep it, or sum a column.
+process_file() does that the same way RangeReducer handles integer ranges:
+
+1. split_ranges() cuts the file into byte ranges and moves every cut just past
+   the next newline, so no line is split between two ranges
+2. each worker gets only (path, start, stop): it opens the file, seeks and
+   reads its own range in blocks, so no file data is pickled
+3. the worker folds `mapper(block)` over its blocks with `reducer`, and the
+   parent folds the per-range results in file order
+
+`mapper` receives bytes holding whole lines (the last block of the file may
+lack a final newline) and must be picklable for the process backend. Ready
+made mappers: LineCount, Grep and FieldSum.
+
+    report = process_file("app.log", Grep(rb"ERROR"), operator.add, [])
+    report.value, report.summary()
+"""
+
+import math
+import operator
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+CHUNK_SIZE = 32 * 1024 * 1024
+BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def split_ranges(path: str | os.PathLike, chunks: int) -> list[tuple[int, int]]:
+    """About `chunks` byte ranges covering the file, each ending after a newline."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    chunks = max(1, min(chunks, size))
+    cuts = [0]
+    with open(path, "rb") as file:
+        for i in range(1, chunks):
+            target = max(size * i // chunks, cuts[-1])
+            if target >= size:
+                break
+            file.seek(target)
+            file.readline()  # Skip to just past the next newline
+            position = file.tell()
+            if position > cuts[-1] and position < size:
+                cuts.append(position)
+    cuts.append(size)
+    return list(zip(cuts, cuts[1:]))
+
+
+def process_range(path: str, start: int, stop: int, mapper: Callable[[bytes], Any],
+                  reducer: Callable[[Any, Any], Any], initial: Any,
+                  block_size: int = BLOCK_SIZE) -> tuple[Any, float]:
+    """Fold mapper over whole-line blocks of [start, stop); return (value, seconds)."""
+    began = time.perf_counter()
+    value = initial
+    carry = b""
+    with open(path, "rb", buffering=0) as file:
+        file.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            data = file.read(min(block_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            if carry:
+                data = carry + data
+            cut = data.rfind(b"\n") + 1
+            if cut == 0:
+                carry = data  # One line longer than a block: keep reading
+                continue
+            carry = data[cut:]
+            value = reducer(value, mapper(data[:cut] if carry else data))
+    if carry:
+        value = reducer(value, mapper(carry))  # Final line without a newline
+    return value, time.perf_counter() - began
+
+
+class LineCount:
+    """Number of lines in a block."""
+
+    def __call__(self, block: bytes) -> int:
+        return block.count(b"\n") + (not block.endswith(b"\n"))
+
+
+class Grep:
+    """Lines matching a bytes regex (or just their number with count_only)."""
+
+    def __init__(self, pattern: bytes, count_only: bool = False) -> None:
+        self.pattern = pattern
+        self.count_only = count_only
+        self._regex = re.compile(pattern, re.MULTILINE)  # ^ and $ anchor at every line of a block
+
+    def __call__(self, block: bytes) -> list[bytes] | int:
+        search = self._regex.search
+        matches = []
+        position = 0
+        end = len(block) - block.endswith(b"\n")  # No line starts after a final newline
+        # Search the block as a whole and widen each hit to its line, rather
+        # than splitting the block into lines first
+        while position <= end and (match := search(block, position)) is not None and match.start() <= end:
+            line_start = block.rfind(b"\n", 0, match.start()) + 1
+            line_end = block.find(b"\n", match.end())
+            if line_end < 0:
+                line_end = len(block)
+            matches.append(block[line_start:line_end])
+            position = line_end + 1
+        return len(matches) if self.count_only else matches
+
+    def __reduce__(self):
+        return Grep, (self.pattern, self.count_only)
+
+
+class FieldSum:
+    """Sum of field `value` grouped by field `key` (0-based, split on `sep`)."""
+
+    def __init__(self, key: int, value: int, sep: bytes | None = None) -> None:
+        self.key = key
+        self.value = value
+        self.sep = sep
+
+    def __call__(self, block: bytes) -> Counter:
+        sums: dict[bytes, float] = {}
+        key, value, sep = self.key, self.value, self.sep
+        needed = max(key, value)
+        get = sums.get
+        for line in block.splitlines():
+            fields = line.split(sep)
+            if len(fields) > needed:
+                name = fields[key]
+                sums[name] = get(name, 0.0) + float(fields[value])
+        # Keys stay bytes in the loop and are decoded once per distinct key
+        return Counter({name.decode(): total for name, total in sums.items()})
+
+
+def merge_counters(a: Counter, b: Counter) -> Counter:
+    """Reducer for FieldSum; unlike `a + b` it keeps zero and negative sums."""
+    merged = Counter(a)
+    merged.update(b)
+    return merged
+
+
+@dataclass
+class ChunkTiming:
+    start: int
+    stop: int
+    seconds: float
+
+
+@dataclass
+class FileReport:
+    value: Any
+    wall_time: float
+    size: int
+    chunk_times: list[ChunkTiming]
+
+    def summary(self) -> str:
+        if not self.chunk_times:
+            return "empty file"
+        busy = [c.seconds for c in self.chunk_times]
+        rate = self.size / self.wall_time / 1e6 if self.wall_time else 0.0
+        return (f"{len(busy)} ranges in {self.wall_time * 1000:.1f} ms ({rate:.0f} MB/s), "
+                f"range min/max {min(busy) * 1000:.2f}/{max(busy) * 1000:.2f} ms")
+
+
+def process_file(path: str | os.PathLike, mapper: Callable[[bytes], Any], reducer: Callable[[Any, Any], Any],
+                 initial: Any, *, workers: int | None = None, chunk_size: int = CHUNK_SIZE,
+                 backend: str = "process", executor: Executor | None = None,
+                 block_size: int = BLOCK_SIZE) -> FileReport:
+    """Map/reduce a file's lines in parallel line-aligned ranges.
+
+    `reducer` must be associative with `initial` as its identity, and must not
+    mutate its arguments; it is applied within each range and again across
+    ranges, in file order.
+    """
+    if backend not in ("process", "thread", "serial"):
+        raise ValueError(f"Unknown backend {backend!r}")
+    began = time.perf_counter()
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    # Several ranges per worker so a slow range does not hold up the rest
+    ranges = split_ranges(path, max(workers * 4, math.ceil(size / chunk_size)) if size > block_size else 1)
+    args = (mapper, reducer, initial, block_size)
+    if backend == "serial":
+        partials = [process_range(path, start, stop, *args) for start, stop in ranges]
+    else:
+        own_executor = executor is None
+        if own_executor:
+            pool_type = ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+            executor = pool_type(max_workers=workers)
+        try:
+            futures = [executor.submit(process_range, path, start, stop, *args) for start, stop in ranges]
+            partials = [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+    value = reduce(reducer, (partial for partial, _ in partials), initial)
+    timings = [ChunkTiming(start, stop, seconds) for (start, stop), (_, seconds) in zip(ranges, partials)]
+    return FileReport(value, time.perf_counter() - began, size, timings)
+
+
+def count_lines(path: str | os.PathLike, **options: Any) -> int:
+    return process_file(path, LineCount(), operator.add, 0, **options).value
+
+
+def grep(path: str | os.PathLike, pattern: bytes, **options: Any) -> list[bytes]:
+    return process_file(path, Grep(pattern), operator.add, [], **options).value
+
+
+def make_log(path: str, size: int) -> None:
+    """A synthetic access log: "<timestamp> <level> <endpoint> <ms>" per line."""
+    endpoints = ("/api/users", "/api/orders", "/health", "/api/search")
+    lines = []
+    for i in range(10_000):
+        level = "ERROR" if i % 97 == 0 else "INFO"
+        lines.append(f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d} {level} {endpoints[i % 4]} {i % 250}\n")
+    block = "".join(lines).encode()
+    with open(path, "wb") as file:
+        for _ in range(max(1, size // len(block))):
+            file.write(block)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Line count, grep and a grouped sum over a 64 MB log, serial and in processes."""
+    def setup() -> str:
+        path = os.path.join(tempfile.mkdtemp(prefix="cheatsheet-chunks-"), "access.log")
+        make_log(path, 64 * 1024 * 1024)
+        return path
+
+    path = suite.fixture(setup, lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True))
+    pool = ProcessPoolExecutor()
+    suite.add_cleanup(pool.shutdown)
+    jobs = {
+        "line count": (LineCount(), operator.add, 0),
+        "grep ERROR": (Grep(rb"ERROR", count_only=True), operator.add, 0),
+        "sum ms by endpoint": (FieldSum(2, 3), merge_counters, Counter()),
+    }
+    for name, (mapper, reducer, initial) in jobs.items():
+        suite.add(f"{name}, serial (64 MB)", process_file, path, mapper, reducer, initial, backend="serial",
+                  group="file-chunks")
+        suite.add(f"{name}, process pool (64 MB)", process_file, path, mapper, reducer, initial, executor=pool,
+                  group="file-chunks")
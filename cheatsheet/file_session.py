@@ -0,0 +1,205 @@
+"""
+A file session: one handle for a whole sequence of reads and writes.
+
+The File I/O section opens `example.txt` five times (write, read, read line by
+line, append, read again). Locally an open is cheap; on a network filesystem
+every open/close is a round trip to the server, and so is every small
+`write()` that reaches the OS. FileSession keeps a single handle open:
+
+- small writes are collected in memory and handed to the OS as one write once
+  `buffer_size` bytes are pending (or on flush/read/close)
+- reads flush pending writes first, so read-after-write needs no reopen, and
+  writes always go to the end of the file, as in append mode
+- `fsync` decides when data is forced to stable storage: "never" (leave it to
+  the OS), "close", or an integer N to sync after every N bytes written (a
+  write that reaches N is flushed and synced at once, whatever `buffer_size`)
+
+    with FileSession("example.txt", "w", fsync="close") as session:
+        session.writelines(["Hello, World!\\n", "This is a test file.\\n"])
+        print(session.read())
+        session.write("This line was appended.\\n")
+
+Text is encoded with `encoding` and newlines are written exactly as given.
+The file is opened through the current storage (see cheatsheet.storage), so
+a session on a MemoryStorage never touches the disk.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from cheatsheet.storage import Storage, get_storage
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+MODES = {"w": "w+b", "a": "a+b", "r+": "r+b"}
+FSYNC_POLICIES = ("never", "close")
+
+
+@dataclass
+class SessionStats:
+    """System-level work done by a session."""
+    opens: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    fsyncs: int = 0
+
+
+class FileSession:
+    """Buffered reads and writes on one open handle.
+
+    `mode` is "w" (truncate or create), "a" (keep contents, create if missing)
+    or "r+" (keep contents, file must exist).
+    """
+
+    def __init__(self, path: str | os.PathLike, mode: str = "a", *, buffer_size: int = 64 * 1024,
+                 fsync: str | int = "never", encoding: str = "utf-8", storage: Storage | None = None) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {tuple(MODES)}")
+        if isinstance(fsync, int) and not isinstance(fsync, bool):
+            if fsync < 1:
+                raise ValueError("fsync byte interval must be positive")
+        elif fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}, expected {FSYNC_POLICIES} or a byte count")
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.encoding = encoding
+        self.stats = SessionStats()
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._unsynced = 0  # Bytes written since the last fsync
+        self._file = (storage or get_storage()).open(self.path, MODES[mode], buffering=0)
+        self.stats.opens += 1
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, text: str) -> int:
+        data = text.encode(self.encoding)
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.buffer_size or (
+                isinstance(self.fsync, int) and self._unsynced + self._pending_size >= self.fsync):
+            self.flush()  # flush() also syncs once the fsync interval is reached
+        return len(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        # One encode for the whole batch instead of one per line
+        self.write("".join(lines))
+
+    def flush(self) -> None:
+        """Hand pending writes to the OS as a single write."""
+        if not self._pending:
+            return
+        data = b"".join(self._pending) if len(self._pending) > 1 else self._pending[0]
+        self._pending.clear()
+        self._pending_size = 0
+        self._file.seek(0, os.SEEK_END)  # Reads may have moved the position
+        view = memoryview(data)
+        while view:
+            # A raw (unbuffered) file may write less than asked for
+            view = view[self._file.write(view):]
+            self.stats.writes += 1
+        self.stats.bytes_written += len(data)
+        self._unsynced += len(data)
+        if isinstance(self.fsync, int) and self._unsynced >= self.fsync:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush and force everything written so far to stable storage."""
+        self.flush()
+        if self._unsynced:
+            try:
+                fd = self._file.fileno()
+            except io.UnsupportedOperation:
+                fd = None  # An in-memory file: there is no stable storage to force
+            if fd is not None:
+                os.fsync(fd)
+                self.stats.fsyncs += 1
+            self._unsynced = 0
+
+    def read_bytes(self) -> bytes:
+        self.flush()
+        self._file.seek(0)
+        return self._file.read()
+
+    def read(self) -> str:
+        """The whole file, including writes that were still buffered."""
+        return self.read_bytes().decode(self.encoding)
+
+    def lines(self) -> Iterator[str]:
+        """Iterate over the lines (newlines kept) without reopening the file.
+
+        The lines come from a snapshot taken at the first next(), so writes made
+        during the iteration are not seen (and do not cut it short).
+        """
+        # StringIO(newline="") splits lines exactly as open(newline="") does
+        yield from io.StringIO(self.read(), newline="")
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+            if self.fsync != "never":
+                self.sync()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "FileSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def open_per_operation(path: str, lines: list[str]) -> str:
+    """The tutorial's pattern: write, read, read lines, append, read - five opens."""
+    with open(path, "w") as file:
+        for line in lines:
+            file.write(line)
+    with open(path, "r") as file:
+        file.read()
+    with open(path, "r") as file:
+        for _ in file:
+            pass
+    with open(path, "a") as file:
+        file.write("This line was appended.\n")
+    with open(path, "r") as file:
+        return file.read()
+
+
+def single_session(path: str, lines: list[str], **options) -> str:
+    """The same sequence of operations on one FileSession."""
+    with FileSession(path, "w", **options) as session:
+        session.writelines(lines)
+        session.read()
+        for _ in session.lines():
+            pass
+        session.write("This line was appended.\n")
+        return session.read()
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Write/read/append round trips on a local temporary directory.
+
+    A local disk hides most of the open() cost that a network filesystem adds,
+    so the gap here is a lower bound; `stats.opens` shows the structural saving.
+    """
+    path = suite.fixture(lambda: os.path.join(tempfile.mkdtemp(prefix="cheatsheet-session-"), "example.txt"),
+                         lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True))
+    for count in (3, 1000):
+        lines = [f"Line {i}: Python is awesome!\n" for i in range(count)]
+        suite.add(f"open per operation ({count} lines)", open_per_operation, path, lines, group="file-session")
+        suite.add(f"FileSession ({count} lines)", single_session, path, lines, group="file-session")
+    lines = [f"Line {i}: Python is awesome!\n" for i in range(1000)]
+    suite.add("FileSession (1000 lines, fsync on close)", single_session, path, lines, fsync="close",
+              group="file-session")
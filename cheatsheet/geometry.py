@@ -0,0 +1,224 @@
+"""
+Compact points: a frozen, slotted Point and a columnar PointArray.
+
+Both tutorial `Point` classes keep x and y in a per-instance `__dict__`,
+and the OOP one defines `__eq__` without `__hash__`, which makes it
+unhashable: it cannot go into a set or be a dict key. Every `p1 + p2` also
+builds a new dict-backed object.
+
+- Point: `__slots__` and frozen, so there is no `__dict__`, it hashes like
+  the tuple (x, y), and it keeps the tutorial's repr/str and `+`.
+  `__match_args__` lets `case Point(0, 0)` match it positionally.
+- PointArray: a batch of points as two `array('d')` buffers, 16 bytes per
+  point and no objects at all. `+`, `-`, scaling and `==` work on whole
+  arrays at once, looping in C over the buffers instead of calling
+  `Point.__add__` once per point.
+
+    pts = PointArray.from_points(points)   # Any objects with .x and .y
+    moved = pts + Point(1, 0)               # Shift every point
+    bigger = pts * 2                        # Scale about the origin
+    pts[0], len(pts), pts.nbytes
+
+memory_per_point() compares the bytes per point of each representation.
+"""
+
+import operator
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+
+@dataclass(frozen=True, slots=True, repr=False)
+class Point:
+    """An immutable 2-D point: hashable, no `__dict__`, usable as a dict key."""
+    x: float
+    y: float
+
+    def __repr__(self) -> str:
+        return f"Point({self.x}, {self.y})"
+
+    def __str__(self) -> str:
+        return f"({self.x}, {self.y})"
+
+    def __add__(self, other: "Point") -> "Point":
+        return Point(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: "Point") -> "Point":
+        return Point(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, factor: float) -> "Point":
+        return Point(self.x * factor, self.y * factor)
+
+    __rmul__ = __mul__
+
+    def __iter__(self) -> Iterator[float]:
+        """Unpack like a Point2D tuple: `x, y = point`."""
+        yield self.x
+        yield self.y
+
+
+_Operand = Union["PointArray", Point, tuple[float, float]]
+
+
+def _zeros(n: int) -> array:
+    return array("d", bytes(8 * n))  # Zero-filled without a Python loop
+
+
+class PointArray:
+    """Points stored column-wise in two float arrays."""
+
+    __slots__ = ("xs", "ys")
+    __hash__ = None  # Mutable, like list
+
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = ()) -> None:
+        self.xs = xs if isinstance(xs, array) and xs.typecode == "d" else array("d", xs)
+        self.ys = ys if isinstance(ys, array) and ys.typecode == "d" else array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError(f"xs and ys differ in length ({len(self.xs)} != {len(self.ys)})")
+
+    @classmethod
+    def from_points(cls, points: Iterable) -> "PointArray":
+        """From any objects with .x and .y (tutorial Points, Point, ...)."""
+        points = points if isinstance(points, (list, tuple)) else list(points)
+        return cls(map(operator.attrgetter("x"), points), map(operator.attrgetter("y"), points))
+
+    @classmethod
+    def from_tuples(cls, pairs: Iterable[tuple[float, float]]) -> "PointArray":
+        """From (x, y) pairs such as Point2D values."""
+        pairs = pairs if isinstance(pairs, (list, tuple)) else list(pairs)
+        return cls(map(operator.itemgetter(0), pairs), map(operator.itemgetter(1), pairs))
+
+    @classmethod
+    def zeros(cls, n: int) -> "PointArray":
+        return cls(_zeros(n), _zeros(n))
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index: int | slice) -> "Point | PointArray":
+        if isinstance(index, slice):
+            return PointArray(self.xs[index], self.ys[index])
+        return Point(self.xs[index], self.ys[index])
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self.xs, self.ys)
+
+    def to_tuples(self) -> list[tuple[float, float]]:
+        return list(zip(self.xs, self.ys))
+
+    def append(self, point: Point | tuple[float, float]) -> None:
+        x, y = point
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def extend(self, other: "PointArray") -> None:
+        self.xs.extend(other.xs)
+        self.ys.extend(other.ys)
+
+    @property
+    def nbytes(self) -> int:
+        return (len(self.xs) + len(self.ys)) * self.xs.itemsize
+
+    def _columns(self, other: _Operand) -> tuple[Iterable[float], Iterable[float]]:
+        """`other` as per-point x and y iterables (a single point is repeated)."""
+        if isinstance(other, PointArray):
+            if len(other) != len(self):
+                raise ValueError(f"PointArray lengths differ ({len(self)} != {len(other)})")
+            return other.xs, other.ys
+        x, y = other
+        return repeat(x, len(self)), repeat(y, len(self))
+
+    def _combine(self, other: _Operand, op) -> "PointArray":
+        xs, ys = self._columns(other)
+        return PointArray(array("d", map(op, self.xs, xs)), array("d", map(op, self.ys, ys)))
+
+    def __add__(self, other: _Operand) -> "PointArray":
+        """Element-wise sum with another PointArray, or every point shifted by one point."""
+        return self._combine(other, operator.add)
+
+    def __sub__(self, other: _Operand) -> "PointArray":
+        return self._combine(other, operator.sub)
+
+    def __mul__(self, factor: float) -> "PointArray":
+        return self.scale(factor)
+
+    __rmul__ = __mul__
+
+    def scale(self, sx: float, sy: float | None = None) -> "PointArray":
+        """Scale about the origin, by `sx` in x and `sy` (default: `sx`) in y."""
+        sy = sx if sy is None else sy
+        return PointArray(array("d", map(operator.mul, self.xs, repeat(sx))),
+                          array("d", map(operator.mul, self.ys, repeat(sy))))
+
+    def __eq__(self, other: object) -> bool:
+        """True when both arrays hold the same points in the same order (compared in C)."""
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.xs == other.xs and self.ys == other.ys
+
+    def __repr__(self) -> str:
+        shown = ", ".join(map(repr, self[:3]))
+        return f"PointArray([{shown}{', ...' if len(self) > 3 else ''}], n={len(self)})"
+
+
+class _DictPoint:
+    """The tutorial's Point: attributes in a per-instance __dict__."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __add__(self, other):
+        return _DictPoint(self.x + other.x, self.y + other.y)
+
+
+def _traced_size(build) -> int:
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        kept = build()  # noqa: F841 - held so that its memory is still traced
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def memory_per_point(n: int = 100_000) -> str:
+    """Bytes per point: dict-backed objects, slotted Points, tuples and a PointArray."""
+    cases = (
+        ("tutorial Point (__dict__)", lambda: [_DictPoint(i * 0.5, i * 0.25) for i in range(n)]),
+        ("slotted frozen Point", lambda: [Point(i * 0.5, i * 0.25) for i in range(n)]),
+        ("(x, y) tuple", lambda: [(i * 0.5, i * 0.25) for i in range(n)]),
+        ("PointArray", lambda: PointArray(array("d", (i * 0.5 for i in range(n))),
+                                          array("d", (i * 0.25 for i in range(n))))),
+    )
+    return "\n".join(f"{name:<28} {_traced_size(build) / n:>6.1f} bytes/point" for name, build in cases)
+
+
+def _shift_objects(points: list, offset) -> list:
+    return [point + offset for point in points]
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Creating, shifting and scaling 100k points as objects versus a PointArray."""
+    n = 100_000
+    coords = suite.fixture(lambda: [(i * 0.5, i * 0.25) for i in range(n)])
+    dict_points = suite.fixture(lambda: [_DictPoint(x, y) for x, y in coords.get()])
+    slot_points = suite.fixture(lambda: [Point(x, y) for x, y in coords.get()])
+    arr = suite.fixture(lambda: PointArray.from_tuples(coords.get()))
+    suite.add("create 100k tutorial Points", lambda coords: [_DictPoint(x, y) for x, y in coords], coords,
+              group="geometry")
+    suite.add("create 100k slotted Points", lambda coords: [Point(x, y) for x, y in coords], coords, group="geometry")
+    suite.add("PointArray.from_tuples (100k)", PointArray.from_tuples, coords, group="geometry")
+    suite.add("shift 100k tutorial Points", _shift_objects, dict_points, _DictPoint(1.0, 2.0), group="geometry")
+    suite.add("shift 100k slotted Points", _shift_objects, slot_points, Point(1.0, 2.0), group="geometry")
+    suite.add("PointArray + Point (100k)", operator.add, arr, Point(1.0, 2.0), group="geometry")
+    suite.add("PointArray + PointArray (100k)", lambda arr: arr + arr, arr, group="geometry")
+    suite.add("PointArray * 2 (100k)", operator.mul, arr, 2.0, group="geometry")
+    copy = suite.fixture(lambda: PointArray(arr.get().xs[:], arr.get().ys[:]))
+    suite.add("PointArray == PointArray (100k)", operator.eq, arr, copy, group="geometry")
+    suite.add("set of 100k slotted Points", set, slot_points, group="geometry")
@@ -0,0 +1,367 @@
+"""
+Streaming JSON and NDJSON: write and read records without holding them all.
+
+`demonstrate_stdlib_evolution` builds a dict and calls `json.dump`. With
+millions of records the dict, the encoder's output and (on the way back) the
+parsed document each need memory proportional to the whole payload. Here:
+
+- dump() writes a document whose values may be generators (or any other
+  iterator), at any depth: every iterator is written as a JSON array
+  element by element, so
+  `dump({"version": "3.14", "records": (make(i) for i in range(10**7))}, f)`
+  never materialises the records
+- NDJSONWriter writes one record per line, batching many records into each
+  `file.write`; read_ndjson() yields them back line by line
+- iter_array() yields the elements of a JSON array (top-level, or found by a
+  key path such as ("records",)) while reading the file in chunks
+
+Memory then depends on the size of one record, not of the file.
+memory_report() measures both with tracemalloc. write_ndjson() and
+read_ndjson() open their files through the current storage (see
+cheatsheet.storage).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable
+
+from cheatsheet.storage import DiskStorage, get_storage, using
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+BUFFER_SIZE = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _BufferedOut:
+    """Collect small strings and hand them to the file in large writes."""
+
+    def __init__(self, file: IO[str], buffer_size: int) -> None:
+        self.file = file
+        self.buffer_size = buffer_size
+        self.parts: list[str] = []
+        self.size = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.parts:
+            self.file.write("".join(self.parts))
+            self.parts.clear()
+            self.size = 0
+
+
+def _is_stream(value: Any) -> bool:
+    """Iterators: generators, map objects, iter(...), ...
+
+    Other iterables json.dump rejects (sets, for one) are left to the encoder,
+    which raises TypeError for them as json.dump does.
+    """
+    return isinstance(value, Iterator)
+
+
+def _has_stream(value: Any) -> bool:
+    """Whether `value` is a stream or holds one at any depth."""
+    if isinstance(value, dict):
+        return any(map(_has_stream, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_stream, value))
+    return _is_stream(value)
+
+
+def _key(key: Any, encode: Callable[[Any], str]) -> str:
+    """An object key as json.dump writes it: True -> "true", None -> "null", 1.5 -> "1.5"."""
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return encode(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _write_value(out: _BufferedOut, value: Any, encode: Callable[[Any], str]) -> int:
+    """Write one value, streaming any iterators nested in dicts and lists; return elements streamed."""
+    if not _has_stream(value):
+        out.write(encode(value))  # Plain data: one call into the C encoder
+        return 0
+    if _is_stream(value) or isinstance(value, (list, tuple)):
+        out.write("[")
+        count = 0
+        for count, item in enumerate(value, 1):
+            if count > 1:
+                out.write(",")
+            _write_value(out, item, encode)
+        out.write("]")
+        return count
+    out.write("{")
+    streamed = 0
+    for i, (key, item) in enumerate(value.items()):
+        out.write("," if i else "")
+        out.write(encode(_key(key, encode)))
+        out.write(":")
+        streamed += _write_value(out, item, encode)
+    out.write("}")
+    return streamed
+
+
+def dump(obj: Any, file: IO[str], *, buffer_size: int = BUFFER_SIZE,
+         default: Callable[[Any], Any] | None = None) -> int:
+    """Like json.dump, but generators are written as arrays element by element.
+
+    Returns the number of streamed elements.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=default).encode \
+        if default else _encode
+    out = _BufferedOut(file, buffer_size)
+    streamed = _write_value(out, obj, encode)
+    out.flush()
+    return streamed
+
+
+class NDJSONWriter:
+    """One JSON document per line, many lines per `file.write` call."""
+
+    def __init__(self, file: IO[str], *, batch_size: int = 1000) -> None:
+        self.file = file
+        self.batch_size = batch_size
+        self.count = 0
+        self._batch: list[str] = []
+
+    def write(self, record: Any) -> None:
+        self._batch.append(_encode(record))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.write(record)
+
+    def flush(self) -> None:
+        if self._batch:
+            self._batch.append("")  # So the join ends with a newline
+            self.file.write("\n".join(self._batch))
+            self.count += len(self._batch) - 1
+            self._batch.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def write_ndjson(path: str | os.PathLike, records: Iterable[Any], *, batch_size: int = 1000) -> int:
+    with get_storage().open(path, "w", encoding="utf-8") as file:
+        with NDJSONWriter(file, batch_size=batch_size) as writer:
+            writer.write_many(records)
+    return writer.count
+
+
+def read_ndjson(path: str | os.PathLike) -> Iterator[Any]:
+    """Yield one record per non-blank line."""
+    loads = _decoder.decode
+    with get_storage().open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.isspace():
+                yield loads(line)
+
+
+class _Reader:
+    """A text buffer over a file that parses JSON values as data arrives."""
+
+    def __init__(self, file: IO[str], chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what was consumed so the buffer stays around one chunk in size
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character ("" at end of input)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue  # Value cut off at the end of the buffer
+                raise
+            # A number may continue in the next chunk: "12" + "34", or "1." + "5"
+            # which parses as 1 followed by a stray "." (valid JSON never has a
+            # number character right after a value)
+            if (end == len(self.buffer) or self.buffer[end] in _NUMBER_CHARS) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(file: IO[str], path: tuple[str, ...] = (), *, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of the array at `path` (keys of nested objects).
+
+    Values before the array inside the enclosing objects are parsed and
+    skipped; the array elements are parsed one at a time.
+    """
+    reader = _Reader(file, chunk_size)
+    for key in path:
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                raise KeyError(key)  # Empty object
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                break
+            reader.value()  # Skip a sibling value
+            if reader.peek() != ",":
+                raise KeyError(key)
+            reader.pos += 1
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Expected ',' or ']'", reader.buffer, reader.pos - 1)
+
+
+def sample_record(i: int) -> dict[str, Any]:
+    return {"id": i, "name": f"user-{i}", "score": i * 0.5, "tags": ["alpha", "beta"], "active": i % 2 == 0}
+
+
+def memory_report(n: int = 100_000) -> str:
+    """Peak traced memory and time: json.dump/load versus the streaming paths."""
+    directory = tempfile.mkdtemp(prefix="cheatsheet-json-")
+    path = os.path.join(directory, "records.json")
+    ndjson_path = os.path.join(directory, "records.ndjson")
+
+    def dump_whole() -> None:
+        with open(path, "w") as file:
+            json.dump({"version": "3.14", "records": [sample_record(i) for i in range(n)]}, file)
+
+    def dump_streaming() -> None:
+        with open(path, "w") as file:
+            dump({"version": "3.14", "records": (sample_record(i) for i in range(n))}, file)
+
+    def load_whole() -> None:
+        with open(path) as file:
+            sum(1 for _ in json.load(file)["records"])
+
+    def load_streaming() -> None:
+        with open(path) as file:
+            sum(1 for _ in iter_array(file, ("records",)))
+
+    cases = (
+        ("json.dump(dict with list)", dump_whole),
+        ("dump(dict with generator)", dump_streaming),
+        ("json.load", load_whole),
+        ("iter_array(records)", load_streaming),
+        ("write_ndjson", lambda: write_ndjson(ndjson_path, (sample_record(i) for i in range(n)))),
+        ("read_ndjson", lambda: sum(1 for _ in read_ndjson(ndjson_path))),
+    )
+    import tracemalloc
+
+    lines = [f"{'':<28} {'time':>10} {'peak memory':>12}"]
+    # Files kept in memory would count towards the peaks, so measure on disk
+    try:
+        with using(DiskStorage()):
+            for name, func in cases:
+                tracemalloc.start()
+                began = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - began
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                lines.append(f"{name:<28} {elapsed * 1000:>7.0f} ms {peak / 1e6:>9.2f} MB")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return "\n".join(lines)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Throughput of 100k records each way (memory: see memory_report())."""
+    def setup() -> tuple[str, list[dict[str, Any]]]:
+        directory = tempfile.mkdtemp(prefix="cheatsheet-json-")
+        records = [sample_record(i) for i in range(100_000)]
+        dump_whole((directory, records))
+        write_ndjson(os.path.join(directory, "records.ndjson"), records)
+        return directory, records
+
+    def dump_whole(data: tuple[str, list]) -> None:
+        directory, records = data
+        with open(os.path.join(directory, "records.json"), "w") as file:
+            json.dump({"records": records}, file)
+
+    def dump_streaming(data: tuple[str, list]) -> None:
+        directory, records = data
+        with open(os.path.join(directory, "records.json"), "w") as file:
+            dump({"records": iter(records)}, file)
+
+    def load_whole(data: tuple[str, list]) -> int:
+        with open(os.path.join(data[0], "records.json")) as file:
+            return len(json.load(file)["records"])
+
+    def load_streaming(data: tuple[str, list]) -> int:
+        with open(os.path.join(data[0], "records.json")) as file:
+            return sum(1 for _ in iter_array(file, ("records",)))
+
+    def write_lines(data: tuple[str, list]) -> int:
+        return write_ndjson(os.path.join(data[0], "records.ndjson"), data[1])
+
+    def read_lines(data: tuple[str, list]) -> int:
+        return sum(1 for _ in read_ndjson(os.path.join(data[0], "records.ndjson")))
+
+    data = suite.fixture(setup, lambda data: shutil.rmtree(data[0], ignore_errors=True))
+    suite.add("json.dump (100k records)", dump_whole, data, group="json-stream")
+    suite.add("streaming dump (100k records)", dump_streaming, data, group="json-stream")
+    suite.add("write_ndjson (100k records)", write_lines, data, group="json-stream")
+    suite.add("json.load (100k records)", load_whole, data, group="json-stream")
+    suite.add("iter_array (100k records)", load_streaming, data, group="json-stream")
+    suite.add("read_ndjson (100k records)", read_lines, data, group="json-stream")
@@ -0,0 +1,164 @@
+"""
+A memory-mapped, zero-copy file reader.
+
+The tutorial's `FileManager` and `file_manager` return a text-mode file and
+the caller does `content = file.read()` only to look at `content[:10]`. On a
+multi-GB log that reads the whole file, holds it twice (bytes and decoded
+text) and decodes every byte. MappedFile maps the file instead:
+
+- slicing returns `memoryview`s into the mapping, nothing is copied
+- lines() finds newlines with `mmap.find` and yields views of each line
+- text(), head() and text_lines() decode only the bytes that are asked for
+
+Pages are loaded by the OS on first touch, so reading the head of a huge file
+costs a few pages no matter how big the file is.
+
+    with MappedFile("huge.log") as mapped:
+        print(mapped.head(10))
+        for line in mapped.lines():   # memoryview per line, no decoding
+            if line[:5] == b"ERROR":
+                print(bytes(line).decode())
+
+The bytes come from the current storage (see cheatsheet.storage): on disk
+that is an mmap; on a MemoryStorage the views point straight into the stored
+bytes, which is just as zero-copy.
+
+An mmap cannot be closed while memoryviews of it are alive, so a view kept
+past close() keeps the mapping alive until it is released; call `bytes(view)`
+to keep a copy instead.
+"""
+
+import codecs
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Iterator
+
+from cheatsheet.storage import Storage, get_storage
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+
+class MappedFile:
+    """A read-only mapping of a file with bytes, line and text access."""
+
+    def __init__(self, path: str | os.PathLike, encoding: str = "utf-8", *, storage: Storage | None = None) -> None:
+        self.path = os.fspath(path)
+        self.encoding = encoding
+        data = (storage or get_storage()).buffer(self.path)
+        self._map = data if len(data) else None
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b"")
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: int | slice) -> int | memoryview:
+        """Bytes by index, or a zero-copy view for a slice."""
+        return self._view[index]
+
+    @property
+    def view(self) -> memoryview:
+        return self._view
+
+    def text(self, start: int = 0, stop: int | None = None, errors: str = "strict") -> str:
+        """Decode bytes [start, stop) only."""
+        return str(self._view[start:stop], self.encoding, errors)
+
+    def head(self, chars: int) -> str:
+        """The first `chars` characters, decoding as few bytes as possible."""
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        text, position, step = "", 0, max(chars, 64)
+        # Grow the window until enough characters are decoded; a character cut in
+        # half at the window edge is held back by the incremental decoder
+        while len(text) < chars and position < len(self._view):
+            chunk = self._view[position:position + step]
+            text += decoder.decode(chunk, final=position + len(chunk) >= len(self._view))
+            position += len(chunk)
+            step *= 2
+        return text[:chars]
+
+    def lines(self, keepends: bool = True) -> Iterator[memoryview]:
+        """Yield each line as a view into the mapping."""
+        view, size = self._view, len(self._view)
+        if self._map is None:
+            return
+        find = self._map.find
+        start = 0
+        while start < size:
+            end = find(b"\n", start)
+            if end < 0:
+                yield view[start:]
+                return
+            yield view[start:end + 1 if keepends else end]
+            start = end + 1
+
+    def text_lines(self, keepends: bool = False) -> Iterator[str]:
+        """Decoded lines; each line is decoded only when it is reached."""
+        encoding = self.encoding
+        for line in self.lines(keepends):
+            yield str(line, encoding)
+
+    def count_lines(self, chunk_size: int = 1 << 20) -> int:
+        """Number of lines, counted in C one bounded chunk at a time."""
+        if self._map is None:
+            return 0
+        size, mapping = len(self._map), self._map
+        count = sum(mapping[i:i + chunk_size].count(b"\n") for i in range(0, size, chunk_size))
+        return count + (mapping[size - 1] != 10)  # A last line without "\n"
+
+    def read(self) -> str:
+        """The whole file decoded, like `file.read()` (this does copy)."""
+        return self.text()
+
+    def close(self) -> None:
+        self._view.release()
+        close = getattr(self._map, "close", None)  # bytes from a MemoryStorage need no closing
+        if close is not None:
+            try:
+                close()
+            except BufferError:
+                pass  # A caller still holds a view; the mapping is freed with it
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def _read_head(path: str) -> str:
+    with open(path, "r") as file:
+        return file.read()[:10]
+
+
+def _mapped_head(path: str) -> str:
+    with MappedFile(path) as mapped:
+        return mapped.head(10)
+
+
+def _count_text_lines(path: str) -> int:
+    with open(path, "r") as file:
+        return sum(1 for _ in file)
+
+
+def _count_mapped_lines(path: str) -> int:
+    with MappedFile(path) as mapped:
+        return mapped.count_lines()
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Head and line count of a 16 MB log: text-mode read versus the mapping."""
+    def setup() -> str:
+        path = os.path.join(tempfile.mkdtemp(prefix="cheatsheet-mapped-"), "big.log")
+        line = "2025-01-01T00:00:00 INFO request handled in 12 ms by worker-7\n"
+        with open(path, "w") as file:
+            file.write(line * (16 * 1024 * 1024 // len(line)))
+        return path
+
+    path = suite.fixture(setup, lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True))
+    suite.add("open().read()[:10] (16 MB)", _read_head, path, group="mapped")
+    suite.add("MappedFile.head(10) (16 MB)", _mapped_head, path, group="mapped")
+    suite.add("count lines, text iteration (16 MB)", _count_text_lines, path, group="mapped")
+    suite.add("count lines, MappedFile (16 MB)", _count_mapped_lines, path, group="mapped")
@@ -0,0 +1,226 @@
+"""
+A dense float matrix stored in one flat, row-major `array('d')`.
+
+`matrix_multiply` in the tutorial walks `list[list[float]]` with
+`result[i][j] += a[i][k] * b[k][j]`: two list lookups per operand and a new
+float object for every partial sum. Matrix keeps all values unboxed in a
+single buffer (element (i, j) lives at i * cols + j) and multiplies with one
+of several strategies:
+
+- "ikj":        i-k-j loop order, streaming over contiguous rows of B
+- "transposed": transpose B once, then each entry is one dot product of two
+                contiguous rows computed in C (math.sumprod / map)
+- "tiled":      the transposed kernel applied to k-blocks of TILE_SIZE, so
+                the row segments being combined stay hot in cache
+- "numpy":      hand the buffers to NumPy (used automatically when installed)
+
+The tutorial's `matrix_multiply` remains the reference implementation that
+these results are checked against.
+"""
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from cheatsheet.compat import load_numpy
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+# Square-ish sizes from which "auto" switches from the transposed to the tiled kernel
+TILE_THRESHOLD = 256
+
+# Edge length of the blocks used by the tiled kernel
+TILE_SIZE = 64
+
+METHODS = ("auto", "ikj", "transposed", "tiled", "numpy")
+
+if hasattr(math, "sumprod"):  # Python 3.12+
+    _dot = math.sumprod
+else:
+    def _dot(p, q):
+        return sum(map(operator.mul, p, q))
+
+
+class Matrix:
+    """A rows x cols matrix of floats in a flat row-major buffer.
+
+    `data` is always copied, so the matrix never shares a buffer with the caller.
+    """
+
+    __slots__ = ("rows", "cols", "data")
+
+    def __init__(self, rows: int, cols: int, data: Iterable[float] | None = None) -> None:
+        if rows < 0 or cols < 0:
+            raise ValueError("Matrix dimensions must be non-negative")
+        self.rows = rows
+        self.cols = cols
+        if data is None:
+            self.data = array("d", bytes(8 * rows * cols))  # Zero-filled without a Python loop
+        else:
+            self.data = array("d", data)  # A plain memcpy when data is already an array('d')
+            if len(self.data) != rows * cols:
+                raise ValueError(f"Expected {rows * cols} values, got {len(self.data)}")
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[float]]) -> "Matrix":
+        """Build a matrix from nested lists such as matrix_multiply's inputs."""
+        n_rows = len(rows)
+        n_cols = len(rows[0]) if n_rows else 0
+        data = array("d")
+        for row in rows:
+            if len(row) != n_cols:
+                raise ValueError("All rows must have the same length")
+            data.extend(row)
+        return cls(n_rows, n_cols, data)
+
+    @classmethod
+    def identity(cls, n: int) -> "Matrix":
+        m = cls(n, n)
+        m.data[::n + 1] = array("d", repeat(1.0, n))
+        return m
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.rows, self.cols
+
+    def to_rows(self) -> list[list[float]]:
+        """Convert back to nested lists."""
+        data, cols = self.data, self.cols
+        return [data[i * cols:(i + 1) * cols].tolist() for i in range(self.rows)]
+
+    def row(self, i: int) -> memoryview:
+        """Row i as a zero-copy view into the buffer."""
+        start = i * self.cols
+        return memoryview(self.data)[start:start + self.cols]
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        i, j = index
+        return self.data[i * self.cols + j]
+
+    def __setitem__(self, index: tuple[int, int], value: float) -> None:
+        i, j = index
+        self.data[i * self.cols + j] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self.data == other.data
+
+    def __repr__(self) -> str:
+        return f"Matrix({self.to_rows()})"
+
+    def isclose(self, other: "Matrix", rel_tol: float = 1e-9, abs_tol: float = 0.0) -> bool:
+        """Element-wise math.isclose; summation order differs between methods."""
+        return self.shape == other.shape and all(
+            math.isclose(x, y, rel_tol=rel_tol, abs_tol=abs_tol) for x, y in zip(self.data, other.data)
+        )
+
+    def transpose(self) -> "Matrix":
+        rows, cols, data = self.rows, self.cols, self.data
+        out = array("d", bytes(8 * rows * cols))
+        for j in range(cols):
+            # Column j of self becomes row j of the result
+            out[j * rows:(j + 1) * rows] = data[j::cols]
+        return Matrix(cols, rows, out)
+
+    def __matmul__(self, other: "Matrix") -> "Matrix":
+        return self.matmul(other)
+
+    def matmul(self, other: "Matrix", method: str = "auto") -> "Matrix":
+        """Multiply two matrices with the chosen strategy (see module docstring)."""
+        if self.cols != other.rows:
+            raise ValueError("Incompatible matrix dimensions")
+        if method == "auto":
+            method = choose_method(self.rows, self.cols, other.cols)
+        if method == "ikj":
+            return _matmul_ikj(self, other)
+        if method == "transposed":
+            return _matmul_transposed(self, other)
+        if method == "tiled":
+            return _matmul_tiled(self, other)
+        if method == "numpy":
+            return _matmul_numpy(self, other)
+        raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+
+
+def choose_method(n: int, m: int, p: int) -> str:
+    """Pick the fastest available kernel for an (n x m) @ (m x p) product."""
+    if load_numpy() is not None:
+        return "numpy"
+    if min(n, m, p) >= TILE_THRESHOLD:
+        return "tiled"
+    return "transposed"
+
+
+def _matmul_ikj(a: Matrix, b: Matrix) -> Matrix:
+    n, m, p = a.rows, a.cols, b.cols
+    a_data, b_data = a.data, b.data
+    b_rows = [b_data[k * p:(k + 1) * p].tolist() for k in range(m)]
+    out = array("d")
+    for i in range(n):
+        row = [0.0] * p
+        # No skipping of zero a_ik: 0 * inf and 0 * nan must still reach the result
+        for a_ik, b_row in zip(a_data[i * m:(i + 1) * m], b_rows):
+            row = [r + a_ik * x for r, x in zip(row, b_row)]
+        out.extend(row)
+    return Matrix(n, p, out)
+
+
+def _matmul_transposed(a: Matrix, b: Matrix) -> Matrix:
+    n, m, p = a.rows, a.cols, b.cols
+    a_data, bt_data = a.data, b.transpose().data
+    # Rows are unpacked to lists once so the dot products do not re-box floats
+    b_rows = [bt_data[j * m:(j + 1) * m].tolist() for j in range(p)]
+    out = array("d")
+    for i in range(n):
+        a_row = a_data[i * m:(i + 1) * m].tolist()
+        out.extend([_dot(a_row, b_row) for b_row in b_rows])
+    return Matrix(n, p, out)
+
+
+def _matmul_tiled(a: Matrix, b: Matrix, tile: int = TILE_SIZE) -> Matrix:
+    n, m, p = a.rows, a.cols, b.cols
+    a_data, bt_data = a.data, b.transpose().data
+    out = array("d", bytes(8 * n * p))
+    for kk in range(0, m, tile):
+        k_end = min(kk + tile, m)
+        # Column segments of B for this k-block, reused by every row of A
+        b_segments = [bt_data[j * m + kk:j * m + k_end].tolist() for j in range(p)]
+        for ii in range(0, n, tile):
+            i_end = min(ii + tile, n)
+            a_segments = [a_data[i * m + kk:i * m + k_end].tolist() for i in range(ii, i_end)]
+            for jj in range(0, p, tile):
+                j_end = min(jj + tile, p)
+                block = b_segments[jj:j_end]
+                for i, a_segment in enumerate(a_segments, ii):
+                    base = i * p + jj
+                    partial = [_dot(a_segment, b_segment) for b_segment in block]
+                    for offset, value in enumerate(partial):
+                        out[base + offset] += value
+    return Matrix(n, p, out)
+
+
+def _matmul_numpy(a: Matrix, b: Matrix) -> Matrix:
+    np = load_numpy()
+    if np is None:
+        raise RuntimeError("The numpy method requires NumPy to be installed")
+    x = np.frombuffer(a.data, dtype=np.float64).reshape(a.rows, a.cols)
+    y = np.frombuffer(b.data, dtype=np.float64).reshape(b.rows, b.cols)
+    out = array("d")
+    out.frombytes((x @ y).tobytes())
+    return Matrix(a.rows, b.cols, out)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Register each kernel next to the tutorial's matrix_multiply(40x40)."""
+    small = Matrix.from_rows([[float(i * 40 + j) for j in range(40)] for i in range(40)])
+    for method in ("ikj", "transposed", "tiled"):
+        suite.add(f"Matrix.matmul(40x40, {method})", small.matmul, small, method, group="matrix")
+    large = suite.fixture(lambda: Matrix.from_rows([[float((i * 7 + j) % 13) for j in range(200)] for i in range(200)]))
+    for method in ("ikj", "transposed", "tiled"):
+        suite.add(f"Matrix.matmul(200x200, {method})", Matrix.matmul, large, large, method, group="matrix")
+    if load_numpy() is not None:
+        suite.add("Matrix.matmul(200x200, numpy)", Matrix.matmul, large, large, "numpy", group="matrix")
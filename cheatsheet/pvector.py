@@ -0,0 +1,276 @@
+"""
+A persistent vector: immutable, with cheap append, update and slicing.
+
+The functional section's `add_to_tuple(t, item)` returns `t + (item,)`,
+which copies the whole tuple: building an n-item tuple one item at a time
+copies about n²/2 items, and every snapshot of large state is a full copy.
+PersistentVector is the 32-way trie used by Clojure and Scala:
+
+- items live in leaves of 32, under internal nodes of 32 children, so a
+  million items are only four levels deep
+- append(), set() and v[i] touch one path from the root, O(log32 n); the
+  new vector shares every other node with the old one, which is unchanged
+- the last (up to) 32 items sit in a separate tail, so most appends only
+  copy that small tuple
+- v[a:b] is an O(1) view over the same trie; a slice with a step is copied
+
+    v = PersistentVector.from_iterable(range(1_000_000))
+    w = v.append(-1).set(0, "first")           # v is unchanged
+    w[0], w[-1], len(w)                        # ("first", -1, 1000001)
+    tuple(w[10:20])                            # (10, 11, ..., 19)
+
+Nodes are plain tuples. A slice keeps the whole trie it was cut from
+alive; use PersistentVector.from_iterable(v[a:b]) to release it.
+"""
+
+import operator
+import random
+from collections.abc import Sequence
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+BITS = 5
+WIDTH = 1 << BITS  # Children per node and items per leaf
+MASK = WIDTH - 1
+
+
+def _tail_offset(count: int) -> int:
+    """Index of the first item held in the tail of a trie with `count` items."""
+    return 0 if count < WIDTH else ((count - 1) >> BITS) << BITS
+
+
+def _new_path(level: int, node: tuple) -> tuple:
+    while level:
+        node = (node,)
+        level -= BITS
+    return node
+
+
+class PersistentVector(Sequence):
+    """An immutable sequence backed by a 32-way trie plus a tail."""
+
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_start", "_len")
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        other = items if isinstance(items, PersistentVector) else PersistentVector.from_iterable(items)
+        self._count, self._shift, self._root, self._tail = other._count, other._shift, other._root, other._tail
+        self._start, self._len = other._start, other._len
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: tuple, tail: tuple, start: int, length: int) -> "PersistentVector":
+        vector = object.__new__(cls)
+        vector._count, vector._shift, vector._root, vector._tail = count, shift, root, tail
+        vector._start, vector._len = start, length
+        return vector
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> "PersistentVector":
+        """Build bottom-up in O(n): leaves of 32 items, then each level above."""
+        items = items if isinstance(items, tuple) else tuple(items)
+        count = len(items)
+        tail_offset = _tail_offset(count)
+        nodes: list[tuple] = [items[i:i + WIDTH] for i in range(0, tail_offset, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [tuple(nodes[i:i + WIDTH]) for i in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        return cls._make(count, shift, tuple(nodes), items[tail_offset:], 0, count)
+
+    # ----- reading -----
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _leaf(self, i: int) -> tuple:
+        """The leaf (or the tail) holding trie index `i`."""
+        if i >= _tail_offset(self._count):
+            return self._tail
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(i >> level) & MASK]
+        return node
+
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("PersistentVector index out of range")
+        return self._start + i
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                return PersistentVector.from_iterable(map(self.__getitem__, range(start, stop, step)))
+            # A view: same trie, narrower window
+            return self._make(self._count, self._shift, self._root, self._tail,
+                              self._start + start, max(0, stop - start))
+        i = self._index(index)
+        return self._leaf(i)[i & MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._chunks())
+
+    def _chunks(self) -> Iterator[tuple]:
+        """The items as consecutive leaf slices, one trie walk per 32 items."""
+        start, end = self._start, self._start + self._len
+        base = start & ~MASK
+        while base < end:
+            leaf = self._leaf(base)
+            yield leaf[max(start - base, 0):end - base]
+            base += WIDTH
+
+    def __reversed__(self) -> Iterator[Any]:
+        for chunk in reversed(list(self._chunks())):
+            yield from reversed(chunk)
+
+    def to_tuple(self) -> tuple:
+        return tuple(self)
+
+    # ----- "changing" (every method returns a new vector) -----
+
+    def append(self, item: Any) -> "PersistentVector":
+        end = self._start + self._len
+        if end < self._count:
+            # A slice that stopped short of its trie: write past its end
+            vector = self._set(end, item)
+        else:
+            vector = self._push(item)
+        vector._start, vector._len = self._start, self._len + 1
+        return vector
+
+    def _push(self, item: Any) -> "PersistentVector":
+        count, shift, root, tail = self._count, self._shift, self._root, self._tail
+        if count - _tail_offset(count) < WIDTH:
+            return self._make(count + 1, shift, root, tail + (item,), 0, 0)
+        # The tail is full: move it into the trie and start a new one
+        if (count >> BITS) > (1 << shift):
+            root, shift = (root, _new_path(shift, tail)), shift + BITS  # The root itself is full
+        else:
+            root = self._push_tail(count, shift, root, tail)
+        return self._make(count + 1, shift, root, (item,), 0, 0)
+
+    @staticmethod
+    def _push_tail(count: int, level: int, parent: tuple, leaf: tuple) -> tuple:
+        sub = ((count - 1) >> level) & MASK
+        if level == BITS:
+            child = leaf
+        elif sub < len(parent):
+            child = PersistentVector._push_tail(count, level - BITS, parent[sub], leaf)
+        else:
+            child = _new_path(level - BITS, leaf)
+        return parent[:sub] + (child,) + parent[sub + 1:]
+
+    def set(self, index: int, item: Any) -> "PersistentVector":
+        """A vector with `item` at `index` (like `v[index] = item` on a list)."""
+        vector = self._set(self._index(index), item)
+        vector._start, vector._len = self._start, self._len
+        return vector
+
+    def _set(self, i: int, item: Any) -> "PersistentVector":
+        if i >= _tail_offset(self._count):
+            j = i & MASK
+            tail = self._tail[:j] + (item,) + self._tail[j + 1:]
+            return self._make(self._count, self._shift, self._root, tail, 0, 0)
+        return self._make(self._count, self._shift, self._assoc(self._shift, self._root, i, item), self._tail, 0, 0)
+
+    @staticmethod
+    def _assoc(level: int, node: tuple, i: int, item: Any) -> tuple:
+        # Copy only the path from the root to the leaf
+        if level == 0:
+            j = i & MASK
+            return node[:j] + (item,) + node[j + 1:]
+        sub = (i >> level) & MASK
+        return node[:sub] + (PersistentVector._assoc(level - BITS, node[sub], i, item),) + node[sub + 1:]
+
+    def extend(self, items: Iterable[Any]) -> "PersistentVector":
+        vector = self
+        for item in items:
+            vector = vector.append(item)
+        return vector
+
+    def __add__(self, other: Iterable[Any]) -> "PersistentVector":
+        if not isinstance(other, (PersistentVector, tuple, list)):
+            return NotImplemented
+        return self.extend(other)
+
+    # ----- comparison -----
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentVector):
+            return NotImplemented
+        if self._len != other._len:
+            return False
+        if (self._start - other._start) & MASK == 0:
+            # Leaves line up: compare whole chunks, tuple against tuple
+            return all(map(operator.eq, self._chunks(), other._chunks()))
+        return all(map(operator.eq, self, other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        shown = ", ".join(map(repr, islice(self, 5)))
+        return f"PersistentVector([{shown}{', ...' if self._len > 5 else ''}], n={self._len})"
+
+
+EMPTY = PersistentVector.from_iterable(())
+
+
+def _add_to_tuple(t: tuple, item: Any) -> tuple:
+    """The functional section's add_to_tuple."""
+    return t + (item,)
+
+
+def _build_tuple(n: int) -> tuple:
+    t: tuple = ()
+    for i in range(n):
+        t = _add_to_tuple(t, i)
+    return t
+
+
+def _build_vector(n: int) -> PersistentVector:
+    v = EMPTY
+    for i in range(n):
+        v = v.append(i)
+    return v
+
+
+def _snapshots_tuple(t: tuple, updates: list[int]) -> list[tuple]:
+    """One full copy per changed item: the tuple way to keep every version."""
+    versions = []
+    for i in updates:
+        t = t[:i] + (-1,) + t[i + 1:]
+        versions.append(t)
+    return versions
+
+
+def _snapshots_vector(v: PersistentVector, updates: list[int]) -> list[PersistentVector]:
+    versions = []
+    for i in updates:
+        v = v.set(i, -1)
+        versions.append(v)
+    return versions
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Appending one item at a time, keeping 100 versions of 100k items, and access."""
+    suite.add("add_to_tuple x20k", _build_tuple, 20_000, group="pvector")
+    suite.add("PersistentVector.append x20k", _build_vector, 20_000, group="pvector")
+    suite.add("PersistentVector.append x200k", _build_vector, 200_000, group="pvector")
+    big_tuple = suite.fixture(lambda: tuple(range(100_000)))
+    big = suite.fixture(lambda: PersistentVector.from_iterable(big_tuple.get()))
+    updates = random.Random(1).sample(range(100_000), 100)
+    suite.add("100 tuple versions (100k items)", _snapshots_tuple, big_tuple, updates, group="pvector")
+    suite.add("100 PersistentVector versions (100k items)", _snapshots_vector, big, updates, group="pvector")
+    rng = random.Random(2)
+    indexes = [rng.randrange(100_000) for _ in range(10_000)]
+    suite.add("tuple[i] x10k", lambda items: [items[i] for i in indexes], big_tuple, group="pvector")
+    suite.add("PersistentVector[i] x10k", lambda items: [items[i] for i in indexes], big, group="pvector")
+    suite.add("PersistentVector.from_iterable (100k)", PersistentVector.from_iterable, big_tuple, group="pvector")
+    suite.add("PersistentVector to tuple (100k)", PersistentVector.to_tuple, big, group="pvector")
+    suite.add("PersistentVector slice + to tuple (50k)", lambda big: big[25_000:75_000].to_tuple(), big,
+              group="pvector")
@@ -0,0 +1,368 @@
+"""
+Fixed-width binary record files for Person- and Point-like objects.
+
+The tutorial's classes can only be saved as text or JSON, and loading means
+parsing every record again: millions of points cost seconds at startup. A
+record file stores each object as one `struct`-packed record of fixed size
+behind a small header, so:
+
+- record i is at `header_size + i * record_size`: random access is O(1) and
+  reads only that record
+- writes only ever append, so readers never see a record change under them
+  (a record torn by a crash is not counted, and the next writer cuts it off)
+- loading maps the file (through the current storage, see
+  cheatsheet.storage) and unpacks all records in one `iter_unpack` pass,
+  straight into objects (load) or into one list/array per field (columns)
+
+The header holds a magic number, the format version, the record size and the
+schema ("Point v1: x:d y:d"), and opening a file with a different schema
+fails instead of misreading it.
+
+    with RecordWriter("points.rec", POINT) as writer:
+        writer.extend(points)                 # Objects with .x and .y, or tuples
+    with RecordFile("points.rec", POINT) as records:
+        records[123_456]                      # (x, y), read in O(1)
+        points = records.load(Point)          # Point(x, y) for every record
+        xs = records.columns()["x"]           # array('d') of all x values
+
+Text fields ("32s") are UTF-8, padded with NUL bytes; longer values raise
+ValueError instead of being cut silently.
+"""
+
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array, typecodes
+from itertools import repeat, starmap
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Sequence
+
+from cheatsheet.storage import Storage, get_storage
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+MAGIC = b"CSRF"
+FORMAT_VERSION = 1
+BATCH_SIZE = 4096
+
+# magic, format version, header size, record size, schema length
+_PREAMBLE = struct.Struct("<4sHHII")
+_HEADER_ALIGN = 64
+
+
+class Schema:
+    """Field names and struct codes of one record type, plus a version."""
+
+    def __init__(self, name: str, fields: Sequence[tuple[str, str]], version: int = 1) -> None:
+        self.name = name
+        self.fields = tuple(fields)
+        self.version = version
+        self.names = tuple(field for field, _ in self.fields)
+        # "<": standard sizes and no padding, so the layout is the same everywhere
+        self.struct = struct.Struct("<" + "".join(code for _, code in self.fields))
+        self.text_fields = tuple(i for i, (_, code) in enumerate(self.fields) if code.endswith("s"))
+        self._text_sizes = {i: struct.calcsize(self.fields[i][1]) for i in self.text_fields}
+        self._get = attrgetter(*self.names)
+
+    @property
+    def record_size(self) -> int:
+        return self.struct.size
+
+    def describe(self) -> str:
+        """The schema as stored in the header, e.g. "Point v1: x:d y:d"."""
+        return f"{self.name} v{self.version}: " + " ".join(f"{name}:{code}" for name, code in self.fields)
+
+    def pack(self, record: Any) -> bytes:
+        """Pack an object with the schema's attributes, or a tuple of values."""
+        values = record if isinstance(record, tuple) else self._get(record)
+        if len(self.names) == 1 and not isinstance(record, tuple):
+            values = (values,)
+        if self.text_fields:
+            values = list(values)
+            for i in self.text_fields:
+                encoded = values[i].encode()
+                if len(encoded) > self._text_sizes[i]:
+                    raise ValueError(f"{self.names[i]}={values[i]!r} does not fit {self.fields[i][1]}")
+                values[i] = encoded
+        try:
+            return self.struct.pack(*values)
+        except struct.error as error:
+            raise ValueError(f"Cannot pack {record!r} as {self.describe()}: {error}") from None
+
+    def unpack(self, values: tuple) -> tuple:
+        """Decode the text fields of a raw unpacked tuple."""
+        if not self.text_fields:
+            return values
+        values = list(values)
+        for i in self.text_fields:
+            values[i] = values[i].rstrip(b"\0").decode()
+        return tuple(values)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Schema) and other.describe() == self.describe()
+
+    def __hash__(self) -> int:
+        return hash(self.describe())
+
+    def __repr__(self) -> str:
+        return f"Schema({self.describe()!r})"
+
+
+PERSON = Schema("Person", (("name", "32s"), ("age", "i")))
+POINT = Schema("Point", (("x", "d"), ("y", "d")))
+
+
+def _header(schema: Schema) -> bytes:
+    text = schema.describe().encode()
+    size = _PREAMBLE.size + len(text)
+    size += -size % _HEADER_ALIGN  # Keep records aligned for array() and memoryview.cast()
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, size, schema.record_size, len(text))
+    return (preamble + text).ljust(size, b"\0")
+
+
+def _read_header(data: Any, path: str, schema: Schema | None) -> tuple[int, int, str]:
+    """(header size, record size, schema text), checked against `schema`."""
+    if len(data) < _PREAMBLE.size:
+        raise ValueError(f"{path}: too short for a record file")
+    magic, version, header_size, record_size, text_size = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a record file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: record format version {version}, expected {FORMAT_VERSION}")
+    text = bytes(data[_PREAMBLE.size:_PREAMBLE.size + text_size]).decode()
+    if schema is not None and (text != schema.describe() or record_size != schema.record_size):
+        raise ValueError(f"{path}: schema {text!r} does not match {schema.describe()!r}")
+    return header_size, record_size, text
+
+
+class RecordWriter:
+    """Append records to a file, creating it (with its header) if needed."""
+
+    def __init__(self, path: str | os.PathLike, schema: Schema, *, storage: Storage | None = None) -> None:
+        self.path = os.fspath(path)
+        self.schema = schema
+        self.count = 0  # Records appended by this writer
+        storage = storage or get_storage()
+        size = storage.size(self.path) if storage.exists(self.path) else 0
+        if size:
+            with storage.open(self.path, "r+b") as file:
+                header_size = _read_header(file.read(_PREAMBLE.size + len(schema.describe().encode())),
+                                           self.path, schema)[0]
+                torn = (size - header_size) % schema.record_size
+                if torn:
+                    file.truncate(size - torn)  # Drop a record cut short by a crash, so appends stay aligned
+        else:
+            storage.write_bytes(self.path, _header(schema))
+        self._file = storage.open(self.path, "ab")
+
+    def append(self, record: Any) -> None:
+        self._file.write(self.schema.pack(record))
+        self.count += 1
+
+    def extend(self, records: Iterable[Any], batch_size: int = BATCH_SIZE) -> None:
+        """Append many records, packed in batches so each batch is one write."""
+        pack = self.schema.pack
+        batch: list[bytes] = []
+        for record in records:
+            batch.append(pack(record))
+            if len(batch) >= batch_size:
+                self._file.write(b"".join(batch))
+                self.count += len(batch)
+                batch.clear()
+        if batch:
+            self._file.write(b"".join(batch))
+            self.count += len(batch)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+class RecordFile:
+    """Read-only, mapped access to a record file.
+
+    Without a schema, the file's own schema is reported in `schema_text` and
+    records come back as raw tuples (text fields undecoded).
+    """
+
+    def __init__(self, path: str | os.PathLike, schema: Schema | None = None, *,
+                 storage: Storage | None = None) -> None:
+        self.path = os.fspath(path)
+        self.schema = schema
+        self._data = (storage or get_storage()).buffer(self.path)
+        self._header_size, self.record_size, self.schema_text = _read_header(self._data, self.path, schema)
+        self._struct = schema.struct if schema else None
+        # A partly written last record (a crash mid-append) is not counted
+        self._count = (len(self._data) - self._header_size) // self.record_size
+        self._view = memoryview(self._data)[self._header_size:self._header_size + self._count * self.record_size]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, index: int) -> tuple:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        if self._struct is None:
+            return (bytes(self._view[index * self.record_size:(index + 1) * self.record_size]),)
+        return self.schema.unpack(self._struct.unpack_from(self._view, index * self.record_size))
+
+    def __getitem__(self, index: int | slice) -> tuple | list[tuple]:
+        """Record `index` as a tuple, read in O(1); a slice gives a list."""
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._count))]
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[tuple]:
+        if self._struct is None:
+            raise TypeError("Iterating a record file needs its schema")
+        unpack = self.schema.unpack
+        records = self._struct.iter_unpack(self._view)
+        return map(unpack, records) if self.schema.text_fields else records
+
+    def load(self, factory: Callable[..., Any]) -> list[Any]:
+        """Every record as `factory(*fields)`, e.g. `load(Point)`."""
+        if self._struct is None:
+            raise TypeError("Loading a record file needs its schema")
+        if not self.schema.text_fields:
+            return list(starmap(factory, self._struct.iter_unpack(self._view)))
+        # Decode text a column at a time, then call factory with one value per column
+        return list(map(factory, *self._columns()))
+
+    def _columns(self) -> list[Any]:
+        columns = list(zip(*self._struct.iter_unpack(self._view))) or [()] * len(self.schema.names)
+        for i in self.schema.text_fields:
+            columns[i] = [text.decode() for text in map(bytes.rstrip, columns[i], repeat(b"\0"))]
+        return columns
+
+    def columns(self) -> dict[str, Any]:
+        """One sequence per field: an array when all fields share a numeric type, else lists."""
+        if self._struct is None:
+            raise TypeError("Columns need the file's schema")
+        codes = {code for _, code in self.schema.fields}
+        code = codes.pop() if len(codes) == 1 else ""
+        if code and code in typecodes and array(code).itemsize == struct.calcsize("<" + code):
+            # Records are then just a flat array of one type: no per-record unpacking
+            flat = array(code)
+            flat.frombytes(self._view)
+            if sys.byteorder == "big":
+                flat.byteswap()  # The file is little-endian
+            width = len(self.schema.fields)
+            return {name: flat[i::width] for i, name in enumerate(self.schema.names)}
+        return {name: list(column) for name, column in zip(self.schema.names, self._columns())}
+
+    def close(self) -> None:
+        self._view.release()
+        close = getattr(self._data, "close", None)
+        if close is not None:
+            try:
+                close()
+            except BufferError:
+                pass  # A caller still holds a view; the mapping is freed with it
+
+    def __enter__(self) -> "RecordFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def write_records(path: str | os.PathLike, schema: Schema, records: Iterable[Any], **options: Any) -> int:
+    """Append `records` to `path`; return how many were written."""
+    with RecordWriter(path, schema, **options) as writer:
+        writer.extend(records)
+    return writer.count
+
+
+def load_records(path: str | os.PathLike, schema: Schema, factory: Callable[..., Any], **options: Any) -> list[Any]:
+    with RecordFile(path, schema, **options) as records:
+        return records.load(factory)
+
+
+class _Person:
+    """Stand-in for the tutorial's Person (name, age)."""
+
+    def __init__(self, name: str, age: int) -> None:
+        self.name = name
+        self.age = age
+
+
+class _Point:
+    """Stand-in for the tutorial's Point (x, y)."""
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+def _dump_json(path: str, objects: list[Any]) -> None:
+    with open(path, "w") as file:
+        json.dump([vars(obj) for obj in objects], file)
+
+
+def _load_json(path: str, factory: Callable[..., Any]) -> list[Any]:
+    with open(path) as file:
+        return [factory(**fields) for fields in json.load(file)]
+
+
+def _columns(path: str, schema: Schema) -> dict[str, Any]:
+    with RecordFile(path, schema) as records:
+        return records.columns()
+
+
+def _rewrite(path: str, schema: Schema, records: list[Any]) -> int:
+    if os.path.exists(path):
+        os.remove(path)
+    return write_records(path, schema, records)
+
+
+def _random_access(path: str, schema: Schema, indexes: list[int]) -> int:
+    with RecordFile(path, schema) as records:
+        return sum(1 for i in indexes if records[i])
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Loading 100k Points and Persons from JSON versus a record file."""
+    n = 100_000
+    samples = {
+        "Point": (POINT, _Point, lambda i: _Point(i * 0.5, -i * 0.25)),
+        "Person": (PERSON, _Person, lambda i: _Person(f"person-{i}", i % 100)),
+    }
+    indexes = [i * 7919 % n for i in range(1000)]
+
+    def setup(schema: Schema, make: Callable[[int], Any]) -> tuple[str, list[Any]]:
+        """(base path of the sample files, the objects); base + ".json" and base + ".rec" exist."""
+        base = os.path.join(tempfile.mkdtemp(prefix="cheatsheet-records-"), "sample")
+        objects = [make(i) for i in range(n)]
+        _dump_json(base + ".json", objects)
+        write_records(base + ".rec", schema, objects)
+        return base, objects
+
+    for name, (schema, factory, make) in samples.items():
+        data = suite.fixture(lambda schema=schema, make=make: setup(schema, make),
+                             lambda data: shutil.rmtree(os.path.dirname(data[0]), ignore_errors=True))
+        suite.add(f"json.load -> {name} (100k)", lambda data, factory: _load_json(data[0] + ".json", factory),
+                  data, factory, group="records")
+        suite.add(f"RecordFile.load -> {name} (100k)",
+                  lambda data, schema, factory: load_records(data[0] + ".rec", schema, factory),
+                  data, schema, factory, group="records")
+        suite.add(f"RecordFile.columns, {name} (100k)", lambda data, schema: _columns(data[0] + ".rec", schema),
+                  data, schema, group="records")
+        suite.add(f"1000 random records, {name}",
+                  lambda data, schema: _random_access(data[0] + ".rec", schema, indexes), data, schema, group="records")
+        suite.add(f"json.dump, {name} (100k)", lambda data: _dump_json(data[0] + ".json", data[1]),
+                  data, group="records")
+        suite.add(f"write_records, {name} (100k)", lambda data, schema: _rewrite(data[0] + "-new.rec", schema, data[1]),
+                  data, schema, group="records")
@@ -0,0 +1,214 @@
+"""
+Chunked, parallel reductions over integer ranges.
+
+`cpu_bound_task`, `cpu_intensive_task` and `parallel_task` all compute
+`sum(i * i for i in range(n))` one element at a time, and the tutorial's
+process pool gets one job per input (1M, 2M and 3M), so the worker with 3M
+finishes long after the others. RangeReducer instead splits [0, n) into
+chunks of a tunable size, hands them to a process or thread pool, and folds
+the partial results with an associative reducer. Every chunk reports how long
+it took, which is what you need to tune `chunk_size` on a many-core host.
+
+When the per-element function is a known polynomial (`Power(k)`, i.e. i**k
+for k <= 3) and the reducer is addition, the whole range is summed in closed
+form (Faulhaber's formulas) without touching a single element.
+
+    reducer = RangeReducer(Power(2), chunk_size=250_000, workers=8)
+    report = reducer.reduce(3_000_000)
+    report.value, report.chunk_times
+"""
+
+import operator
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+
+class Power:
+    """The element function i -> i**k, picklable and recognised for closed forms."""
+
+    __slots__ = ("k",)
+
+    def __init__(self, k: int) -> None:
+        if k < 0:
+            raise ValueError("Power exponent must be non-negative")
+        self.k = k
+
+    def __call__(self, i: int) -> int:
+        return i ** self.k
+
+    def __repr__(self) -> str:
+        return f"Power({self.k})"
+
+    def __reduce__(self):
+        return Power, (self.k,)
+
+
+def prefix_power_sum(k: int, n: int) -> int:
+    """Sum of i**k for i in [0, n), for k in 0..3 (Faulhaber).
+
+    The polynomials also hold for negative n, so prefix_power_sum(k, b) -
+    prefix_power_sum(k, a) is the sum over [a, b) for any a <= b.
+    """
+    if k == 0:
+        return n
+    m = n - 1  # Sum over 0..m
+    if k == 1:
+        return m * (m + 1) // 2
+    if k == 2:
+        return m * (m + 1) * (2 * m + 1) // 6
+    if k == 3:
+        return (m * (m + 1) // 2) ** 2
+    raise ValueError(f"No closed form for k={k}")
+
+
+def _closed_form(func: Callable[[int], Any], reducer: Callable[[Any, Any], Any], initial: Any,
+                 start: int, stop: int):
+    """Return the range's value without iterating, or None if unknown."""
+    if reducer is operator.add and isinstance(func, Power) and func.k <= 3:
+        if start >= stop:
+            return initial  # Empty range, like sum(range(start, stop), initial)
+        return initial + (prefix_power_sum(func.k, stop) - prefix_power_sum(func.k, start))
+    return None
+
+
+class _NoInitial:
+    """Marks chunks that fold from their own first element; pickles as the singleton."""
+
+    def __reduce__(self) -> str:
+        return "_NO_INITIAL"
+
+
+_NO_INITIAL = _NoInitial()
+
+
+def reduce_chunk(func: Callable[[int], Any], reducer: Callable[[Any, Any], Any], initial: Any,
+                 start: int, stop: int) -> tuple[Any, float]:
+    """Fold func(i) for i in [start, stop); return (value, seconds spent)."""
+    began = time.perf_counter()
+    if initial is _NO_INITIAL:
+        initial, start = func(start), start + 1
+    if reducer is operator.add:
+        # sum() runs the fold in C, far cheaper than reduce() with operator.add
+        value = sum(map(func, range(start, stop)), initial)
+    else:
+        value = reduce(reducer, map(func, range(start, stop)), initial)
+    return value, time.perf_counter() - began
+
+
+@dataclass
+class ChunkTiming:
+    start: int
+    stop: int
+    seconds: float
+
+
+@dataclass
+class ReductionReport:
+    value: Any
+    wall_time: float
+    closed_form: bool
+    chunk_times: list[ChunkTiming]
+
+    def summary(self) -> str:
+        if self.closed_form:
+            return f"closed form in {self.wall_time * 1e6:.1f} us"
+        if not self.chunk_times:
+            return f"empty range in {self.wall_time * 1e6:.1f} us"
+        busy = [c.seconds for c in self.chunk_times]
+        return (f"{len(busy)} chunks in {self.wall_time * 1000:.1f} ms wall, "
+                f"chunk min/max {min(busy) * 1000:.2f}/{max(busy) * 1000:.2f} ms")
+
+
+class RangeReducer:
+    """Reduce func(i) over [0, n) in parallel chunks.
+
+    `reducer` must be associative; `initial` is folded in once, before the
+    first element, like the start value of sum() (and is the result for an
+    empty range). Chunk results are combined in order, so the reducer need
+    not be commutative. `backend` is
+    "process", "thread" or "serial"; `func` and `reducer` must be picklable for
+    the process backend (module-level functions, operator.add, Power(k)).
+    """
+
+    def __init__(self, func: Callable[[int], Any] = Power(2), reducer: Callable[[Any, Any], Any] = operator.add,
+                 initial: Any = 0, *, chunk_size: int = 100_000, workers: int | None = None,
+                 backend: str = "process", use_closed_form: bool = True) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if backend not in ("process", "thread", "serial"):
+            raise ValueError(f"Unknown backend {backend!r}")
+        self.func = func
+        self.reducer = reducer
+        self.initial = initial
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.use_closed_form = use_closed_form
+
+    def chunks(self, start: int, stop: int) -> list[tuple[int, int]]:
+        return [(lo, min(lo + self.chunk_size, stop)) for lo in range(start, stop, self.chunk_size)]
+
+    def _executor(self) -> Executor:
+        if self.backend == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def reduce(self, stop: int, start: int = 0, *, executor: Executor | None = None) -> ReductionReport:
+        """Reduce over [start, stop); pass `executor` to reuse a pool across calls."""
+        began = time.perf_counter()
+        if self.use_closed_form:
+            value = _closed_form(self.func, self.reducer, self.initial, start, stop)
+            if value is not None:
+                return ReductionReport(value, time.perf_counter() - began, True, [])
+
+        bounds = self.chunks(start, stop)
+        # `initial` goes into the first chunk only, so it is counted once
+        jobs = [(self.func, self.reducer, self.initial if i == 0 else _NO_INITIAL, lo, hi)
+                for i, (lo, hi) in enumerate(bounds)]
+        if self.backend == "serial":
+            partials = [reduce_chunk(*job) for job in jobs]
+        else:
+            own_executor = executor is None
+            executor = executor or self._executor()
+            try:
+                futures = [executor.submit(reduce_chunk, *job) for job in jobs]
+                partials = [future.result() for future in futures]
+            finally:
+                if own_executor:
+                    executor.shutdown()
+
+        value = reduce(self.reducer, (partial for partial, _ in partials)) if partials else self.initial
+        timings = [ChunkTiming(lo, hi, seconds) for (lo, hi), (_, seconds) in zip(bounds, partials)]
+        return ReductionReport(value, time.perf_counter() - began, False, timings)
+
+
+def sum_of_squares(n: int, **options: Any) -> int:
+    """sum(i * i for i in range(n)), the tutorial's workload, via RangeReducer."""
+    return RangeReducer(Power(2), **options).reduce(n).value
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Register chunked and closed-form variants next to the sum-of-squares hot paths."""
+    n = 100_000
+    serial = RangeReducer(Power(2), backend="serial", use_closed_form=False, chunk_size=10_000)
+    suite.add(f"RangeReducer serial chunks({n:_})", serial.reduce, n, group="sum-of-squares")
+    closed = RangeReducer(Power(2))
+    suite.add(f"RangeReducer closed form({n:_})", closed.reduce, n, group="sum-of-squares")
+    suite.add("RangeReducer closed form(10**12)", closed.reduce, 10**12, group="sum-of-squares")
+
+    # The tutorial's pool workload (1M + 2M + 3M squares) as balanced chunks;
+    # the pool is created lazily on first use and reused across repeats
+    pool = ProcessPoolExecutor()
+    suite.add_cleanup(pool.shutdown)
+    chunked = RangeReducer(Power(2), use_closed_form=False, chunk_size=250_000)
+    serial_large = RangeReducer(Power(2), backend="serial", use_closed_form=False, chunk_size=250_000)
+    suite.add("RangeReducer serial chunks(6_000_000)", serial_large.reduce, 6_000_000, group="sum-of-squares")
+    suite.add("RangeReducer process pool(6_000_000)", chunked.reduce, 6_000_000, executor=pool,
+              group="sum-of-squares")
@@ -0,0 +1,302 @@
+"""
+Columnar storage for many shapes: bulk area, perimeter, filters and top-k.
+
+The OOP section's `Shape` ABC computes `area()` and `perimeter()` one object
+at a time: summing a million areas is a million method lookups and a
+million boxed floats. ShapeCollection stores every kind of shape in its own
+columns (rectangles: widths and heights; circles: radii) as `array('d')`,
+so each total is one tight loop per kind:
+
+    shapes = ShapeCollection.from_shapes([Rectangle(5, 3), Circle(2), ...])
+    shapes.total_area(), shapes.total_perimeter()
+    shapes.top_k(10)                           # [(area, index), ...] largest first
+    big = shapes.filter(min_area=100.0)        # A new ShapeCollection
+    objects = big.to_shapes({"rectangle": Rectangle, "circle": Circle})
+
+The per-kind loops are `map` over the arrays (running in C). With NumPy
+installed they use NumPy instead, on zero-copy views of the same arrays.
+Results match the objects' own area() and perimeter() exactly: the
+formulas are evaluated in the same order.
+
+Shapes keep their position: to_shapes() returns them in the order they were
+added, so a collection converts back and forth without loss. Values are
+stored as floats, so Rectangle(5, 3) comes back as Rectangle(5.0, 3.0).
+Other kinds can be added to KINDS.
+"""
+
+import heapq
+import math
+import operator
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from itertools import chain, compress, repeat
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+from cheatsheet.compat import load_numpy
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+_TWO_PI = 2 * math.pi
+
+
+@dataclass(frozen=True)
+class ShapeKind:
+    """Column names and vectorised formulas for one kind of shape.
+
+    `area` and `perimeter` take the columns and return per-shape values;
+    `numpy_area` and `numpy_perimeter` do the same for NumPy arrays.
+    """
+    fields: tuple[str, ...]
+    area: Callable[..., Iterable[float]]
+    perimeter: Callable[..., Iterable[float]]
+    numpy_area: Callable[..., Any]
+    numpy_perimeter: Callable[..., Any]
+
+
+KINDS: dict[str, ShapeKind] = {
+    "rectangle": ShapeKind(
+        ("width", "height"),
+        lambda w, h: map(operator.mul, w, h),
+        lambda w, h: map(operator.mul, repeat(2), map(operator.add, w, h)),
+        lambda w, h: w * h,
+        lambda w, h: 2 * (w + h),
+    ),
+    "circle": ShapeKind(
+        ("radius",),
+        lambda r: map(operator.mul, repeat(math.pi), map(operator.mul, r, r)),
+        lambda r: map(operator.mul, repeat(_TWO_PI), r),
+        lambda r: math.pi * (r * r),
+        lambda r: _TWO_PI * r,
+    ),
+}
+
+
+class ShapeCollection:
+    """Shapes stored column-wise, one set of float arrays per kind."""
+
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        self.use_numpy = use_numpy  # None: use NumPy when it is installed
+        self._columns: dict[str, tuple[array, ...]] = {
+            name: tuple(array("d") for _ in kind.fields) for name, kind in KINDS.items()}
+        self._positions: dict[str, array] = {name: array("q") for name in KINDS}
+        self._size = 0
+
+    @classmethod
+    def from_shapes(cls, shapes: Iterable[Any], kinds: Mapping[type, str] | None = None,
+                    use_numpy: bool | None = None) -> "ShapeCollection":
+        """Collect shape objects; a class maps to the kind of its lower-cased name unless `kinds` says otherwise."""
+        collection = cls(use_numpy)
+        kind_of: dict[type, tuple[str, Callable[[Any], Any]]] = {}
+        for shape in shapes:
+            shape_type = type(shape)
+            entry = kind_of.get(shape_type)
+            if entry is None:
+                name = (kinds or {}).get(shape_type, shape_type.__name__.lower())
+                if name not in KINDS:
+                    raise TypeError(f"No shape kind for {shape_type.__name__}; known kinds: {', '.join(KINDS)}")
+                fields = KINDS[name].fields
+                getter = operator.attrgetter(*fields)
+                entry = kind_of[shape_type] = (name, getter if len(fields) > 1 else lambda s, g=getter: (g(s),))
+            name, getter = entry
+            collection.add(name, *getter(shape))
+        return collection
+
+    def add(self, kind: str, *values: float) -> int:
+        """Append one shape of `kind` (e.g. add("circle", 2.0)); return its index."""
+        columns = self._columns[kind]
+        if len(values) != len(columns):
+            raise ValueError(f"{kind} takes {', '.join(KINDS[kind].fields)}")
+        for column, value in zip(columns, values):
+            column.append(value)
+        self._positions[kind].append(self._size)
+        self._size += 1
+        return self._size - 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def count(self, kind: str) -> int:
+        return len(self._positions[kind])
+
+    def columns(self, kind: str) -> dict[str, array]:
+        """The arrays of one kind, by field name (shared, not copied)."""
+        return dict(zip(KINDS[kind].fields, self._columns[kind]))
+
+    def _numpy(self):
+        np = load_numpy() if self.use_numpy is not False else None
+        if self.use_numpy and np is None:
+            raise RuntimeError("use_numpy=True requires NumPy to be installed")
+        return np
+
+    def _values(self, measure: str, kind: str, np) -> Any:
+        """Per-shape areas or perimeters of one kind, in that kind's order.
+
+        A NumPy array, or without NumPy a lazy iterator: one pass, nothing stored.
+        """
+        spec = KINDS[kind]
+        columns = self._columns[kind]
+        if np is not None:
+            views = [np.frombuffer(column, dtype=np.float64) for column in columns]
+            return getattr(spec, "numpy_" + measure)(*views)
+        return getattr(spec, measure)(*columns)
+
+    def _total(self, measure: str) -> float:
+        np = self._numpy()
+        total = 0.0
+        for kind in KINDS:
+            if self._positions[kind]:
+                values = self._values(measure, kind, np)
+                total += float(values.sum()) if np is not None else math.fsum(values)
+        return total
+
+    def total_area(self) -> float:
+        return self._total("area")
+
+    def total_perimeter(self) -> float:
+        return self._total("perimeter")
+
+    def values(self, measure: str = "area") -> array:
+        """Area (or perimeter) of every shape, in insertion order."""
+        if measure not in ("area", "perimeter"):
+            raise ValueError("measure must be 'area' or 'perimeter'")
+        np = self._numpy()
+        result = array("d", bytes(8 * self._size))
+        for kind, positions in self._positions.items():
+            if positions:
+                values = self._values(measure, kind, np)
+                for position, value in zip(positions, values.tolist() if np is not None else values):
+                    result[position] = value
+        return result
+
+    def top_k(self, k: int, by: str = "area") -> list[tuple[float, int]]:
+        """The `k` largest shapes by area or perimeter, as (value, index), largest first."""
+        if by not in ("area", "perimeter"):
+            raise ValueError("by must be 'area' or 'perimeter'")
+        np = self._numpy()
+        candidates: list[tuple[float, int]] = []
+        for kind, positions in self._positions.items():
+            if not positions:
+                continue
+            values = self._values(by, kind, np)
+            if np is not None and len(values) > k:
+                # Only the k largest of each kind can make the overall top k
+                chosen = np.argpartition(values, len(values) - k)[-k:]
+                candidates += zip(values[chosen].tolist(), (positions[i] for i in chosen.tolist()))
+            else:
+                candidates += heapq.nlargest(k, zip(values, positions))
+        return heapq.nlargest(k, candidates)
+
+    def filter(self, kind: str | None = None, *, min_area: float | None = None, max_area: float | None = None,
+               min_perimeter: float | None = None, max_perimeter: float | None = None) -> "ShapeCollection":
+        """A new collection with the shapes that pass every given bound (inclusive), in order."""
+        tests = [(measure, op, bound) for measure, op, bound in
+                 (("area", operator.ge, min_area), ("area", operator.le, max_area),
+                  ("perimeter", operator.ge, min_perimeter), ("perimeter", operator.le, max_perimeter))
+                 if bound is not None]
+        np = self._numpy()
+        result = ShapeCollection(self.use_numpy)
+        for name, positions in self._positions.items():
+            if (kind is not None and name != kind) or not positions:
+                continue
+            # One boolean mask per kind, then every column is cut with compress() in C
+            mask: Iterable[Any] = repeat(True, len(positions))
+            for i, (measure, op, bound) in enumerate(tests):
+                values = self._values(measure, name, np)
+                passed = op(values, bound).tolist() if np is not None else map(op, values, repeat(bound))
+                mask = map(operator.and_, mask, passed) if i else passed
+            mask = bytes(mask)
+            result._columns[name] = tuple(array("d", compress(column, mask)) for column in self._columns[name])
+            result._positions[name] = array("q", compress(positions, mask))
+        # Renumber the surviving shapes 0..m-1, keeping their relative order
+        kept = sorted(chain.from_iterable(result._positions.values()))
+        rank = dict(zip(kept, range(len(kept))))
+        for name, positions in result._positions.items():
+            result._positions[name] = array("q", map(rank.__getitem__, positions))
+        result._size = len(kept)
+        return result
+
+    def to_shapes(self, factories: Mapping[str, Callable[..., Any]] | None = None) -> list[Any]:
+        """Shape objects in insertion order, built as `factories[kind](*fields)` (default: FACTORIES)."""
+        factories = FACTORIES if factories is None else factories
+        shapes: list[Any] = [None] * self._size
+        for kind, positions in self._positions.items():
+            if positions:
+                factory = factories[kind]
+                for position, *values in zip(positions, *self._columns[kind]):
+                    shapes[position] = factory(*values)
+        return shapes
+
+
+# The OOP section's classes, for the benchmarks and as default factories
+
+class Shape(ABC):
+    @abstractmethod
+    def area(self):
+        """Calculate the area of the shape."""
+
+    @abstractmethod
+    def perimeter(self):
+        """Calculate the perimeter of the shape."""
+
+
+class Rectangle(Shape):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def perimeter(self):
+        return 2 * (self.width + self.height)
+
+
+class Circle(Shape):
+    def __init__(self, radius):
+        self.radius = radius
+
+    def area(self):
+        return math.pi * self.radius ** 2
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+
+FACTORIES = {"rectangle": Rectangle, "circle": Circle}
+
+
+def sample_shapes(n: int) -> list[Shape]:
+    """Alternating rectangles and circles of varied sizes."""
+    return [Rectangle(1 + i % 17, 1 + i % 13) if i % 2 else Circle(0.5 + i % 11) for i in range(n)]
+
+
+def _object_totals(shapes: list[Shape]) -> tuple[float, float]:
+    return math.fsum(shape.area() for shape in shapes), math.fsum(shape.perimeter() for shape in shapes)
+
+
+def _object_top_k(shapes: list[Shape], k: int) -> list[tuple[float, int]]:
+    return heapq.nlargest(k, ((shape.area(), i) for i, shape in enumerate(shapes)))
+
+
+def _collection_totals(collection: ShapeCollection) -> tuple[float, float]:
+    return collection.total_area(), collection.total_perimeter()
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Totals, top-k and a filter over 1M shapes: objects versus columns."""
+    objects = suite.fixture(lambda: sample_shapes(1_000_000))
+    collection = suite.fixture(lambda: ShapeCollection.from_shapes(objects.get(), use_numpy=False))
+    suite.add("objects: area+perimeter totals (1M)", _object_totals, objects, group="shapes")
+    suite.add("ShapeCollection: totals (1M)", _collection_totals, collection, group="shapes")
+    suite.add("objects: top 10 by area (1M)", _object_top_k, objects, 10, group="shapes")
+    suite.add("ShapeCollection.top_k(10) (1M)", ShapeCollection.top_k, collection, 10, group="shapes")
+    suite.add("objects: area >= 150 (1M)", lambda objects: [s for s in objects if s.area() >= 150], objects,
+              group="shapes")
+    suite.add("ShapeCollection.filter(min_area=150) (1M)", ShapeCollection.filter, collection, min_area=150.0,
+              group="shapes")
+    if load_numpy() is not None:
+        with_numpy = suite.fixture(lambda: ShapeCollection.from_shapes(objects.get(), use_numpy=True))
+        suite.add("ShapeCollection: totals, numpy (1M)", _collection_totals, with_numpy, group="shapes")
+        suite.add("ShapeCollection.top_k(10), numpy (1M)", ShapeCollection.top_k, with_numpy, 10, group="shapes")
@@ -0,0 +1,212 @@
+"""
+Batched distances and a grid index for nearest-neighbour and radius queries.
+
+The 3.12 section's `distance(p1, p2)` computes one distance per call. A
+nearest-neighbour search built on it calls it once per point (and a
+"who is near whom" pass once per pair), all in Python bytecode. Here:
+
+- distances_from(origin, points): every distance from one point at once,
+  `math.hypot` mapped over the coordinate arrays of a PointArray in C
+- pairwise_distances(a, b): the full len(a) x len(b) distance Matrix
+  (cheatsheet.matrix), one distances_from row per point of `a`
+- GridIndex: points bucketed into square cells about `per_cell` points
+  each. A radius query only looks at the cells that overlap the circle.
+  nearest() looks at rings of cells around the query and stops once no
+  unvisited cell can hold a closer point. For evenly spread data either
+  query touches a few dozen points instead of all n.
+
+    index = GridIndex(points)                  # PointArray or (x, y) tuples
+    index.nearest((0.5, 0.5), k=3)             # [(distance, i), ...], closest first
+    index.within((0.5, 0.5), 0.01)             # Indexes of the points in the circle
+
+Results are indexes into `index.points`. A grid suits data that is spread
+fairly evenly; heavily clustered data puts many points in a few cells.
+Choose `cell_size` for the typical query radius in that case. Points on a
+line get cells sized along the line, so the grid stays about n / per_cell
+cells in total.
+"""
+
+import heapq
+import math
+import operator
+import random
+from array import array
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from cheatsheet.geometry import PointArray
+from cheatsheet.matrix import Matrix
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+Point2D = tuple[float, float]
+
+
+def _as_array(points: PointArray | Iterable[Point2D]) -> PointArray:
+    return points if isinstance(points, PointArray) else PointArray.from_tuples(points)
+
+
+def distances_from(origin: Point2D, points: PointArray | Iterable[Point2D]) -> array:
+    """Distance from `origin` to every point, as an array('d') in point order."""
+    points = _as_array(points)
+    x, y = origin
+    dx = map(operator.sub, points.xs, repeat(x))
+    dy = map(operator.sub, points.ys, repeat(y))
+    return array("d", map(math.hypot, dx, dy))
+
+
+def pairwise_distances(a: PointArray | Iterable[Point2D], b: PointArray | Iterable[Point2D] | None = None) -> Matrix:
+    """Matrix whose entry (i, j) is the distance from a[i] to b[j] (b defaults to a)."""
+    a = _as_array(a)
+    b = a if b is None else _as_array(b)
+    data = array("d")
+    for origin in zip(a.xs, a.ys):
+        data.extend(distances_from(origin, b))
+    return Matrix(len(a), len(b), data)
+
+
+def nearest_brute(origin: Point2D, points: PointArray | Iterable[Point2D], k: int = 1) -> list[tuple[float, int]]:
+    """k nearest by computing every distance: the baseline GridIndex.nearest() is checked against."""
+    distances = distances_from(origin, points)
+    return heapq.nsmallest(k, zip(distances, range(len(distances))))
+
+
+class GridIndex:
+    """A uniform grid over a fixed set of points."""
+
+    def __init__(self, points: PointArray | Iterable[Point2D], cell_size: float | None = None,
+                 per_cell: int = 8) -> None:
+        self.points = _as_array(points)
+        xs, ys = self.points.xs, self.points.ys
+        n = len(xs)
+        self.min_x = min(xs) if n else 0.0
+        self.min_y = min(ys) if n else 0.0
+        width = (max(xs) - self.min_x) if n else 0.0
+        height = (max(ys) - self.min_y) if n else 0.0
+        if cell_size is None:
+            # Square cells holding about `per_cell` points each if the points are spread evenly,
+            # but never more than n / per_cell cells along the longer side: collinear or nearly
+            # collinear points have no area to divide, only a length
+            cells = max(n, 1) / per_cell
+            cell_size = max(math.sqrt(width * height / cells), max(width, height) / cells) or 1.0
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._scale = 1.0 / cell_size
+        self._max_cx = int(width * self._scale)
+        self._max_cy = int(height * self._scale)
+        cells: dict[tuple[int, int], list[int]] = {}
+        # Cell coordinates for all points are computed in C; only the bucketing loop is Python
+        cxs = map(int, map(operator.mul, map(operator.sub, xs, repeat(self.min_x)), repeat(self._scale)))
+        cys = map(int, map(operator.mul, map(operator.sub, ys, repeat(self.min_y)), repeat(self._scale)))
+        for i, key in enumerate(zip(cxs, cys)):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+        self._cells = cells
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor((x - self.min_x) * self._scale), math.floor((y - self.min_y) * self._scale)
+
+    def _candidates(self, cells: Iterable[tuple[int, int]]) -> list[int]:
+        get = self._cells.get
+        found: list[int] = []
+        for key in cells:
+            bucket = get(key)
+            if bucket:
+                found.extend(bucket)
+        return found
+
+    def _measure(self, x: float, y: float, indexes: list[int]) -> map:
+        xs, ys = self.points.xs, self.points.ys
+        dx = map(operator.sub, map(xs.__getitem__, indexes), repeat(x))
+        dy = map(operator.sub, map(ys.__getitem__, indexes), repeat(y))
+        return map(math.hypot, dx, dy)
+
+    def within(self, center: Point2D, radius: float) -> list[int]:
+        """Indexes of the points at most `radius` from `center`."""
+        x, y = center
+        cx0, cy0 = self._cell(x - radius, y - radius)
+        cx1, cy1 = self._cell(x + radius, y + radius)
+        # Clip to the occupied grid so a huge radius does not walk empty cells
+        cx0, cy0 = max(cx0, 0), max(cy0, 0)
+        cx1, cy1 = min(cx1, self._max_cx), min(cy1, self._max_cy)
+        indexes = self._candidates((i, j) for i in range(cx0, cx1 + 1) for j in range(cy0, cy1 + 1))
+        return [i for i, d in zip(indexes, self._measure(x, y, indexes)) if d <= radius]
+
+    def nearest(self, center: Point2D, k: int = 1) -> list[tuple[float, int]]:
+        """The `k` nearest points as (distance, index), closest first."""
+        if k < 1 or not len(self.points):
+            return []
+        x, y = center
+        cx, cy = self._cell(x, y)
+        size = self.cell_size
+        max_cx, max_cy = self._max_cx, self._max_cy
+        # Only rings between these two can contain cells of the grid (a query
+        # outside the points' bounding box starts at the first ring reaching it)
+        first_ring = max(0, -cx, cx - max_cx, -cy, cy - max_cy)
+        last_ring = max(cx, max_cx - cx, cy, max_cy - cy, 0)
+        best: list[tuple[float, int]] = []  # Max-heap of the k best, as (-distance, -index)
+        for ring in range(first_ring, last_ring + 1):
+            # The ring's cells, clipped to the grid: top and bottom rows, then the sides
+            columns = range(max(cx - ring, 0), min(cx + ring, max_cx) + 1)
+            ring_cells = [(i, row) for row in {cy - ring, cy + ring} if 0 <= row <= max_cy for i in columns]
+            rows = range(max(cy - ring + 1, 0), min(cy + ring - 1, max_cy) + 1)
+            ring_cells += [(column, j) for column in {cx - ring, cx + ring} if 0 <= column <= max_cx for j in rows]
+            indexes = self._candidates(ring_cells)
+            for d, i in zip(self._measure(x, y, indexes), indexes):
+                if len(best) < k:
+                    heapq.heappush(best, (-d, -i))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, -i))
+            if len(best) == k:
+                # Everything not yet seen lies outside the square of visited cells
+                left = x - (self.min_x + (cx - ring) * size)
+                right = self.min_x + (cx + ring + 1) * size - x
+                low = y - (self.min_y + (cy - ring) * size)
+                high = self.min_y + (cy + ring + 1) * size - y
+                if -best[0][0] <= min(left, right, low, high):
+                    break
+        return sorted((-d, -i) for d, i in best)
+
+
+def random_points(n: int, seed: int = 42) -> PointArray:
+    """`n` points spread evenly over the unit square (reproducible)."""
+    rng = random.Random(seed)
+    return PointArray(array("d", (rng.random() for _ in range(n))), array("d", (rng.random() for _ in range(n))))
+
+
+def _tutorial_nearest(origin: Point2D, points: Sequence[Point2D], k: int) -> list[Point2D]:
+    """The 3.12 section's distance() applied to every point, then sorted."""
+    def distance(p1: Point2D, p2: Point2D) -> float:
+        return math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+    return sorted(points, key=lambda p: distance(origin, p))[:k]
+
+
+def _queries(index: GridIndex, centers: list[Point2D], k: int) -> int:
+    return sum(len(index.nearest(center, k)) for center in centers)
+
+
+def _radius_queries(index: GridIndex, centers: list[Point2D], radius: float) -> int:
+    return sum(len(index.within(center, radius)) for center in centers)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Nearest-neighbour and radius queries over 1M points: per-call distance(), batched, and the grid."""
+    points = suite.fixture(lambda: random_points(1_000_000))
+    tuples = suite.fixture(lambda: points.get().to_tuples())
+    index = suite.fixture(lambda: GridIndex(points.get()))
+    centers = random_points(100, seed=7).to_tuples()
+    suite.add("tutorial distance(), 10 nearest (1M)", _tutorial_nearest, centers[0], tuples, 10, group="spatial")
+    suite.add("distances_from (1M)", distances_from, centers[0], points, group="spatial")
+    suite.add("nearest_brute, k=10 (1M)", nearest_brute, centers[0], points, 10, group="spatial")
+    suite.add("GridIndex build (1M)", GridIndex, points, group="spatial")
+    suite.add("GridIndex.nearest k=10, 100 queries (1M)", _queries, index, centers, 10, group="spatial")
+    suite.add("GridIndex.within r=0.005, 100 queries (1M)", _radius_queries, index, centers, 0.005, group="spatial")
+    suite.add("pairwise_distances (300 x 300)", pairwise_distances, random_points(300), group="spatial")
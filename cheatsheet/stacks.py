@@ -0,0 +1,339 @@
+"""
+Stacks with bulk operations, bounded memory and safe sharing between threads.
+
+The 3.12 section's `Stack[T]` (and `OldStack[T]`) push and pop one item per
+method call, and nothing makes a sequence of calls atomic: on a
+free-threaded build (python3.13t) two threads can both see an item and only
+one gets it, and a "pop the top n" written as n pops can interleave with
+other threads. Here:
+
+- Stack: the tutorial stack plus push_many()/pop_many(), which move a whole
+  batch with one list extend or slice instead of one call per item
+- DequeStack: backed by a deque, which grows and shrinks in fixed-size
+  blocks instead of reallocating one big array. With `maxlen` it keeps
+  only the newest `maxlen` items (an undo history, say), so memory stays
+  bounded
+- LockedStack: one lock around every operation; strict LIFO, bulk
+  operations take the lock once per batch (the baseline)
+- ShardedStack: each thread pushes to and pops from its own shard, and only
+  steals from other shards when its own is empty, so threads rarely touch
+  the same lock. The order is LIFO per thread, not across threads
+
+    stack = LockedStack[int]()
+    stack.push_many(range(1000))
+    stack.pop_many(10)                         # [999, 998, ..., 990]
+
+pop() raises IndexError on an empty stack; pop_many(n) returns up to `n`
+items, most recently pushed first (the order of n pop() calls).
+scaling_table() compares the thread-safe stacks as threads are added.
+"""
+
+import threading
+import time
+import weakref
+from collections import deque
+from itertools import repeat, starmap
+from typing import TYPE_CHECKING, Callable, Generic, Iterable, TypeVar
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+T = TypeVar("T")
+
+
+class Stack(Generic[T]):
+    """The tutorial's list-backed stack with bulk push and pop."""
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self.items: list[T] = list(items)
+
+    def push(self, item: T) -> None:
+        self.items.append(item)
+
+    def pop(self) -> T:
+        if not self.items:
+            raise IndexError("pop from empty stack")
+        return self.items.pop()
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """Push every item in order (the last one ends up on top)."""
+        self.items.extend(items)
+
+    def pop_many(self, n: int) -> list[T]:
+        """Pop up to `n` items, top first."""
+        if n <= 0:
+            return []
+        top = self.items[-n:]
+        del self.items[-n:]
+        top.reverse()
+        return top
+
+    def peek(self) -> T:
+        if not self.items:
+            raise IndexError("peek at empty stack")
+        return self.items[-1]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class DequeStack(Generic[T]):
+    """A deque-backed stack; with `maxlen`, the oldest items are dropped."""
+
+    def __init__(self, items: Iterable[T] = (), maxlen: int | None = None) -> None:
+        self.items: deque[T] = deque(items, maxlen)
+
+    @property
+    def maxlen(self) -> int | None:
+        return self.items.maxlen
+
+    def push(self, item: T) -> None:
+        self.items.append(item)
+
+    def pop(self) -> T:
+        if not self.items:
+            raise IndexError("pop from empty stack")
+        return self.items.pop()
+
+    def push_many(self, items: Iterable[T]) -> None:
+        self.items.extend(items)
+
+    def pop_many(self, n: int) -> list[T]:
+        """Pop up to `n` items, top first (the pops run inside one C loop)."""
+        return list(starmap(self.items.pop, repeat((), max(0, min(n, len(self.items))))))
+
+    def peek(self) -> T:
+        if not self.items:
+            raise IndexError("peek at empty stack")
+        return self.items[-1]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class LockedStack(Stack[T]):
+    """Stack with one lock around each operation, batches included."""
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        super().__init__(items)
+        self._lock = threading.Lock()
+
+    def push(self, item: T) -> None:
+        with self._lock:
+            self.items.append(item)
+
+    def pop(self) -> T:
+        with self._lock:
+            return super().pop()
+
+    def push_many(self, items: Iterable[T]) -> None:
+        items = list(items)  # Consume the iterable before taking the lock
+        with self._lock:
+            self.items.extend(items)
+
+    def pop_many(self, n: int) -> list[T]:
+        with self._lock:
+            return super().pop_many(n)
+
+    def peek(self) -> T:
+        with self._lock:
+            return super().peek()
+
+
+class _StackShard:
+    """One thread's items, and the lock that stealing threads also take."""
+
+    __slots__ = ("items", "lock", "owner")
+
+    def __init__(self) -> None:
+        self.items: list = []
+        self.lock = threading.Lock()
+        self.owner = weakref.ref(threading.current_thread())
+
+
+class ShardedStack(Generic[T]):
+    """Per-thread shards; an empty shard steals from the others.
+
+    No item is lost or returned twice. pop() raises IndexError when it
+    found every shard empty during its scan, which can happen while other
+    threads push concurrently, like value() in counters.ShardedCounter.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()  # Guards the shard registry
+        self._shards: list[_StackShard] = []
+
+    def _shard(self) -> _StackShard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _StackShard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def push(self, item: T) -> None:
+        shard = self._shard()
+        with shard.lock:  # Uncontended unless another thread is stealing
+            shard.items.append(item)
+
+    def push_many(self, items: Iterable[T]) -> None:
+        items = list(items)
+        shard = self._shard()
+        with shard.lock:
+            shard.items.extend(items)
+
+    def pop(self) -> T:
+        shard = self._shard()
+        with shard.lock:
+            if shard.items:
+                return shard.items.pop()
+        stolen = self._steal(1, shard)
+        if not stolen:
+            raise IndexError("pop from empty stack")
+        return stolen[0]
+
+    def pop_many(self, n: int) -> list[T]:
+        """Up to `n` items: the calling thread's newest first, then stolen ones."""
+        if n <= 0:
+            return []
+        shard = self._shard()
+        with shard.lock:
+            top = shard.items[-n:]
+            del shard.items[-n:]
+        top.reverse()
+        if len(top) < n:
+            top += self._steal(n - len(top), shard)
+        return top
+
+    def _steal(self, n: int, own: _StackShard) -> list[T]:
+        """Take up to `n` items from the tops of other threads' shards."""
+        with self._lock:
+            shards = self._shards[:]
+        taken: list[T] = []
+        for shard in shards:
+            if shard is own:
+                continue
+            with shard.lock:
+                top = shard.items[len(taken) - n:]
+                del shard.items[len(taken) - n:]
+                retired = not shard.items and not _alive(shard)
+            top.reverse()
+            taken += top
+            if retired:
+                # Its thread is gone and nothing is left: no one will push to it again
+                with self._lock:
+                    if shard in self._shards:
+                        self._shards.remove(shard)
+            if len(taken) == n:
+                break
+        return taken
+
+    def __len__(self) -> int:
+        """Total items (a snapshot per shard while other threads run)."""
+        with self._lock:
+            shards = self._shards[:]
+        return sum(len(shard.items) for shard in shards)
+
+
+def _alive(shard: _StackShard) -> bool:
+    owner = shard.owner()
+    return owner is not None and owner.is_alive()
+
+
+STACKS: dict[str, Callable[[], object]] = {
+    "locked": LockedStack,
+    "sharded": ShardedStack,
+}
+
+
+def hammer(stack, threads: int, operations: int, batch: int = 1) -> float:
+    """`threads` threads each push then pop `operations` distinct items; return seconds.
+
+    With batch > 1 items move through push_many()/pop_many(). Raises if
+    any item is lost or popped twice.
+    """
+    start_barrier = threading.Barrier(threads + 1)
+    popped: list[list] = [[] for _ in range(threads)]
+
+    def work(t: int) -> None:
+        mine = range(t * operations, (t + 1) * operations)
+        got = popped[t]
+        start_barrier.wait()
+        for i in range(0, operations, batch):
+            if batch == 1:
+                stack.push(mine[i])
+            else:
+                stack.push_many(mine[i:i + batch])
+        while len(got) < operations:
+            if batch == 1:
+                try:
+                    got.append(stack.pop())
+                except IndexError:
+                    pass  # Items in flight elsewhere; this thread still has some to pop
+            else:
+                got += stack.pop_many(min(batch, operations - len(got)))
+
+    workers = [threading.Thread(target=work, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_barrier.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+    everything = [item for got in popped for item in got]
+    if len(stack) or len(everything) != threads * operations or set(everything) != set(range(len(everything))):
+        raise AssertionError(f"{type(stack).__name__} lost or duplicated items")
+    return elapsed
+
+
+def scaling_table(thread_counts=(1, 2, 4, 8, 16), operations: int = 20_000) -> str:
+    """Million push+pop pairs per second for each stack and thread count."""
+    columns = [(name, factory, batch) for name, factory in STACKS.items() for batch in (1, 64)]
+    lines = [f"{'threads':>7} " + " ".join(f"{f'{name} x{batch}':>12}" for name, _, batch in columns)]
+    for threads in thread_counts:
+        rates = []
+        for _, factory, batch in columns:
+            seconds = hammer(factory(), threads, operations, batch)
+            rates.append(threads * operations / seconds / 1e6)
+        lines.append(f"{threads:>7} " + " ".join(f"{rate:>10.2f} M" for rate in rates))
+    return "\n".join(lines)
+
+
+def _one_at_a_time(stack, items: range) -> int:
+    push, pop = stack.push, stack.pop
+    for item in items:
+        push(item)
+    for _ in items:
+        pop()
+    return len(items)
+
+
+def _in_batches(stack, items: range, batch: int) -> int:
+    for i in range(0, len(items), batch):
+        stack.push_many(items[i:i + batch])
+    while stack.pop_many(batch):
+        pass
+    return len(items)
+
+
+def _hammer_new(factory: Callable[[], object], threads: int, operations: int, batch: int) -> float:
+    return hammer(factory(), threads, operations, batch)
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Single-thread push/pop of 100k items, then the thread-safe stacks from 1 to 16 threads."""
+    items = range(100_000)
+    suite.add("Stack push/pop x100k", lambda: _one_at_a_time(Stack(), items), group="stacks")
+    suite.add("Stack push_many/pop_many, batches of 64", lambda: _in_batches(Stack(), items, 64), group="stacks")
+    suite.add("DequeStack push/pop x100k", lambda: _one_at_a_time(DequeStack(), items), group="stacks")
+    suite.add("DequeStack push_many/pop_many, batches of 64",
+              lambda: _in_batches(DequeStack(), items, 64), group="stacks")
+    suite.add("LockedStack push/pop x100k", lambda: _one_at_a_time(LockedStack(), items), group="stacks")
+    for threads in (1, 2, 4, 8, 16):
+        for name, factory in STACKS.items():
+            for batch in (1, 64):
+                suite.add(f"{name} stack, {threads} threads x 10k, batch {batch}",
+                          _hammer_new, factory, threads, 10_000, batch, group="stacks")
@@ -0,0 +1,449 @@
+"""
+Pluggable storage for the tutorial's files: the real disk, or memory.
+
+The File I/O, decorator, generator and asyncio sections all read and write
+`example.txt` in the current directory, and the 3.14 section writes a
+temporary JSON file. Run in a test suite or a batch job, every one of those
+is real disk I/O: slower, dependent on a writable working directory, and
+leaving files behind. The file helpers in this package (FileSession,
+MappedFile, open_file, AsyncFileManager, streams, json_stream) open files
+through the current Storage instead of calling open() directly:
+
+- DiskStorage:    open() on the real filesystem (the default)
+- MemoryStorage:  files are bytes in a dict; nothing touches the disk
+- SpooledStorage: like MemoryStorage, but a file that grows past `max_size`
+                  moves to a private temporary directory, so memory stays
+                  bounded however large the outputs get
+
+    from cheatsheet import storage
+
+    with storage.using(storage.MemoryStorage()) as fs:
+        with fs.open("example.txt", "w") as file:
+            file.write("Hello, World!\\n")
+        print(fs.read_bytes("example.txt"), fs.usage().format())
+
+`fs.open()` takes the same arguments as open() and returns a file object that
+behaves the same way. In-memory writes become visible to other handles on
+flush() or close(), as with a buffered file on disk. Process pools
+(file_chunks) and the measurement helpers (memory_report, lag_comparison)
+need real files and keep using the disk; the tutorial sections check
+`on_disk` and leave those demos out, so with `--storage memory` no section
+opens a file on disk.
+"""
+
+import builtins
+import errno
+import io
+import itertools
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+_MODE_CHARS = frozenset("rwaxbt+")
+
+
+@dataclass
+class StorageUsage:
+    """Where the files of a storage live."""
+    files: int = 0
+    memory_bytes: int = 0
+    spilled_files: int = 0
+    disk_bytes: int = 0
+
+    def format(self) -> str:
+        text = f"{self.files} files, {self.memory_bytes:,} bytes in memory"
+        if self.spilled_files:
+            text += f", {self.spilled_files} spilled to disk ({self.disk_bytes:,} bytes)"
+        return text
+
+
+class Storage(ABC):
+    """Where file helpers open their files."""
+
+    on_disk = False  # True when paths are real files that other processes can open
+
+    @abstractmethod
+    def open(self, path: str | os.PathLike, mode: str = "r", buffering: int = -1, encoding: str | None = None,
+             errors: str | None = None, newline: str | None = None) -> IO:
+        """Same arguments and result as open()."""
+
+    @abstractmethod
+    def exists(self, path: str | os.PathLike) -> bool: ...
+
+    @abstractmethod
+    def size(self, path: str | os.PathLike) -> int: ...
+
+    @abstractmethod
+    def remove(self, path: str | os.PathLike) -> None: ...
+
+    @abstractmethod
+    def temp_path(self, suffix: str = "") -> str:
+        """A new, empty file with a unique name, like tempfile.mkstemp()."""
+
+    def read_bytes(self, path: str | os.PathLike) -> bytes:
+        with self.open(path, "rb") as file:
+            return file.read()
+
+    def write_bytes(self, path: str | os.PathLike, data: bytes) -> int:
+        with self.open(path, "wb") as file:
+            return file.write(data)
+
+    def buffer(self, path: str | os.PathLike) -> Any:
+        """The file's contents as a read-only buffer (bytes-like, with find())."""
+        return self.read_bytes(path)
+
+    def close(self) -> None:
+        """Release whatever the storage holds (nothing, by default)."""
+
+    def __enter__(self) -> "Storage":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+
+def _map_file(path: str) -> Any:
+    with builtins.open(path, "rb") as file:
+        # Zero-length files cannot be mapped; an empty buffer behaves the same
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class DiskStorage(Storage):
+    """The real filesystem."""
+
+    on_disk = True
+
+    def open(self, path, mode="r", buffering=-1, encoding=None, errors=None, newline=None):
+        return builtins.open(path, mode, buffering, encoding, errors, newline)
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def size(self, path):
+        return os.path.getsize(path)
+
+    def remove(self, path):
+        os.remove(path)
+
+    def temp_path(self, suffix=""):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        return path
+
+    def buffer(self, path):
+        """A read-only mmap of the file, so pages load only when touched."""
+        return _map_file(os.fspath(path))
+
+
+class _VirtualFile(io.BufferedIOBase):
+    """A binary file of a MemoryStorage: a BytesIO until it outgrows the spill limit."""
+
+    def __init__(self, storage: "MemoryStorage", key: str, data: bytes, mode: str) -> None:
+        super().__init__()
+        self._storage = storage
+        self._key = key
+        self._file: IO[bytes] = io.BytesIO(data)  # Shares `data` until the first write
+        self._readable = "r" in mode or "+" in mode
+        self._writable = "r" not in mode or "+" in mode
+        self._append = "a" in mode
+        self._spilled = False
+        self.name = key
+        self.mode = mode
+
+    def readable(self) -> bool:
+        return self._readable
+
+    def writable(self) -> bool:
+        return self._writable
+
+    def seekable(self) -> bool:
+        return True
+
+    def _check(self, allowed: bool, operation: str) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if not allowed:
+            raise io.UnsupportedOperation(operation)
+
+    def read(self, size: int | None = -1) -> bytes:
+        self._check(self._readable, "read")
+        return self._file.read(size)
+
+    read1 = read
+
+    def readinto(self, buffer: Any) -> int:
+        self._check(self._readable, "read")
+        return self._file.readinto(buffer)
+
+    def readline(self, size: int | None = -1) -> bytes:
+        self._check(self._readable, "read")
+        return self._file.readline(size)
+
+    def write(self, data: Any) -> int:
+        self._check(self._writable, "write")
+        if self._append:
+            self._file.seek(0, os.SEEK_END)
+        written = self._file.write(data)
+        limit = self._storage.max_size
+        if limit is not None and not self._spilled and self._file.tell() > limit:
+            self._spill()
+        return written
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._check(True, "seek")
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        self._check(True, "tell")
+        return self._file.tell()
+
+    def truncate(self, size: int | None = None) -> int:
+        self._check(self._writable, "truncate")
+        return self._file.truncate(size)
+
+    def fileno(self) -> int:
+        return self._file.fileno()  # UnsupportedOperation until the file spills
+
+    def flush(self) -> None:
+        super().flush()  # Raises on a closed file
+        self._file.flush()
+        if self._writable and not self._spilled:
+            self._storage._store(self._key, self._file.getvalue())
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                super().close()  # Flushes, which publishes the contents
+            finally:
+                self._file.close()
+
+    def _spill(self) -> None:
+        """Move the contents to a file in the storage's spill directory."""
+        path = self._storage._new_spill_path()
+        disk = builtins.open(path, "w+b")
+        with self._file.getbuffer() as view:
+            disk.write(view)
+        disk.seek(self._file.tell())
+        self._file.close()
+        self._file = disk
+        self._spilled = True
+        self._storage._store(self._key, path)
+
+
+class MemoryStorage(Storage):
+    """Files kept as bytes in memory; paths are only names.
+
+    Relative and absolute spellings of the same path name the same file, as
+    on disk. The storage is safe to share between threads.
+    """
+
+    max_size: int | None = None  # Files never spill
+
+    def __init__(self) -> None:
+        # bytes for files in memory, str (a real path) for spilled files
+        self._files: dict[str, bytes | str] = {}
+        self._lock = threading.Lock()
+        self._names = itertools.count()
+
+    @staticmethod
+    def _key(path: str | os.PathLike) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def _store(self, key: str, value: bytes | str) -> None:
+        with self._lock:
+            old = self._files.get(key)
+            self._files[key] = value
+        if isinstance(old, str) and old != value:
+            os.remove(old)  # Replaced by a new version; the old spill file is garbage
+
+    def _new_spill_path(self) -> str:
+        raise AssertionError("MemoryStorage never spills")
+
+    def _missing(self, path: str | os.PathLike) -> FileNotFoundError:
+        return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), os.fspath(path))
+
+    def open(self, path, mode="r", buffering=-1, encoding=None, errors=None, newline=None):
+        if not set(mode) <= _MODE_CHARS or len(set(mode)) != len(mode) \
+                or sum(mode.count(c) for c in "rwax") != 1 or ("b" in mode and "t" in mode):
+            raise ValueError(f"invalid mode: {mode!r}")
+        if "b" in mode and (encoding is not None or errors is not None or newline is not None):
+            raise ValueError("binary mode doesn't take an encoding, errors or newline argument")
+        key = self._key(path)
+        entry = self._files.get(key)
+        if "x" in mode and entry is not None:
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(path))
+        if "r" in mode and entry is None:
+            raise self._missing(path)
+        if isinstance(entry, str):
+            return builtins.open(entry, mode, buffering, encoding, errors, newline)
+        binary_mode = mode.replace("t", "") + ("" if "b" in mode else "b")
+        keep = entry is not None and ("r" in mode or "a" in mode)
+        raw = _VirtualFile(self, key, entry if keep else b"", binary_mode)
+        if raw.writable():
+            raw.flush()  # Create or truncate now, as open() does
+        if "a" in mode:
+            raw.seek(0, os.SEEK_END)
+        if "b" in mode:
+            return raw
+        text = io.TextIOWrapper(raw, encoding, errors, newline)
+        text.mode = mode
+        return text
+
+    def exists(self, path):
+        return self._key(path) in self._files
+
+    def size(self, path):
+        entry = self._files.get(self._key(path))
+        if entry is None:
+            raise self._missing(path)
+        return os.path.getsize(entry) if isinstance(entry, str) else len(entry)
+
+    def remove(self, path):
+        with self._lock:
+            entry = self._files.pop(self._key(path), None)
+        if entry is None:
+            raise self._missing(path)
+        if isinstance(entry, str):
+            os.remove(entry)
+
+    def temp_path(self, suffix=""):
+        while True:
+            # A made-up directory: tempfile.gettempdir() would probe the real disk with a test file
+            key = self._key(os.path.join(os.sep, "memory", f"cheatsheet-{next(self._names)}{suffix}"))
+            with self._lock:
+                if key not in self._files:
+                    self._files[key] = b""
+                    return key
+
+    def buffer(self, path):
+        """The stored bytes themselves (or a mapping of a spilled file): no copy."""
+        entry = self._files.get(self._key(path))
+        if entry is None:
+            raise self._missing(path)
+        return _map_file(entry) if isinstance(entry, str) else entry
+
+    def usage(self) -> StorageUsage:
+        usage = StorageUsage()
+        for entry in list(self._files.values()):
+            usage.files += 1
+            if isinstance(entry, str):
+                usage.spilled_files += 1
+                usage.disk_bytes += os.path.getsize(entry)
+            else:
+                usage.memory_bytes += len(entry)
+        return usage
+
+    def close(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+
+class SpooledStorage(MemoryStorage):
+    """MemoryStorage whose files move to disk once they exceed `max_size` bytes.
+
+    Spilled files live in a private temporary directory (created on the first
+    spill, deleted by close()) and are then opened directly on disk.
+    """
+
+    def __init__(self, max_size: int = 1024 * 1024, directory: str | None = None) -> None:
+        super().__init__()
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        self.max_size = max_size
+        self.directory = directory  # Where the spill directory is created (default: the temp dir)
+        self._spill_dir: str | None = None
+
+    def _new_spill_path(self) -> str:
+        with self._lock:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="cheatsheet-spool-", dir=self.directory)
+            return os.path.join(self._spill_dir, f"{next(self._names)}.spill")
+
+    def close(self) -> None:
+        super().close()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+BACKENDS = {"disk": DiskStorage, "memory": MemoryStorage, "spooled": SpooledStorage}
+
+_current: Storage = DiskStorage()
+
+
+def get_storage() -> Storage:
+    """The storage file helpers use when they are not given one."""
+    return _current
+
+
+def set_storage(storage: Storage) -> Storage:
+    """Make `storage` the default for all file helpers; return the previous one."""
+    global _current
+    previous, _current = _current, storage
+    return previous
+
+
+@contextmanager
+def using(storage: Storage) -> Iterator[Storage]:
+    """Use `storage` as the default inside the block, then restore the previous one."""
+    previous = set_storage(storage)
+    try:
+        yield storage
+    finally:
+        set_storage(previous)
+
+
+def from_name(name: str) -> Storage:
+    """A new storage by backend name: "disk", "memory" or "spooled"."""
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown storage {name!r}, expected one of {tuple(BACKENDS)}") from None
+
+
+def round_trip(storage: Storage, path: str, lines: list[str]) -> str:
+    """The File I/O section's write, read, read lines, append, read sequence."""
+    with storage.open(path, "w") as file:
+        file.writelines(lines)
+    with storage.open(path, "r") as file:
+        file.read()
+    with storage.open(path, "r") as file:
+        for _ in file:
+            pass
+    with storage.open(path, "a") as file:
+        file.write("This line was appended.\n")
+    with storage.open(path, "r") as file:
+        return file.read()
+
+
+def _write_and_read(storage: Storage, path: str, data: bytes) -> int:
+    storage.write_bytes(path, data)
+    size = len(storage.read_bytes(path))
+    storage.remove(path)
+    return size
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """The File I/O section's round trip and an 8 MB file on each backend."""
+    path = suite.fixture(lambda: os.path.join(tempfile.mkdtemp(prefix="cheatsheet-storage-"), "example.txt"),
+                         lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True))
+    factories = {"disk": DiskStorage, "memory": MemoryStorage, "spooled 1 MB": lambda: SpooledStorage(1024 * 1024)}
+    backends = {name: suite.fixture(factory, lambda backend: backend.close()) for name, factory in factories.items()}
+    lines = [f"Line {i}: Python is awesome!\n" for i in range(3)]
+    for name, backend in backends.items():
+        suite.add(f"{name}: write/read/append round trip", round_trip, backend, path, lines, group="storage")
+    data = suite.fixture(lambda: os.urandom(8 * 1024 * 1024))
+    for name, backend in backends.items():
+        suite.add(f"{name}: write and read 8 MB", _write_and_read, backend, path, data, group="storage")
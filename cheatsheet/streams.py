@@ -0,0 +1,304 @@
+"""
+Lazy, composable pipelines over lines of a file (or any iterable).
+
+"Reading line by line" in the File I/O section is already streaming, but the
+functional section builds every intermediate result as a list:
+`list(map(...))`, `list(filter(...))`. For a log bigger than RAM that cannot
+work. Here every stage is a generator, so only the items in flight exist:
+
+    from cheatsheet import streams
+
+    errors = (streams.source("app.log")
+              | streams.map(str.rstrip)
+              | streams.filter(lambda line: "ERROR" in line)
+              | streams.take(100))
+    first_errors = errors | streams.collect()
+    print(errors.format_timings())
+
+`|` with a stage returns a new Pipeline; `|` with a sink runs it. Stopping
+early (take(), first(), or breaking out of `for item in pipeline`) closes every
+stage, so the source file is closed straight away. Each stage records how many
+items it produced and the time spent in its own code, excluding upstream
+stages; pass `timed=False` to source() to skip the clock reads when only the
+result matters.
+
+Files are read and written through the current storage (see
+cheatsheet.storage).
+
+`map` and `filter` here shadow the builtins on purpose; use them through the
+module (`streams.map`) rather than importing them by name.
+"""
+
+import builtins
+import functools
+import itertools
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from cheatsheet.storage import get_storage
+
+if TYPE_CHECKING:
+    from cheatsheet.bench import Suite
+
+
+@dataclass
+class StageTiming:
+    name: str
+    items: int = 0
+    inclusive: float = 0.0  # Seconds in this stage and everything upstream of it
+    self_time: float = 0.0  # Seconds in this stage alone
+
+
+class Stage:
+    """A named step that turns one iterator into another."""
+
+    def __init__(self, name: str, apply: Callable[[Iterator[Any]], Iterator[Any]]) -> None:
+        self.name = name
+        self.apply = apply
+
+
+class Sink:
+    """The final step: consumes the stream and returns a value."""
+
+    def __init__(self, name: str, consume: Callable[[Iterator[Any]], Any]) -> None:
+        self.name = name
+        self.consume = consume
+
+
+def _timed(iterator: Iterator[Any], timing: StageTiming) -> Iterator[Any]:
+    """Pass items through, adding the time each next() took to `timing`."""
+    clock = time.perf_counter
+    next_item = iterator.__next__
+    while True:
+        began = clock()
+        try:
+            item = next_item()
+        except StopIteration:
+            timing.inclusive += clock() - began
+            return
+        timing.inclusive += clock() - began
+        timing.items += 1
+        yield item
+
+
+class Pipeline:
+    """A source plus stages; iterate it, or pipe it into a sink to run it."""
+
+    def __init__(self, source: Iterable[Any] | Callable[[], Iterable[Any]], name: str = "source",
+                 stages: tuple[Stage, ...] = (), timed: bool = True) -> None:
+        self.source = source
+        self.name = name
+        self.stages = stages
+        self.timed = timed  # Timing costs two clock reads per item per stage
+        self.timings: list[StageTiming] = []
+        self.total_time = 0.0
+
+    def __or__(self, step: Stage | Sink) -> Any:
+        if isinstance(step, Stage):
+            return Pipeline(self.source, self.name, self.stages + (step,), self.timed)
+        if isinstance(step, Sink):
+            return self.run(step)
+        return NotImplemented
+
+    def _open(self) -> tuple[list[Iterator[Any]], Iterator[Any]]:
+        """Chain the stages; return every generator (for closing) and the last one."""
+        self.timings = [StageTiming(self.name)] + [StageTiming(stage.name) for stage in self.stages]
+        source = self.source() if callable(self.source) else self.source
+        stream = iter(source)
+        opened = [stream]
+        if self.timed:
+            stream = _timed(stream, self.timings[0])
+        for stage, timing in zip(self.stages, self.timings[1:]):
+            stream = iter(stage.apply(stream))
+            opened.append(stream)
+            if self.timed:
+                stream = _timed(stream, timing)
+        return opened, stream
+
+    @staticmethod
+    def _close(opened: list[Iterator[Any]]) -> None:
+        # Close downstream first so each stage's cleanup runs in order
+        for stream in reversed(opened):
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    def _finish(self) -> None:
+        if not self.timed:
+            self.timings = []
+            return
+        upstream = 0.0
+        for timing in self.timings:
+            timing.self_time = max(0.0, timing.inclusive - upstream)
+            upstream = timing.inclusive
+
+    def __iter__(self) -> Iterator[Any]:
+        opened, stream = self._open()
+        began = time.perf_counter()
+        try:
+            yield from stream
+        finally:
+            self._close(opened)
+            self.total_time = time.perf_counter() - began
+            self._finish()
+
+    def run(self, sink: Sink) -> Any:
+        opened, stream = self._open()
+        began = time.perf_counter()
+        try:
+            return sink.consume(stream)
+        finally:
+            self._close(opened)
+            self.total_time = time.perf_counter() - began
+            self._finish()
+            if self.timed:
+                self.timings.append(StageTiming(sink.name, self.timings[-1].items, self.total_time,
+                                                max(0.0, self.total_time - self.timings[-1].inclusive)))
+
+    def format_timings(self) -> str:
+        """Items and self time per stage of the last run."""
+        if not self.timings:
+            return "no timings (pipeline not run, or run with timed=False)"
+        lines = [f"{'stage':<24} {'items':>10} {'self ms':>10}"]
+        for timing in self.timings:
+            lines.append(f"{timing.name:<24} {timing.items:>10} {timing.self_time * 1000:>10.2f}")
+        lines.append(f"{'total':<24} {'':>10} {self.total_time * 1000:>10.2f}")
+        return "\n".join(lines)
+
+
+# Sources
+
+def source(path_or_iterable: str | os.PathLike | Iterable[Any], encoding: str = "utf-8", *,
+           timed: bool = True) -> Pipeline:
+    """Lines of a text file (newlines kept), or the items of an iterable."""
+    if isinstance(path_or_iterable, (str, os.PathLike)):
+        path = os.fspath(path_or_iterable)
+        return Pipeline(functools.partial(_read_lines, path, encoding), f"source({os.path.basename(path)})",
+                        timed=timed)
+    return Pipeline(path_or_iterable, timed=timed)
+
+
+def _read_lines(path: str, encoding: str) -> Iterator[str]:
+    with get_storage().open(path, encoding=encoding) as file:
+        yield from file
+
+
+# Stages
+
+def map(func: Callable[[Any], Any], name: str | None = None) -> Stage:
+    return Stage(name or f"map({_name(func)})", lambda stream: builtins.map(func, stream))
+
+
+def filter(predicate: Callable[[Any], bool], name: str | None = None) -> Stage:
+    return Stage(name or f"filter({_name(predicate)})", lambda stream: builtins.filter(predicate, stream))
+
+
+def batch(size: int) -> Stage:
+    """Group items into lists of `size` (the last one may be shorter)."""
+    if size < 1:
+        raise ValueError("batch size must be positive")
+
+    def apply(stream: Iterator[Any]) -> Iterator[list[Any]]:
+        while chunk := list(itertools.islice(stream, size)):
+            yield chunk
+
+    return Stage(f"batch({size})", apply)
+
+
+def take(n: int) -> Stage:
+    """Stop after `n` items; upstream stages are not asked for more."""
+    return Stage(f"take({n})", lambda stream: itertools.islice(stream, n))
+
+
+def flatten() -> Stage:
+    """Undo batch(): yield the items of each incoming iterable."""
+    return Stage("flatten", itertools.chain.from_iterable)
+
+
+def _name(func: Callable[..., Any]) -> str:
+    return getattr(func, "__qualname__", None) or type(func).__name__
+
+
+# Sinks
+
+def collect() -> Sink:
+    return Sink("collect", list)
+
+
+def count() -> Sink:
+    return Sink("count", lambda stream: sum(1 for _ in stream))
+
+
+def first() -> Sink:
+    """The first item, or None; stops the pipeline immediately."""
+    return Sink("first", lambda stream: next(stream, None))
+
+
+def reduce(func: Callable[[Any, Any], Any], initial: Any) -> Sink:
+    return Sink(f"reduce({_name(func)})", lambda stream: functools.reduce(func, stream, initial))
+
+
+def each(func: Callable[[Any], Any]) -> Sink:
+    """Call `func` on every item (printing, sending, ...); returns the count."""
+    def consume(stream: Iterator[Any]) -> int:
+        n = 0
+        for item in stream:
+            func(item)
+            n += 1
+        return n
+
+    return Sink(f"each({_name(func)})", consume)
+
+
+def write_lines(path: str | os.PathLike, encoding: str = "utf-8") -> Sink:
+    """Write string items (or batches of them) to `path`; returns the count."""
+    def consume(stream: Iterator[Any]) -> int:
+        n = 0
+        with get_storage().open(path, "w", encoding=encoding) as file:
+            for item in stream:
+                if isinstance(item, str):
+                    file.write(item)
+                    n += 1
+                else:
+                    file.writelines(item)  # A batch goes out in one call
+                    n += len(item)
+        return n
+
+    return Sink("write_lines", consume)
+
+
+def _levels_with_lists(path: str) -> int:
+    """The list-building equivalent: whole file, then map, then filter."""
+    with open(path) as file:
+        lines = file.readlines()
+    stripped = list(builtins.map(str.rstrip, lines))
+    return len(list(builtins.filter(lambda line: "ERROR" in line, stripped)))
+
+
+def _levels_with_pipeline(path: str, timed: bool) -> int:
+    return (source(path, timed=timed) | map(str.rstrip) | filter(lambda line: "ERROR" in line)) | count()
+
+
+def _first_error(path: str) -> str | None:
+    return (source(path) | map(str.rstrip) | filter(lambda line: "ERROR" in line)) | first()
+
+
+def add_benchmarks(suite: "Suite") -> None:
+    """Filter a 100k-line log with lists, with the pipeline, and stopping early."""
+    def setup() -> str:
+        path = os.path.join(tempfile.mkdtemp(prefix="cheatsheet-streams-"), "app.log")
+        with open(path, "w") as file:
+            for i in range(100_000):
+                level = "ERROR" if i % 50 == 49 else "INFO"
+                file.write(f"2025-01-01T00:00:{i % 60:02d} {level} request {i} handled\n")
+        return path
+
+    path = suite.fixture(setup, lambda path: shutil.rmtree(os.path.dirname(path), ignore_errors=True))
+    suite.add("lists: readlines/map/filter (100k lines)", _levels_with_lists, path, group="streams")
+    suite.add("pipeline: source|map|filter|count (100k)", _levels_with_pipeline, path, False, group="streams")
+    suite.add("same pipeline, timed per stage (100k)", _levels_with_pipeline, path, True, group="streams")
+    suite.add("pipeline: first ERROR (early stop)", _first_error, path, group="streams")
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from cheatsheet.async_files import AsyncFileManager
+from cheatsheet.storage import MemoryStorage
+
+TEXT = "line1\nline2\nline3\n"
+
+
+def read_back(steps, chunk_size=4):
+    """Run readline()/read(size) steps against TEXT and return what each step got."""
+    storage = MemoryStorage()
+    storage.write_bytes("example.txt", TEXT.encode())
+
+    async def run():
+        async with AsyncFileManager("example.txt", chunk_size=chunk_size, storage=storage) as file:
+            return [await (file.readline() if step == "line" else file.read(step)) for step in steps]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 64])
+def test_read_after_readline_returns_the_rest(chunk_size):
+    assert read_back(["line", -1, "line"], chunk_size) == ["line1\n", "line2\nline3\n", ""]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 64])
+def test_sized_reads_and_readline_interleave(chunk_size):
+    got = read_back(["line", 3, "line", 2, 100, -1], chunk_size)
+    assert got == ["line1\n", "lin", "e2\n", "li", "ne3\n", ""]
+    assert "".join(got) == TEXT
+
+
+def test_readline_reuses_one_line_iterator():
+    storage = MemoryStorage()
+    storage.write_bytes("example.txt", TEXT.encode())
+
+    async def run():
+        async with AsyncFileManager("example.txt", chunk_size=4, storage=storage) as file:
+            first = await file.readline()
+            iterator = file._line_iter
+            lines = [first, await file.readline()]
+            assert file._line_iter is iterator
+            async for line in file:
+                lines.append(line)
+            return lines + [await file.readline()]
+
+    assert asyncio.run(run()) == TEXT.splitlines(keepends=True) + [""]
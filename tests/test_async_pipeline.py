@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from cheatsheet.async_pipeline import AsyncPipeline, run_pipeline
+
+
+async def async_worker(name, delay):
+    """The tutorial's worker, without the prints."""
+    await asyncio.sleep(delay)
+    return f"{name} result"
+
+
+def test_ordered_results_match_gather():
+    jobs = [(f"job-{i}", (i % 3) * 0.002) for i in range(40)]
+
+    async def run():
+        expected = await asyncio.gather(*(async_worker(*job) for job in jobs))
+        async with AsyncPipeline(async_worker, concurrency=4, ordered=True) as pipe:
+            got = [result.unwrap() async for result in pipe.starmap(jobs)]
+        return expected, got, pipe.stats
+
+    expected, got, stats = asyncio.run(run())
+    assert got == expected
+    assert stats.completed == stats.submitted == len(jobs) and stats.in_flight == 0
+
+
+@pytest.mark.parametrize("concurrency, max_pending", [(1, 1), (3, 5), (8, None)])
+def test_concurrency_and_window_are_bounded(concurrency, max_pending):
+    running = peak = 0
+
+    async def worker(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return i
+
+    async def run():
+        async with AsyncPipeline(worker, concurrency=concurrency, max_pending=max_pending) as pipe:
+            window = pipe.max_pending
+            values = []
+            async for result in pipe.map(range(50)):
+                assert pipe.stats.in_flight <= window
+                values.append(result.value)
+        return values
+
+    assert sorted(asyncio.run(run())) == list(range(50))
+    assert peak == concurrency
+
+
+def test_failures_and_timeouts_become_results():
+    async def worker(i):
+        if i == 1:
+            raise KeyError(i)
+        await asyncio.sleep(1 if i == 2 else 0)
+        return i
+
+    results = asyncio.run(run_pipeline(worker, range(4), timeout=0.05, ordered=True))
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, KeyError) and isinstance(results[2].error, TimeoutError)
+    with pytest.raises(KeyError):
+        results[1].unwrap()
+
+
+def test_put_after_close_raises():
+    async def run():
+        async with AsyncPipeline(async_worker) as pipe:
+            await pipe.close()
+            with pytest.raises(RuntimeError):
+                await pipe.put(("late", 0))
+            assert [result async for result in pipe.results()] == []
+
+    asyncio.run(run())
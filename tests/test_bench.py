@@ -0,0 +1,26 @@
+from cheatsheet.bench import Suite
+
+
+def test_fixture_is_built_only_for_selected_benchmarks():
+    built, cleaned = [], []
+
+    def setup():
+        built.append(1)
+        return [1, 2, 3]
+
+    with Suite() as suite:
+        data = suite.fixture(setup, cleaned.append)
+        suite.add("sum", sum, data, group="uses-fixture")
+        suite.add("len", len, "abc", group="plain")
+        suite.run("plain", repeats=1, min_time=0.001)
+        assert built == []
+        suite.run("uses-fixture", repeats=2, min_time=0.001)
+        assert built == [1]
+    assert cleaned == [[1, 2, 3]]
+
+
+def test_unbuilt_fixture_is_not_cleaned_up():
+    cleaned = []
+    with Suite() as suite:
+        suite.fixture(list, cleaned.append)
+    assert cleaned == []
@@ -0,0 +1,61 @@
+import gzip
+import subprocess
+import sys
+
+import pytest
+
+from cheatsheet.compressed import open_file, parallel_decompress, write_members
+from cheatsheet.storage import DiskStorage, MemoryStorage
+
+
+class CountingStorage(DiskStorage):
+    def __init__(self) -> None:
+        self.opened = 0
+
+    def open(self, *args, **kwargs):
+        self.opened += 1
+        return super().open(*args, **kwargs)
+
+
+@pytest.mark.parametrize("codec", ["gzip", "bz2", "xz", None])
+def test_auto_read_opens_the_file_once(codec, tmp_path):
+    path = str(tmp_path / "events.log")
+    with open_file(path, "w", codec=codec) as file:
+        file.write("one\ntwo\n")
+    storage = CountingStorage()
+    with open_file(path, storage=storage) as file:
+        assert file.readlines() == ["one\n", "two\n"]
+    assert storage.opened == 1
+    with open_file(path, "rb") as file:
+        assert file.read() == b"one\ntwo\n"
+
+
+def test_auto_read_matches_open_for_plain_and_missing_files(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_text("héllo\n", encoding="utf-8")
+    with open_file(path, encoding="utf-8") as file, open(path, encoding="utf-8") as plain:
+        assert file.read() == plain.read()
+    with pytest.raises(FileNotFoundError):
+        open_file(tmp_path / "missing.gz")
+
+
+def test_auto_read_from_memory():
+    with MemoryStorage() as storage:
+        with storage.open("/data/events.gz", "wb") as file:
+            file.write(gzip.compress(b"a\nb\n"))
+        with open_file("/data/events.gz", storage=storage) as file:
+            assert list(file) == ["a\n", "b\n"]
+
+
+def test_members_decompress_like_gzip(tmp_path):
+    chunks = [bytes([i]) * 5000 for i in range(8)]
+    path = str(tmp_path / "members.gz")
+    assert write_members(path, chunks, "gzip", workers=2) == 8
+    with gzip.open(path) as file:
+        assert parallel_decompress(path, workers=2) == file.read() == b"".join(chunks)
+
+
+def test_import_leaves_the_thread_pools_unloaded():
+    code = "import sys, cheatsheet.compressed; print('concurrent.futures' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
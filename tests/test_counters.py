@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from cheatsheet.counters import COUNTERS, ShardedCounter, StripedCounter, hammer
+
+
+@pytest.mark.parametrize("threads", [2, 8, 32])
+def test_striped_counter_gives_each_thread_its_own_stripe(threads):
+    counter = StripedCounter(stripes=threads)
+    barrier = threading.Barrier(threads)  # All threads alive at once, so idents are distinct
+    stripes = []
+
+    def work():
+        barrier.wait()
+        counter.add(1)
+        stripes.append(counter._stripe())
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sorted(stripes) == list(range(threads))
+    assert counter.value() == threads
+
+
+@pytest.mark.parametrize("name", list(COUNTERS))
+def test_counters_are_exact(name):
+    hammer(COUNTERS[name](), threads=8, increments=2_000)
+
+
+def test_sharded_counter_flushes_periodically():
+    counter = ShardedCounter(flush_every=100)
+    seen = []
+
+    def work():
+        for _ in range(250):
+            counter.add(1)
+        seen.append(counter._flushed)  # Read before the thread exits and retires its shard
+
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    assert seen == [200]
+    assert counter.value() == 250
+
+
+def test_sharded_counter_without_periodic_flush():
+    counter = ShardedCounter(flush_every=None)
+    for _ in range(50_000):
+        counter.add(1)
+    assert counter._flushed == 0
+    assert counter.value() == 50_000
+    with pytest.raises(ValueError):
+        ShardedCounter(flush_every=0)
@@ -0,0 +1,70 @@
+import pytest
+
+from cheatsheet.dispatch import TypeDispatcher, shape_describer
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Circle:
+    def __init__(self, center, radius):
+        self.center = center
+        self.radius = radius
+
+
+class Rectangle:
+    def __init__(self, top_left, bottom_right):
+        self.top_left = top_left
+        self.bottom_right = bottom_right
+
+
+class Pixel(Point):
+    pass
+
+
+def describe_shape(shape):
+    """The 3.10 section's match statement."""
+    match shape:
+        case Point(x=0, y=0):
+            return "Point at origin"
+        case Point(x=x, y=y):
+            return f"Point at ({x}, {y})"
+        case Circle(center=Point(x=0, y=0), radius=r):
+            return f"Circle at origin with radius {r}"
+        case Circle():
+            return f"Circle at ({shape.center.x}, {shape.center.y}) with radius {shape.radius}"
+        case Rectangle(top_left=Point(x=x1, y=y1), bottom_right=Point(x=x2, y=y2)):
+            return f"Rectangle from ({x1}, {y1}) to ({x2}, {y2})"
+        case _:
+            return "Unknown shape"
+
+
+SHAPES = [
+    Point(0, 0), Point(0.0, 0), Point(1, 2), Pixel(0, 0), Pixel(3, 4),
+    Circle(Point(0, 0), 5), Circle(Point(1, 0), 2), Circle(Pixel(0, 0), 1),
+    Rectangle(Point(0, 0), Point(2, 3)), Rectangle(Point(0, 0), "corner"), "not a shape", None, 42,
+]
+
+
+def test_matches_the_match_statement():
+    describe = shape_describer(Point, Circle, Rectangle)
+    expected = [describe_shape(shape) for shape in SHAPES]
+    assert [describe(shape) for shape in SHAPES] == expected
+    assert describe.describe_many(SHAPES * 3) == expected * 3
+    assert describe.describe_many(iter([Point(1, 1)] * 2)) == ["Point at (1, 1)"] * 2
+
+
+def test_register_after_use_clears_the_cache():
+    describe = TypeDispatcher()
+    describe.register(Point, lambda p: "any point")
+    assert describe(Point(0, 0)) == "any point"
+    describe.register(Pixel, lambda p: "pixel")
+    assert describe(Pixel(0, 0)) == "any point"  # Earlier unconditional case still wins
+    describe = TypeDispatcher()
+    describe.case(Pixel)(lambda p: "pixel")
+    assert describe(Pixel(0, 0)) == "pixel"
+    with pytest.raises(TypeError):
+        describe(Point(0, 0))
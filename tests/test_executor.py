@@ -0,0 +1,54 @@
+from cheatsheet.executor import AdaptiveExecutor, RuntimeProbe, cgroup_cpu_quota
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_cgroup_v2_nested_path(tmp_path):
+    root = tmp_path / "cgroup"
+    _write(root / "cpu.max", "max 100000\n")
+    _write(root / "system.slice" / "cpu.max", "400000 100000\n")
+    _write(root / "system.slice" / "app.service" / "cpu.max", "150000 100000\n")
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text("0::/system.slice/app.service\n")
+    assert cgroup_cpu_quota(root, proc) == 1.5
+
+
+def test_cgroup_v2_limit_on_an_ancestor(tmp_path):
+    root = tmp_path / "cgroup"
+    _write(root / "kubepods" / "cpu.max", "200000 100000\n")
+    _write(root / "kubepods" / "pod1" / "cpu.max", "max 100000\n")
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text("0::/kubepods/pod1\n")
+    assert cgroup_cpu_quota(root, proc) == 2.0
+
+
+def test_cgroup_v1_nested_path(tmp_path):
+    root = tmp_path / "cgroup"
+    directory = root / "cpu,cpuacct" / "docker" / "abc"
+    _write(directory / "cpu.cfs_quota_us", "50000\n")
+    _write(directory / "cpu.cfs_period_us", "100000\n")
+    _write(root / "cpu,cpuacct" / "cpu.cfs_quota_us", "-1\n")
+    _write(root / "cpu,cpuacct" / "cpu.cfs_period_us", "100000\n")
+    proc = tmp_path / "proc-cgroup"
+    proc.write_text("12:memory:/docker/abc\n4:cpu,cpuacct:/docker/abc\n")
+    assert cgroup_cpu_quota(root, proc) == 0.5
+
+
+def test_cgroup_unlimited_or_missing(tmp_path):
+    root = tmp_path / "cgroup"
+    _write(root / "cpu.max", "max 100000\n")
+    assert cgroup_cpu_quota(root, tmp_path / "missing") is None
+    assert cgroup_cpu_quota(tmp_path / "nothing", tmp_path / "missing") is None
+
+
+def test_cpu_threads_sized_to_usable_cpus_without_gil():
+    runtime = RuntimeProbe(gil_enabled=False, free_threaded_build=True, cpu_count=8, cpu_quota=3.0)
+    with AdaptiveExecutor(runtime=runtime) as executor:
+        assert executor.backend_for(abs, "cpu") == "thread"
+        assert executor.map(abs, [-1, -2], kind="cpu") == [1, 2]
+        assert executor._threads["cpu"]._max_workers == 3
+        executor.map(abs, [-1], kind="io")
+        assert executor._threads["io"]._max_workers == 16
@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from cheatsheet.factorial import LEAF_SIZE, METHODS, FactorialEngine, factorial_swing, primes_up_to
+
+
+def factorial(n):
+    """The tutorial's recursive factorial."""
+    if n <= 1:
+        return 1
+    return n * factorial(n - 1)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_matches_the_tutorial_recursion(method):
+    engine = FactorialEngine(method=method)
+    assert [engine.factorial(n) for n in range(300)] == [factorial(n) for n in range(300)]
+
+
+def test_cache_reuse_is_exact_and_bounded():
+    engine = FactorialEngine(cache_size=4)
+    for n in (500, 520, 900, 510, 2000, 1999, 30, 505):
+        assert engine.factorial(n) == math.factorial(n), n
+    assert len(engine._cache) == len(engine._keys) == 4
+    assert engine._keys == sorted(engine._keys)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 100, 1000, 5000])
+def test_swing_and_primes(n):
+    assert factorial_swing(n) == math.factorial(n)
+    assert primes_up_to(n) == [p for p in range(2, n + 1) if all(p % d for d in range(2, math.isqrt(p) + 1))]
+
+
+@pytest.mark.parametrize("n, k", [(0, 0), (5, -1), (5, 6), (10, 3), (60, 30), (3000, 7), (3000, LEAF_SIZE * 8),
+                                  (3000, 1400)])
+def test_binomial_matches_math_comb(n, k):
+    expected = math.comb(n, k) if 0 <= k <= n else 0
+    assert FactorialEngine().binomial(n, k) == expected
+
+
+def test_multinomial_and_negative_input():
+    engine = FactorialEngine()
+    assert engine.multinomial(2, 3, 4) == factorial(9) // (factorial(2) * factorial(3) * factorial(4))
+    with pytest.raises(ValueError):
+        engine.factorial(-1)
+    with pytest.raises(ValueError):
+        engine.multinomial(2, -1)
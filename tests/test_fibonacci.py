@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from cheatsheet.fibonacci import STEP_LIMIT, fib_fast, fib_iterative, fib_many, fib_memo, fib_pair
+
+
+def fibonacci_jit_demo(n):
+    """The tutorial's exponential recursion."""
+    if n <= 1:
+        return n
+    return fibonacci_jit_demo(n - 1) + fibonacci_jit_demo(n - 2)
+
+
+@pytest.mark.parametrize("fib", [fib_memo, fib_iterative, fib_fast])
+def test_matches_the_tutorial_recursion(fib):
+    assert [fib(n) for n in range(25)] == [fibonacci_jit_demo(n) for n in range(25)]
+
+
+@pytest.mark.parametrize("n", [100, 1000, 4097])
+def test_fast_paths_agree_on_large_indices(n):
+    expected = fib_iterative(n)
+    assert fib_memo(n) == fib_fast(n) == expected
+    assert fib_pair(n) == (expected, fib_iterative(n + 1))
+
+
+def test_many_keeps_order_and_duplicates():
+    rng = random.Random(5)
+    indices = [rng.randrange(3 * STEP_LIMIT) for _ in range(50)] + [5000, 0, 5000, STEP_LIMIT + 1]
+    assert fib_many(indices) == [fib_iterative(n) for n in indices]
+    assert fib_many([]) == []
+
+
+@pytest.mark.parametrize("fib", [fib_memo, fib_iterative, fib_fast, lambda n: fib_many([n])])
+def test_negative_index_raises(fib):
+    with pytest.raises(ValueError):
+        fib(-1)
@@ -0,0 +1,24 @@
+import operator
+import re
+
+import pytest
+
+from cheatsheet.file_chunks import Grep, process_file
+
+LINES = [b"ERROR disk full", b"INFO ERROR seen in payload", b"WARN retrying", b"INFO done ERROR", b"ERROR", b""]
+
+
+@pytest.mark.parametrize("pattern", [rb"^ERROR", rb"ERROR$", rb"^INFO .*ERROR$", rb"^$", rb"^WARN"])
+def test_anchors_match_at_every_line_of_a_block(pattern):
+    block = b"\n".join(LINES) + b"\n"
+    expected = [line for line in LINES if re.search(pattern, line)]
+    assert Grep(pattern)(block) == expected
+    assert Grep(pattern, count_only=True)(block) == len(expected)
+
+
+def test_anchored_grep_over_small_blocks(tmp_path):
+    path = tmp_path / "app.log"
+    lines = [b"ERROR %d" % i if i % 3 == 0 else b"INFO %d ERROR" % i for i in range(500)]
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    report = process_file(path, Grep(rb"^ERROR \d+$"), operator.add, [], backend="serial", block_size=64)
+    assert report.value == lines[::3]
@@ -0,0 +1,39 @@
+import pytest
+
+from cheatsheet.file_session import FileSession, open_per_operation, single_session
+from cheatsheet.storage import MemoryStorage
+
+LINES = [f"Line {i}: Python is awesome!\n" for i in range(3)]
+
+
+def test_session_matches_open_per_operation(tmp_path):
+    path = str(tmp_path / "example.txt")
+    assert single_session(path, LINES) == open_per_operation(path, LINES)
+
+
+def test_writes_during_lines_do_not_cut_the_iteration(tmp_path):
+    with FileSession(tmp_path / "example.txt", "w", buffer_size=1) as session:
+        session.writelines(["a\n", "b\r\n", "c\rd"])
+        seen = []
+        for line in session.lines():
+            seen.append(line)
+            session.write("more\n")  # Flushed at once: buffer_size=1
+        assert seen == ["a\n", "b\r\n", "c\r", "d"]
+        assert session.read().count("more\n") == 4
+
+
+@pytest.mark.parametrize("buffer_size", [1, 10, 1 << 20])
+def test_fsync_interval_holds_with_a_large_buffer(tmp_path, buffer_size):
+    with FileSession(tmp_path / "example.txt", "w", buffer_size=buffer_size, fsync=10) as session:
+        for _ in range(5):
+            session.write("12345")
+        assert session.stats.fsyncs == 2
+        assert session._unsynced + session._pending_size == 5
+
+
+def test_memory_session_never_syncs():
+    with MemoryStorage() as storage:
+        with FileSession("/example.txt", "w", fsync=1, storage=storage) as session:
+            session.writelines(LINES)
+            assert list(session.lines()) == LINES
+        assert session.stats.fsyncs == 0
@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from cheatsheet.json_stream import dump, iter_array
+
+
+def dumped(obj):
+    out = io.StringIO()
+    streamed = dump(obj, out, buffer_size=8)
+    return json.loads(out.getvalue()), streamed
+
+
+def test_streams_nested_at_any_depth():
+    document, streamed = dumped({"a": {"b": (i for i in range(3))}, "c": [{"d": map(str, range(2))}, 1]})
+    assert document == {"a": {"b": [0, 1, 2]}, "c": [{"d": ["0", "1"]}, 1]}
+    assert streamed == 5
+
+
+def test_nested_streams_of_streams():
+    document, _ = dumped((((j for j in range(i)) for i in range(3))))
+    assert document == [[], [0], [0, 1]]
+
+
+@pytest.mark.parametrize("key", [True, False, None, 1, -2, 1.5, 1e100, float("inf"), "x"])
+def test_keys_are_written_like_json(key):
+    out = io.StringIO()
+    dump({key: iter([1])}, out)
+    assert out.getvalue() == json.dumps({key: [1]}, separators=(",", ":"))
+
+
+def test_unsupported_key_raises_like_json():
+    with pytest.raises(TypeError):
+        json.dumps({(1, 2): 1})
+    with pytest.raises(TypeError):
+        dump({(1, 2): iter([1])}, io.StringIO())
+
+
+def test_round_trip_through_iter_array():
+    out = io.StringIO()
+    dump({"version": "3.14", "meta": {"records": (r for r in [{"id": 1}, {"id": 2}])}}, out)
+    out.seek(0)
+    assert list(iter_array(out, ("meta", "records"), chunk_size=4)) == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize("value", [{1, 2}, frozenset([1]), range(3), b"x"])
+def test_non_iterator_iterables_raise_like_json(value):
+    with pytest.raises(TypeError):
+        json.dumps({"s": value})
+    with pytest.raises(TypeError):
+        dump({"s": value}, io.StringIO())
+    with pytest.raises(TypeError):
+        dump({"s": value, "t": iter([1])}, io.StringIO())
+
+
+@pytest.mark.parametrize("text", ["{}", '{"other": []}', '{"a": 1, "b": {}}'])
+def test_missing_path_raises_key_error(text):
+    with pytest.raises(KeyError):
+        list(iter_array(io.StringIO(text), ("records",)))
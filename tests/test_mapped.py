@@ -0,0 +1,35 @@
+import pytest
+
+from cheatsheet.mapped import MappedFile
+from cheatsheet.storage import DiskStorage, MemoryStorage
+
+TEXTS = ["", "one line without newline", "Line 1: Python is awesome!\nLine 2: naïve café ☕\n\nlast", "é" * 100 + "\n"]
+
+
+@pytest.mark.parametrize("backend", [DiskStorage, MemoryStorage])
+@pytest.mark.parametrize("text", TEXTS)
+def test_reads_like_the_tutorial_file_manager(backend, text, tmp_path):
+    path = str(tmp_path / "example.txt")
+    with backend() as storage:
+        storage.write_bytes(path, text.encode("utf-8"))
+        with storage.open(path, encoding="utf-8", newline="") as file:
+            content = file.read()
+        with storage.open(path, encoding="utf-8", newline="") as file:
+            lines = file.readlines()
+        with MappedFile(path, storage=storage) as mapped:
+            assert mapped.read() == content
+            for chars in (0, 1, 10, 65, 1000):
+                assert mapped.head(chars) == content[:chars]
+            assert [bytes(line).decode() for line in mapped.lines()] == lines
+            assert list(mapped.text_lines()) == [line.rstrip("\n") for line in lines]
+            assert mapped.count_lines(chunk_size=7) == len(lines)
+            assert len(mapped) == len(text.encode("utf-8"))
+
+
+def test_views_are_zero_copy(tmp_path):
+    path = tmp_path / "example.txt"
+    path.write_bytes(b"abc\ndef\n")
+    with MappedFile(path) as mapped:
+        line = next(mapped.lines())
+        assert isinstance(line, memoryview) and line.obj is mapped.view.obj
+        assert mapped[4:7].tobytes() == b"def" and mapped[0] == ord("a")
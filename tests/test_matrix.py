@@ -0,0 +1,60 @@
+import math
+import random
+from array import array
+
+import pytest
+
+from cheatsheet.compat import load_numpy
+from cheatsheet.matrix import TILE_SIZE, Matrix
+
+METHODS = ["ikj", "transposed", "tiled"] + (["numpy"] if load_numpy() is not None else [])
+
+SHAPES = [
+    (0, 0, 0), (0, 3, 2), (2, 0, 3), (3, 2, 0),
+    (1, 1, 1), (3, 5, 2), (7, 1, 9),
+    (TILE_SIZE + 3, TILE_SIZE - 1, 2 * TILE_SIZE + 5),
+]
+
+
+def matrix_multiply(a, b, n, m, p):
+    """The tutorial's triple loop, with explicit sizes so empty shapes work."""
+    result = [[0.0 for _ in range(p)] for _ in range(n)]
+    for i in range(n):
+        for j in range(p):
+            for k in range(m):
+                result[i][j] += a[i][k] * b[k][j]
+    return result
+
+
+def random_matrix(rows, cols, rng):
+    return Matrix(rows, cols, [rng.uniform(-10, 10) for _ in range(rows * cols)])
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("n, m, p", SHAPES)
+def test_methods_match_matrix_multiply(method, n, m, p):
+    rng = random.Random(n * 10_000 + m * 100 + p)
+    a, b = random_matrix(n, m, rng), random_matrix(m, p, rng)
+    expected = matrix_multiply(a.to_rows(), b.to_rows(), n, m, p)
+    result = a.matmul(b, method)
+    assert result.shape == (n, p)
+    assert result.isclose(Matrix(n, p, [x for row in expected for x in row]), abs_tol=1e-9)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_zeros_still_propagate_inf_and_nan(method):
+    a = Matrix.from_rows([[0.0, 1.0]])
+    b = Matrix.from_rows([[math.inf], [2.0]])
+    assert math.isnan(a.matmul(b, method)[0, 0])  # 0 * inf + 1 * 2, as in matrix_multiply
+
+
+def test_incompatible_shapes():
+    with pytest.raises(ValueError):
+        Matrix(2, 3).matmul(Matrix(2, 3))
+
+
+def test_data_is_copied():
+    data = array("d", [1.0, 2.0, 3.0, 4.0])
+    m = Matrix(2, 2, data)
+    data[0] = 99.0
+    assert m[0, 0] == 1.0
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from cheatsheet.pvector import WIDTH, PersistentVector
+
+
+def add_to_tuple(t, item):
+    """The functional section's copy-on-add."""
+    return t + (item,)
+
+
+# Tail boundaries and the points where the trie gains a level
+SIZES = [0, 1, WIDTH, WIDTH + 1, WIDTH * WIDTH + WIDTH, WIDTH * WIDTH + WIDTH + 1, WIDTH ** 3 + WIDTH + 1]
+
+
+def test_appends_match_add_to_tuple_and_keep_old_versions():
+    t, v = (), PersistentVector()
+    versions = []
+    for i in range(SIZES[-1]):
+        if i in SIZES:
+            versions.append((t if i <= WIDTH * WIDTH + WIDTH + 1 else tuple(range(i)), v))
+        if i <= WIDTH * WIDTH + WIDTH + 1:
+            t = add_to_tuple(t, i)  # Quadratic: only up to the second level
+        v = v.append(i)
+    versions.append((tuple(range(SIZES[-1])), v))
+    for expected, vector in versions:
+        assert vector.to_tuple() == expected and len(vector) == len(expected)
+        assert tuple(reversed(vector)) == expected[::-1]
+        if expected:
+            assert vector[0] == expected[0] and vector[-1] == expected[-1]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_from_iterable_set_and_slices(n):
+    items = tuple(range(n))
+    v = PersistentVector.from_iterable(items)
+    assert v == PersistentVector(iter(items)) and hash(v) == hash(items)
+    rng = random.Random(n)
+    for i in (rng.randrange(n) for _ in range(20)) if n else ():
+        w = v.set(i, "x")
+        assert w[i] == "x" and w.to_tuple() == items[:i] + ("x",) + items[i + 1:]
+        assert v.to_tuple() == items
+    for a, b, step in [(0, n, 1), (3, n - 5, 1), (n // 3, n // 2, 1), (1, n, 7), (n, 0, -3)]:
+        assert v[a:b:step].to_tuple() == items[a:b:step]
+    cut = v[2:n // 2]
+    assert cut.append("end").to_tuple() == items[2:n // 2] + ("end",)
+    assert v.to_tuple() == items
+    assert (v + [1, 2]).to_tuple() == items + (1, 2)
+    with pytest.raises(IndexError):
+        v[n]
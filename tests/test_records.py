@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from cheatsheet.records import PERSON, POINT, RecordFile, RecordWriter, Schema, load_records, write_records
+from cheatsheet.storage import MemoryStorage
+
+
+class Person:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+PEOPLE = [Person(name, age) for name, age in [("Alice", 30), ("Bob", 25), ("Zoë ☕", 41), ("", 0)]]
+POINTS = [Point(i * 0.5, -i * 1.25) for i in range(1000)]
+
+
+def via_json(objects, fields):
+    """The JSON round trip the tutorial's classes are limited to."""
+    return [tuple(d[f] for f in fields) for d in json.loads(json.dumps([vars(o) for o in objects]))]
+
+
+@pytest.mark.parametrize("schema, objects, factory", [(PERSON, PEOPLE, Person), (POINT, POINTS, Point)])
+def test_round_trip_matches_json(schema, objects, factory, tmp_path):
+    path = tmp_path / "records.rec"
+    assert write_records(path, schema, objects) == len(objects)
+    expected = via_json(objects, schema.names)
+    with RecordFile(path, schema) as records:
+        assert list(records) == expected
+        assert records[-1] == expected[-1] and records[1:3] == expected[1:3]
+        columns = records.columns()
+        assert [tuple(row) for row in zip(*(columns[name] for name in schema.names))] == expected
+    loaded = load_records(path, schema, factory)
+    assert [tuple(vars(o).values()) for o in loaded] == expected
+
+
+def test_appends_and_cuts_a_torn_record():
+    with MemoryStorage() as storage:
+        write_records("/p.rec", POINT, POINTS[:3], storage=storage)
+        storage.write_bytes("/p.rec", storage.read_bytes("/p.rec") + b"\x01\x02\x03")  # A crash mid-append
+        with RecordFile("/p.rec", POINT, storage=storage) as records:
+            assert len(records) == 3
+        with RecordWriter("/p.rec", POINT, storage=storage) as writer:
+            writer.append((9.0, 9.5))
+        with RecordFile("/p.rec", POINT, storage=storage) as records:
+            assert list(records) == via_json(POINTS[:3], "xy") + [(9.0, 9.5)]
+
+
+def test_schema_mismatch_and_oversized_text(tmp_path):
+    path = tmp_path / "people.rec"
+    write_records(path, PERSON, PEOPLE)
+    with pytest.raises(ValueError):
+        RecordFile(path, POINT)
+    with pytest.raises(ValueError):
+        RecordFile(path, Schema("Person", (("name", "32s"), ("age", "i")), version=2))
+    with RecordFile(path) as raw:
+        assert raw.schema_text == PERSON.describe() and len(raw) == len(PEOPLE)
+    with pytest.raises(ValueError):
+        PERSON.pack(Person("x" * 33, 1))
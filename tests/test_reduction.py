@@ -0,0 +1,37 @@
+import itertools
+
+import pytest
+
+from cheatsheet.reduction import Power, RangeReducer
+
+BOUNDS = (-40, -7, -1, 0, 1, 5, 33)
+
+
+@pytest.mark.parametrize("k", range(4))
+@pytest.mark.parametrize("initial", (0, 10, -3))
+def test_closed_form_matches_sum_over_negative_and_empty_ranges(k, initial):
+    closed = RangeReducer(Power(k), initial=initial)
+    for start, stop in itertools.product(BOUNDS, repeat=2):
+        report = closed.reduce(stop, start)
+        assert report.closed_form
+        assert report.value == sum(map(Power(k), range(start, stop)), initial), (start, stop)
+
+
+@pytest.mark.parametrize("start, stop", [(5, 2), (-3, 4), (0, 0)])
+def test_closed_form_agrees_with_chunks(start, stop):
+    chunked = RangeReducer(Power(2), initial=7, backend="serial", use_closed_form=False, chunk_size=3)
+    closed = RangeReducer(Power(2), initial=7)
+    assert closed.reduce(stop, start).value == chunked.reduce(stop, start).value
+
+
+def test_initial_counted_once_with_process_pool():
+    chunked = RangeReducer(Power(1), initial=100, chunk_size=4, workers=2, use_closed_form=False)
+    assert chunked.reduce(20, -5).value == sum(range(-5, 20), 100)
+
+
+@pytest.mark.parametrize("n", [0, 1])
+def test_summary_of_tiny_ranges(n):
+    report = RangeReducer(backend="serial", use_closed_form=False).reduce(n)
+    assert report.value == sum(map(Power(2), range(n)))
+    assert len(report.chunk_times) == n
+    assert report.summary().startswith("empty range" if n == 0 else "1 chunks")
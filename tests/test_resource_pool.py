@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from cheatsheet.resource_pool import AsyncPool
+
+
+class Counted:
+    """A resource that takes `delay` to open and records opens and closes."""
+
+    opened = 0
+    closed = 0
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        Counted.opened += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        Counted.closed += 1
+
+
+@pytest.fixture(autouse=True)
+def reset_counts():
+    Counted.opened = Counted.closed = 0
+
+
+def test_close_during_warm_up_leaks_nothing():
+    async def main():
+        pool = AsyncPool(Counted, min_size=3, max_size=5)
+        async with pool.acquire():
+            await pool.close()  # The warm-up is still opening the other two
+        return pool
+
+    pool = asyncio.run(main())
+    assert (pool.size, pool.idle) == (0, 0)
+    assert Counted.opened == Counted.closed == 1
+
+
+def test_close_after_warm_up_closes_everything():
+    async def main():
+        pool = AsyncPool(Counted, min_size=3, max_size=5)
+        async with pool.acquire():
+            await asyncio.sleep(0.05)
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(main())
+    assert (pool.size, pool.idle) == (0, 0)
+    assert Counted.opened == Counted.closed == 3
+
+
+def test_close_wakes_waiters():
+    async def main():
+        pool = AsyncPool(lambda: Counted(0), max_size=1)
+        async with pool.acquire():
+            waiter = asyncio.create_task(pool.acquire().__aenter__())
+            await asyncio.sleep(0.01)
+            await pool.close()
+            with pytest.raises(RuntimeError):
+                await waiter
+        return pool
+
+    pool = asyncio.run(main())
+    assert pool.size == 0
+    assert Counted.opened == Counted.closed == 1
@@ -0,0 +1,47 @@
+import heapq
+import math
+
+import pytest
+
+from cheatsheet.compat import load_numpy
+from cheatsheet.shapes import Circle, Rectangle, ShapeCollection, sample_shapes
+
+NUMPY = [False] + ([True] if load_numpy() is not None else [])
+SHAPES = sample_shapes(501) + [Rectangle(0, 4), Circle(0.0), Rectangle(2.5, 1e-3)]
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY)
+def test_matches_the_objects_own_methods(use_numpy):
+    collection = ShapeCollection.from_shapes(SHAPES, use_numpy=use_numpy)
+    assert len(collection) == len(SHAPES)
+    assert collection.values("area").tolist() == [shape.area() for shape in SHAPES]
+    assert collection.values("perimeter").tolist() == [shape.perimeter() for shape in SHAPES]
+    assert collection.total_area() == pytest.approx(math.fsum(shape.area() for shape in SHAPES), rel=1e-12)
+    assert collection.total_perimeter() == pytest.approx(math.fsum(s.perimeter() for s in SHAPES), rel=1e-12)
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY)
+@pytest.mark.parametrize("k", [0, 1, 7, len(SHAPES) + 5])
+def test_top_k_matches_nlargest(use_numpy, k):
+    collection = ShapeCollection.from_shapes(SHAPES, use_numpy=use_numpy)
+    expected = heapq.nlargest(k, ((shape.area(), i) for i, shape in enumerate(SHAPES)))
+    assert collection.top_k(k) == expected
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY)
+def test_filter_keeps_order_and_converts_back(use_numpy):
+    collection = ShapeCollection.from_shapes(SHAPES, use_numpy=use_numpy)
+    kept = collection.filter(min_area=20.0, max_perimeter=40.0)
+    expected = [shape for shape in SHAPES if shape.area() >= 20.0 and shape.perimeter() <= 40.0]
+    back = kept.to_shapes()
+    assert [type(shape) for shape in back] == [type(shape) for shape in expected]
+    assert [shape.area() for shape in back] == [shape.area() for shape in expected]
+    circles = collection.filter("circle")
+    assert len(circles) == sum(isinstance(shape, Circle) for shape in SHAPES) == circles.count("circle")
+
+
+def test_unknown_kind_raises():
+    with pytest.raises(TypeError):
+        ShapeCollection.from_shapes([object()])
+    with pytest.raises(ValueError):
+        ShapeCollection().add("circle", 1.0, 2.0)
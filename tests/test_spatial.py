@@ -0,0 +1,38 @@
+import random
+import time
+
+import pytest
+
+from cheatsheet.spatial import GridIndex, nearest_brute, random_points
+
+DEGENERATE = {
+    "vertical line": [(0.0, i * 0.01) for i in range(100)],
+    "horizontal line": [(i * 3.0, -1.0) for i in range(1000)],
+    "nearly collinear": [(i * 0.001, i * 1e-9) for i in range(2000)],
+    "diagonal": [(i * 0.5, i * 0.5) for i in range(500)],
+    "one spot": [(2.0, 2.0)] * 50,
+}
+
+
+@pytest.mark.parametrize("name", list(DEGENERATE))
+def test_degenerate_points_keep_the_grid_small_and_exact(name):
+    points = DEGENERATE[name]
+    index = GridIndex(points)
+    assert (index._max_cx + 1) * (index._max_cy + 1) <= 4 * len(points)
+    rng = random.Random(3)
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    began = time.perf_counter()
+    for _ in range(50):
+        center = (rng.uniform(min(xs) - 1, max(xs) + 1), rng.uniform(min(ys) - 1, max(ys) + 1))
+        nearest = index.nearest(center, k=3)
+        assert [d for d, _ in nearest] == [d for d, _ in nearest_brute(center, points, 3)]
+        inside = sorted(i for d, i in nearest_brute(center, points, len(points)) if d <= 0.5)
+        assert sorted(index.within(center, 0.5)) == inside
+    assert time.perf_counter() - began < 5.0
+
+
+def test_even_points_match_brute_force():
+    points = random_points(2000)
+    index = GridIndex(points)
+    for center in random_points(20, seed=9).to_tuples():
+        assert index.nearest(center, k=5) == nearest_brute(center, points, 5)
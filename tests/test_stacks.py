@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from cheatsheet.stacks import DequeStack, LockedStack, ShardedStack, Stack, hammer
+
+
+class TutorialStack:
+    """The 3.12 section's Stack[T]."""
+
+    def __init__(self):
+        self.items = []
+
+    def push(self, item):
+        self.items.append(item)
+
+    def pop(self):
+        return self.items.pop()
+
+
+@pytest.mark.parametrize("factory", [Stack, DequeStack, LockedStack, ShardedStack])
+def test_matches_one_call_per_item(factory):
+    stack, reference = factory(), TutorialStack()
+    stack.push_many(range(10))
+    for i in range(10):
+        reference.push(i)
+    stack.push(10)
+    reference.push(10)
+    assert stack.pop_many(4) == [reference.pop() for _ in range(4)]
+    assert stack.pop() == reference.pop()
+    assert stack.pop_many(100) == [reference.pop() for _ in range(len(reference.items))]
+    assert stack.pop_many(0) == stack.pop_many(-1) == [] and len(stack) == 0
+    with pytest.raises(IndexError):
+        stack.pop()
+
+
+def test_deque_stack_keeps_the_newest_items():
+    stack = DequeStack(range(3), maxlen=5)
+    stack.push_many(range(3, 10))
+    assert stack.maxlen == 5 and len(stack) == 5
+    assert stack.peek() == 9 and stack.pop_many(10) == [9, 8, 7, 6, 5]
+    with pytest.raises(IndexError):
+        stack.peek()
+
+
+def test_sharded_stack_steals_from_other_threads():
+    stack = ShardedStack()
+    worker = threading.Thread(target=stack.push_many, args=(range(5),))
+    worker.start()
+    worker.join()
+    stack.push(99)
+    assert stack.pop_many(3) == [99, 4, 3]
+    assert sorted(stack.pop_many(10)) == [0, 1, 2]
+    assert len(stack) == 0 and stack._shards == [stack._shard()]  # The dead thread's empty shard is dropped
+
+
+@pytest.mark.parametrize("factory", [LockedStack, ShardedStack])
+@pytest.mark.parametrize("batch", [1, 7])
+def test_threads_lose_and_duplicate_nothing(factory, batch):
+    hammer(factory(), threads=4, operations=2000, batch=batch)
@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from cheatsheet.storage import DiskStorage, MemoryStorage, SpooledStorage, round_trip
+
+TUTORIAL = Path(__file__).resolve().parent.parent / "python-cheat-sheet.py"
+FILE_SECTIONS = ("file-io", "decorators", "generators", "threading", "asyncio", "py314")
+
+
+@pytest.mark.parametrize("backend", [DiskStorage, MemoryStorage, lambda: SpooledStorage(16)])
+def test_round_trip_matches_the_disk(backend, tmp_path):
+    lines = [f"Line {i}: Python is awesome!\n" for i in range(3)]
+    with backend() as storage:
+        text = round_trip(storage, str(tmp_path / "example.txt"), lines)
+    assert text == "".join(lines) + "This line was appended.\n"
+
+
+# Runs the tutorial as a script (so multiprocessing can pickle its functions)
+# and prints every path opened in this process
+DRIVER = """
+import json, os, runpy, sys
+opened = []
+
+def audit(event, args):
+    if event == "open" and isinstance(args[0], (str, bytes)):
+        opened.append(os.path.abspath(os.fsdecode(args[0])))
+
+sys.addaudithook(audit)
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(sys.argv[0]))  # As `python python-cheat-sheet.py` would
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+finally:
+    print("OPENED " + json.dumps(opened[:]))
+"""
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="the tutorial uses Python 3.12 syntax")
+def test_sections_open_no_files_on_disk_with_memory_storage(tmp_path):
+    # Run from a temporary directory, so a relative example.txt on disk would show up too
+    result = subprocess.run([sys.executable, "-c", DRIVER, str(TUTORIAL), "--storage", "memory", *FILE_SECTIONS],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    assert "Skipped: worker processes" in result.stdout
+    opened = json.loads(result.stdout.rsplit("OPENED ", 1)[1])
+    temp_dir = os.path.realpath(tempfile.gettempdir())
+    # Lazy imports inside the sections open .py files; everything else is data
+    on_disk = [path for path in opened if not path.endswith((".py", ".pyc", ".so"))
+               and os.path.realpath(path).startswith(temp_dir + os.sep)]
+    assert on_disk == []
@@ -0,0 +1,57 @@
+import builtins
+
+import pytest
+
+from cheatsheet import streams
+from cheatsheet.storage import MemoryStorage, using
+
+LINES = [f"{'ERROR' if i % 7 == 0 else 'INFO'} request {i}\n" for i in range(100)]
+
+
+@pytest.mark.parametrize("timed", [True, False])
+def test_matches_the_list_building_version(timed, tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("".join(LINES))
+    # The functional section's style: every intermediate result is a list
+    expected = list(builtins.filter(lambda line: "ERROR" in line, list(builtins.map(str.rstrip, LINES))))
+    pipeline = streams.source(path, timed=timed) | streams.map(str.rstrip) | streams.filter(lambda s: "ERROR" in s)
+    assert pipeline | streams.collect() == expected
+    assert list(pipeline) == expected
+    assert pipeline | streams.count() == len(expected)
+    assert (pipeline | streams.first()) == expected[0]
+    assert bool(pipeline.timings) == timed
+
+
+def test_take_stops_upstream_and_closes_the_source():
+    pulled = []
+    closed = []
+
+    def numbers():
+        try:
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+        finally:
+            closed.append(True)
+
+    pipeline = streams.source(numbers) | streams.map(lambda x: x * 2) | streams.take(3)
+    assert pipeline | streams.collect() == [0, 2, 4]
+    assert pulled == [0, 1, 2] and closed == [True]
+    assert [row.items for row in pipeline.timings] == [3, 3, 3, 3]
+
+
+def test_batches_round_trip_through_write_lines():
+    with MemoryStorage() as storage, using(storage):
+        written = streams.source(LINES) | streams.batch(8) | streams.write_lines("/out.log")
+        assert written == len(LINES)
+        assert storage.read_bytes("/out.log").decode() == "".join(LINES)
+        assert streams.source("/out.log") | streams.batch(8) | streams.flatten() | streams.collect() == LINES
+    with pytest.raises(ValueError):
+        streams.batch(0)
+
+
+def test_reduce_and_each():
+    assert streams.source(range(10)) | streams.reduce(lambda a, b: a + b, 5) == sum(range(10), 5)
+    seen = []
+    assert streams.source("abc" for _ in range(1)) | streams.flatten() | streams.each(seen.append) == 3
+    assert seen == ["a", "b", "c"]